@@ -2,28 +2,77 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+import asyncio
+import os
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+from starlette.concurrency import run_in_threadpool
 
-from src.main.python.core.exception.handler.registers import value_error_handler, permission_error_handler
-from src.main.python.Infrastructure.config.database import create_db_and_tables
+from src.main.python.core.background.jobs import (
+    reconcile_feed_counts, flush_feed_views, check_replica_health, collect_image_garbage
+)
+from src.main.python.core.background.periodic import run_periodically
+from src.main.python.core.dependencies.database import get_replica_set
+from src.main.python.core.dependencies.feed_like import get_feed_like_pipeline
+from src.main.python.core.dependencies.profiling import get_request_profiler
+from src.main.python.core.dependencies.file import get_image_processing_pool, content_addressed_storage_enabled
+from src.main.python.core.exception.handler.registers import (
+    value_error_handler, permission_error_handler, image_processing_busy_error_handler, feed_like_pending_error_handler
+)
+from src.main.python.domain.model.feed.exceptions import FeedLikePendingError
+from src.main.python.domain.storage.exceptions import ImageProcessingBusyError
+from src.main.python.Infrastructure.config.database import ensure_schema, dispose_engines
+from src.main.python.Infrastructure.storage.image_variants import UPLOAD_MAX_BYTES
 from src.main.python.web.route.oauth_socials import auth_router
 from src.main.python.web.route.files import file_router
 from src.main.python.web.route.feed_likes import feed_like_router
 from src.main.python.web.route.feeds import feed_router
 from src.main.python.web.route.members import member_router
+from src.main.python.web.route.monitoring import monitoring_router
+from src.main.python.web.route.metrics import metrics_router
+from src.main.python.web.middleware.metrics import MetricsMiddleware
+from src.main.python.web.middleware.profiling import ProfilingMiddleware
+from src.main.python.web.middleware.query_stats import QueryStatsMiddleware
+from src.main.python.web.middleware.upload_limit import UploadLimitMiddleware
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    create_db_and_tables()
+    ensure_schema()
+    background_tasks = [
+        asyncio.create_task(run_periodically(float(os.getenv("FEED_COUNT_RECONCILE_INTERVAL", "60")), reconcile_feed_counts)),
+        asyncio.create_task(run_periodically(float(os.getenv("FEED_VIEW_FLUSH_INTERVAL", "5")), flush_feed_views)),
+    ]
+    if get_replica_set() is not None:
+        background_tasks.append(
+            asyncio.create_task(run_periodically(float(os.getenv("DB_REPLICA_HEALTH_INTERVAL", "10")), check_replica_health))
+        )
+    if content_addressed_storage_enabled():
+        background_tasks.append(
+            asyncio.create_task(run_periodically(float(os.getenv("FILE_GC_INTERVAL", "3600")), collect_image_garbage))
+        )
     yield
     # 앱 종료 시 실행 (자원정리 등)
+    for task in background_tasks:
+        task.cancel()
+    await run_in_threadpool(flush_feed_views)
+    if get_feed_like_pipeline() is not None:
+        await run_in_threadpool(get_feed_like_pipeline().stop)
+    await run_in_threadpool(get_image_processing_pool().shutdown)
+    await dispose_engines()
 
 
 app = FastAPI(lifespan=lifespan)
 
+# 프로파일링 설정이 없으면 미들웨어를 등록하지 않음 (요청 경로 오버헤드 없음)
+if get_request_profiler() is not None:
+    app.add_middleware(ProfilingMiddleware, profiler=get_request_profiler())
+app.add_middleware(UploadLimitMiddleware, max_body_bytes=UPLOAD_MAX_BYTES)
+app.add_middleware(QueryStatsMiddleware)
+app.add_middleware(MetricsMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -38,10 +87,16 @@ app.add_middleware(
         "Origin",
         "X-Requested-With"
     ],
+    expose_headers=[
+        "X-DB-Query-Count",
+        "X-DB-Query-Time-Ms"
+    ],
 )
 
 app.add_exception_handler(ValueError, value_error_handler)
 app.add_exception_handler(PermissionError, permission_error_handler)
+app.add_exception_handler(ImageProcessingBusyError, image_processing_busy_error_handler)
+app.add_exception_handler(FeedLikePendingError, feed_like_pending_error_handler)
 # app.add_exception_handler(FileNotFoundError, file_not_found_error_handler)
 
 app.include_router(member_router)
@@ -49,3 +104,8 @@ app.include_router(feed_router)
 app.include_router(feed_like_router)
 app.include_router(file_router)
 app.include_router(auth_router)
+app.include_router(monitoring_router)
+app.include_router(metrics_router)
+
+if get_request_profiler() is not None:
+    get_request_profiler().instrument_sync_endpoints(app.routes)
@@ -0,0 +1,36 @@
+import threading
+from typing import Dict
+
+
+class FeedViewBuffer:
+    """
+    피드 조회수 쓰기 지연(write-behind) 버퍼
+
+    - 상세 조회 시 DB 에 바로 쓰지 않고 feed_id 별 증가분만 메모리에 모읍니다.
+    - 백그라운드 작업이 drain() 으로 모인 값을 가져가 한 번의 UPDATE 로 반영합니다.
+    - 반영에 실패하면 restore() 로 증가분을 되돌려 다음 주기에 다시 시도합니다.
+    """
+
+    def __init__(self):
+        self._pending: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def add(self, feed_id: int, count: int = 1) -> int:
+        with self._lock:
+            pending = self._pending.get(feed_id, 0) + count
+            self._pending[feed_id] = pending
+            return pending
+
+    def pending(self, feed_id: int) -> int:
+        with self._lock:
+            return self._pending.get(feed_id, 0)
+
+    def drain(self) -> Dict[int, int]:
+        with self._lock:
+            drained, self._pending = self._pending, {}
+            return drained
+
+    def restore(self, counts: Dict[int, int]):
+        with self._lock:
+            for feed_id, count in counts.items():
+                self._pending[feed_id] = self._pending.get(feed_id, 0) + count
@@ -0,0 +1,92 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple, List, Callable
+
+from src.main.python.domain.model.feed.feed_type import FeedType
+
+CountKey = Tuple[Optional[str], Optional[int]]
+
+
+class FeedCountCache:
+    """
+    피드 개수 캐시 (프로세스 내)
+
+    - (feed_type, member_id) 조합별 노출 중인 피드 개수를 보관합니다.
+    - 피드 등록/삭제 시 adjust() 로 해당하는 모든 조합의 값을 증감합니다.
+    - 다른 워커에서 발생한 변경은 주기적인 reconcile() 로 실제 COUNT 값과 맞춥니다.
+    - ttl_seconds 가 지난 값은 만료된 것으로 보고 다시 COUNT 하도록 None 을 반환합니다.
+    - adjust() / clear() 마다 세대(generation)가 바뀝니다. COUNT 전에 generation() 을 읽어 put() 에 넘기면,
+      COUNT 하는 동안 adjust() 가 있었을 때 그 증감이 빠졌을 수 있는 값으로 덮어쓰지 않습니다.
+    """
+
+    def __init__(self, ttl_seconds: float = 300, max_entries: int = 1024):
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[CountKey, Tuple[int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    @staticmethod
+    def _key(feed_type: Optional[str], member_id: Optional[int]) -> CountKey:
+        return (FeedType.from_value(feed_type).value if feed_type else None, member_id or None)
+
+    def get(self, feed_type: Optional[str], member_id: Optional[int]) -> Optional[int]:
+        key = self._key(feed_type, member_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[1] > self._ttl_seconds:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def put(self, feed_type: Optional[str], member_id: Optional[int], total: int,
+            generation: Optional[int] = None) -> bool:
+        key = self._key(feed_type, member_id)
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return False
+            self._entries[key] = (total, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+            return True
+
+    def adjust(self, feed_type: str, member_id: int, delta: int):
+        feed_type = FeedType.from_value(feed_type).value
+        with self._lock:
+            self._generation += 1
+            # 전체 / 타입별 / 회원별 / 타입+회원별 조합 중 캐시에 있는 값만 갱신
+            for key in ((None, None), (feed_type, None), (None, member_id), (feed_type, member_id)):
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries[key] = (max(entry[0] + delta, 0), entry[1])
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def keys(self) -> List[CountKey]:
+        with self._lock:
+            return list(self._entries.keys())
+
+    def reconcile(self, counter: Callable[[Optional[str], Optional[int]], int]) -> int:
+        """
+        캐시된 모든 조합을 실제 COUNT 값으로 덮어쓰고, 값이 달랐던 조합의 개수를 반환합니다.
+        COUNT 하는 동안 adjust() 된 조합은 건너뛰고 다음 reconcile 에서 다시 맞춥니다.
+        """
+        drifted = 0
+        for feed_type, member_id in self.keys():
+            generation = self.generation()
+            total = counter(feed_type, member_id)
+            with self._lock:
+                entry = self._entries.get((feed_type, member_id))
+                previous = entry[0] if entry is not None else None
+            if self.put(feed_type, member_id, total, generation) and previous is not None and previous != total:
+                drifted += 1
+        return drifted
@@ -0,0 +1,84 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class LruTtlCache:
+    """
+    크기 제한(LRU) + 만료 시간(TTL) 을 가진 프로세스 내 캐시
+
+    - max_entries 를 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다.
+    - ttl_seconds 가 지난 항목은 조회 시 제거하고 miss 로 처리합니다.
+    - hits / misses / evictions / expirations 카운터를 stats() 로 제공합니다.
+    - clear() / discard_if() 마다 세대(generation)가 바뀝니다. 값을 만들기 전에 generation() 을 읽어 put() 에 넘기면,
+      그 사이 원본이 바뀌어 캐시를 비웠을 때 이전 값을 다시 캐시하지 않습니다.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 30):
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._generation = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            value, stored_at = entry
+            if time.monotonic() - stored_at > self._ttl_seconds:
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def put(self, key: Hashable, value: Any, generation: Optional[int] = None):
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def discard_if(self, predicate: Callable[[Any], bool]) -> int:
+        """
+        값이 predicate 를 만족하는 항목만 제거하고 제거한 개수를 반환합니다.
+        """
+        with self._lock:
+            keys = [key for key, (value, _) in self._entries.items() if predicate(value)]
+            for key in keys:
+                del self._entries[key]
+            self._generation += 1
+            return len(keys)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_entries": self._max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
@@ -1,6 +1,23 @@
 import os
+import threading
+from typing import List, Optional
+from contextlib import contextmanager, asynccontextmanager
 
-from sqlmodel import create_engine, SQLModel, Session
+from sqlalchemy.ext.asyncio import create_async_engine
+from fastapi import Request
+from sqlmodel import create_engine, SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from src.main.python.Infrastructure.config.database_profile import DatabaseProfile
+from src.main.python.Infrastructure.config.post_commit import has_after_commit, run_after_commit, discard_after_commit
+from src.main.python.Infrastructure.config.replica import ReplicaSet, ReadYourWrites, RoutingSession
+from src.main.python.Infrastructure.config.write_tracking import track_writes, has_writes, written_member_ids
+from src.main.python.Infrastructure.migration.runner import current_version, head_version, migrate
+from src.main.python.Infrastructure.monitoring.db_pool import (
+    PoolMetrics, InstrumentedQueuePool, InstrumentedAsyncAdaptedQueuePool
+)
+from src.main.python.Infrastructure.monitoring.query_stats import instrument_queries
 
 DB_USER = os.getenv("DB_USER")
 DB_PASSWORD = os.getenv("DB_PASSWORD")
@@ -8,21 +25,207 @@ DB_HOST = os.getenv("DB_HOST")
 DB_PORT = os.getenv("DB_PORT")
 DB_NAME = os.getenv("DB_NAME")
 
-DATABASE_URI = f"mysql+mysqlconnector://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+# DATABASE_URL / ASYNC_DATABASE_URL 이 있으면 우선 사용 (예: 로컬/벤치마크용 sqlite:///, sqlite+aiosqlite:///)
+DATABASE_URI = os.getenv("DATABASE_URL") or f"mysql+mysqlconnector://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+ASYNC_DATABASE_URI = os.getenv("ASYNC_DATABASE_URL") or f"mysql+aiomysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+
+# DB_ASYNC=true 이면 라우트/서비스가 비동기 세션과 리포지토리를 사용
+DB_ASYNC = os.getenv("DB_ASYNC", "false").lower() == "true"
+
+# DB_PROFILE(dev/prod/bench) 과 DB_POOL_* / DB_ECHO 환경 변수로 풀 크기, 대기 시간, SQL 로그를 결정
+DB_PROFILE = DatabaseProfile.from_env()
+
+# 회원이 쓰기를 커밋한 뒤 이 시간(초) 동안은 그 회원의 조회도 primary 로 보냄
+read_your_writes = ReadYourWrites(window_seconds=float(os.getenv("DB_READ_YOUR_WRITES_SECONDS", "5")))
+
+# FEED_LIKE_GROUP_COMMIT=true 이면 좋아요/취소를 그룹 커밋 파이프라인으로 모아서 저장
+FEED_LIKE_GROUP_COMMIT = os.getenv("FEED_LIKE_GROUP_COMMIT", "false").lower() == "true"
+
+# DB_REPLICA_URLS(쉼표 구분)가 있으면 조회는 복제본, 쓰기는 primary(engine)로 분리
+DB_REPLICA_URLS = [url.strip() for url in os.getenv("DB_REPLICA_URLS", "").split(",") if url.strip()]
+
+
+class DatabaseEngines:
+    """
+    엔진 묶음 (primary / 복제본 / 비동기 엔진과 각 풀 메트릭)
+
+    - 모듈 임포트 시점이 아닌 get_engines() 첫 호출 시점에 생성합니다. (워커 콜드 스타트, 도구/스크립트 임포트 비용 절감)
+    """
+
+    def __init__(self):
+        self.engine = create_engine(
+            DATABASE_URI,
+            poolclass=InstrumentedQueuePool,
+            pool_pre_ping=True,
+            future=True,
+            **DB_PROFILE.engine_options(),
+        )
+        self.engine_pool_metrics = PoolMetrics.attach("sync", self.engine)
+
+        # 좋아요 그룹 커밋 파이프라인 전용 primary 엔진 (워커 스레드가 하나이므로 연결 하나)
+        # 요청 풀과 나눠 두어, 결과를 기다리는 요청들이 요청 풀을 모두 점유해도 워커는 연결을 얻어 커밋할 수 있음
+        self.pipeline_engine = create_engine(
+            DATABASE_URI,
+            poolclass=InstrumentedQueuePool,
+            pool_pre_ping=True,
+            future=True,
+            **{**DB_PROFILE.engine_options(), "pool_size": 1, "max_overflow": 0},
+        ) if FEED_LIKE_GROUP_COMMIT else None
+        self.pipeline_pool_metrics = PoolMetrics.attach("pipeline", self.pipeline_engine) \
+            if self.pipeline_engine is not None else None
+
+        self.replica_set = ReplicaSet(
+            [
+                create_engine(url, poolclass=InstrumentedQueuePool, pool_pre_ping=True, future=True,
+                              **DB_PROFILE.engine_options())
+                for url in DB_REPLICA_URLS
+            ],
+            eject_seconds=float(os.getenv("DB_REPLICA_EJECT_SECONDS", "30")),
+        ) if DB_REPLICA_URLS else None
+        self.replica_pool_metrics = [
+            PoolMetrics.attach(f"replica-{index}", replica_engine)
+            for index, replica_engine in enumerate(self.replica_set.engines if self.replica_set is not None else [])
+        ]
+
+        self.async_engine = create_async_engine(
+            ASYNC_DATABASE_URI,
+            poolclass=InstrumentedAsyncAdaptedQueuePool,
+            pool_pre_ping=True,
+            **DB_PROFILE.engine_options(),
+        ) if DB_ASYNC else None
+        self.async_engine_pool_metrics = PoolMetrics.attach("async", self.async_engine) \
+            if self.async_engine is not None else None
+
+        # 요청별 SQL 횟수/시간 계측 (QueryStatsMiddleware, query_budget)
+        for instrumented_engine in self.all_engines():
+            instrument_queries(instrumented_engine)
+
+    def sync_engines(self) -> list:
+        engines = [self.engine] + ([self.pipeline_engine] if self.pipeline_engine is not None else [])
+        return engines + (self.replica_set.engines if self.replica_set is not None else [])
+
+    def all_engines(self) -> list:
+        return self.sync_engines() + ([self.async_engine] if self.async_engine is not None else [])
+
+    def pool_metrics(self) -> List[PoolMetrics]:
+        # 비동기 엔진은 DB_ASYNC=true, 파이프라인 엔진은 FEED_LIKE_GROUP_COMMIT=true 일 때만 존재
+        return [metrics for metrics in (self.engine_pool_metrics, self.pipeline_pool_metrics,
+                                        self.async_engine_pool_metrics)
+                if metrics is not None] + self.replica_pool_metrics
 
-engine = create_engine(
-    DATABASE_URI,
-    echo=True,
-    pool_pre_ping=True,
-    pool_recycle=3600,
-    future=True,
-)
 
+_engines: Optional[DatabaseEngines] = None
+_engines_lock = threading.Lock()
 
-def get_session():
-    with Session(engine) as session:
+
+def get_engines() -> DatabaseEngines:
+    global _engines
+    if _engines is None:
+        with _engines_lock:
+            if _engines is None:
+                _engines = DatabaseEngines()
+    return _engines
+
+
+async def dispose_engines():
+    # 생성되지 않은 엔진을 종료하려고 새로 만들지 않음
+    if _engines is None:
+        return
+    if _engines.async_engine is not None:
+        await _engines.async_engine.dispose()
+    for sync_engine in _engines.sync_engines():
+        sync_engine.dispose()
+
+
+@contextmanager
+def unit_of_work(primary_only: bool = False):
+    """
+    작업 단위 트랜잭션 (요청 또는 백그라운드 작업 하나)
+
+    - 리포지토리는 flush 만 하고, 블록이 정상 종료되면 여기서 한 번만 커밋합니다.
+    - 예외가 나면 롤백하고 예외를 다시 던집니다.
+    - 쓰기가 없었던 세션(조회)은 커밋하지 않고 닫습니다.
+    - after_commit 으로 등록한 작업(캐시 갱신, 이미지 참조 반납)은 커밋에 성공한 뒤에만 실행하고, 롤백하면 버립니다.
+    - 복제본이 설정되어 있으면 조회는 복제본으로 보냅니다. (primary_only=True 이면 모두 primary)
+    - 쓰기를 커밋하면 실제로 쓴 행의 회원(피드/좋아요의 member_id, 회원 자신)마다 read-your-writes 구간을 시작합니다.
+      (요청 경로/쿼리가 아닌 저장된 값 기준이므로 본문으로 member_id 를 받는 POST /feed, PUT/DELETE /feed/{feed_id} 도 포함)
+    """
+    engines = get_engines()
+    with RoutingSession(engines.engine, engines.replica_set, primary_only=primary_only) as session:
+        track_writes(session)
+        try:
+            yield session
+            if has_writes(session):
+                session.commit()
+                for member_id in written_member_ids(session):
+                    read_your_writes.mark(member_id)
+        except Exception:
+            discard_after_commit(session)
+            session.rollback()
+            raise
+        run_after_commit(session)
+
+
+@asynccontextmanager
+async def async_unit_of_work():
+    # 비동기 세션은 지연 로딩(lazy load)이 불가능하므로 커밋 후에도 속성을 만료시키지 않음
+    async with AsyncSession(get_engines().async_engine, expire_on_commit=False) as session:
+        track_writes(session.sync_session)
+        try:
+            yield session
+            if has_writes(session.sync_session):
+                await session.commit()
+                # 비동기 경로는 복제본으로 보내지 않지만, DB_ASYNC 전환과 무관하게 같은 기준으로 기록
+                for member_id in written_member_ids(session.sync_session):
+                    read_your_writes.mark(member_id)
+        except Exception:
+            discard_after_commit(session.sync_session)
+            await session.rollback()
+            raise
+        # 커밋 후 작업에는 파일 I/O(참조 반납)가 있으므로 스레드풀에서 실행
+        if has_after_commit(session.sync_session):
+            await run_in_threadpool(run_after_commit, session.sync_session)
+
+
+def get_session(request: Request):
+    # 요청 단위로 하나의 세션을 공유하므로, 세션의 identity map 이 요청 범위 캐시 역할을 합니다.
+    # (같은 작성자가 한 페이지에 여러 번 등장해도 Member 는 한 번만 로딩됨)
+    # 쓰기 요청은 쓰기 전 조회(중복 확인 등)도 최신 값이어야 하므로 요청 전체를 primary 로 보냄
+    # 조회 요청은 요청한 회원(또는 조회 대상 회원)이 최근에 쓴 적이 있으면 primary 로 보냄
+    primary_only = request.method not in ("GET", "HEAD") or read_your_writes.is_recent(_member_key(request))
+    with unit_of_work(primary_only=primary_only) as session:
         yield session
 
 
-def create_db_and_tables():
-    SQLModel.metadata.create_all(engine)
+def _member_key(request: Request) -> Optional[str]:
+    # 로그인 쿠키 → 쿼리 파라미터 → 경로 파라미터 순으로 조회하는 회원을 식별
+    return (request.cookies.get("member_id")
+            or request.query_params.get("member_id")
+            or request.path_params.get("member_id"))
+
+
+async def get_async_session():
+    async with async_unit_of_work() as session:
+        yield session
+
+
+_schema_checked = False
+
+
+def ensure_schema():
+    """
+    스키마 확인 (앱 시작 시)
+
+    - schema_migrations 의 최신 버전이 head_version() 과 같으면 create_all / migrate 를 건너뜁니다. (조회 한 번)
+    - 빈 DB 이거나 적용할 마이그레이션이 있을 때만 create_all 후 migrate 합니다.
+    - 한 프로세스에서는 한 번만 확인합니다.
+    - 이미 운영 중인 DB 에 테이블/컬럼을 추가하려면 마이그레이션 버전을 추가해야 합니다.
+    """
+    global _schema_checked
+    if _schema_checked:
+        return
+    engine = get_engines().engine
+    if current_version(engine) != head_version():
+        SQLModel.metadata.create_all(engine)
+        migrate(engine)
+    _schema_checked = True
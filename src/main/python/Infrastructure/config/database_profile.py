@@ -0,0 +1,54 @@
+import os
+
+
+class DatabaseProfile:
+    """
+    DB 엔진 풀 설정 프로필
+
+    - DB_PROFILE(dev/prod/bench)로 기본값을 고르고, 항목별 환경 변수로 덮어쓸 수 있습니다.
+      (DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE, DB_ECHO)
+    - echo 는 SQL 을 요청 경로에서 동기적으로 로깅하므로 dev 에서만 기본으로 켭니다.
+    """
+
+    def __init__(self, name: str, pool_size: int, max_overflow: int, pool_timeout: float, pool_recycle: int,
+                 echo: bool):
+        self.name = name
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_timeout = pool_timeout
+        self.pool_recycle = pool_recycle
+        self.echo = echo
+
+    @classmethod
+    def from_env(cls) -> "DatabaseProfile":
+        name = os.getenv("DB_PROFILE", "dev").lower()
+        if name not in PROFILES:
+            raise ValueError(f"알 수 없는 DB_PROFILE 입니다: {name} (dev, prod, bench 중 선택)")
+        base = PROFILES[name]
+        return cls(
+            name=name,
+            pool_size=int(os.getenv("DB_POOL_SIZE", base.pool_size)),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", base.max_overflow)),
+            pool_timeout=float(os.getenv("DB_POOL_TIMEOUT", base.pool_timeout)),
+            pool_recycle=int(os.getenv("DB_POOL_RECYCLE", base.pool_recycle)),
+            echo=os.getenv("DB_ECHO", str(base.echo)).lower() == "true",
+        )
+
+    def engine_options(self) -> dict:
+        return {
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "pool_recycle": self.pool_recycle,
+            "echo": self.echo,
+        }
+
+
+PROFILES = {
+    # 로컬 개발: SQL 로그 출력, 기본 풀 크기
+    "dev": DatabaseProfile("dev", pool_size=5, max_overflow=10, pool_timeout=30, pool_recycle=3600, echo=True),
+    # 운영: 로그 끔, 워커당 연결 여유를 두고 대기는 짧게 (포화 시 빠르게 실패해 오토스케일 신호로 사용)
+    "prod": DatabaseProfile("prod", pool_size=20, max_overflow=10, pool_timeout=5, pool_recycle=1800, echo=False),
+    # 벤치마크: 로그 끔, 동시 부하에서 풀이 병목이 되지 않도록 크게
+    "bench": DatabaseProfile("bench", pool_size=32, max_overflow=32, pool_timeout=30, pool_recycle=3600, echo=False),
+}
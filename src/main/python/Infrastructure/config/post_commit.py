@@ -0,0 +1,36 @@
+"""
+커밋 후 실행 작업 (post-commit callback)
+
+캐시 갱신, 이미지 참조 반납 같은 DB 밖의 부수 효과는 트랜잭션이 커밋된 뒤에만 실행해야 합니다.
+(커밋 전에 실행하면 커밋이 실패했을 때 캐시/참조 수가 DB 와 어긋나고, 반납한 파일이 아직 참조 중인데 GC 될 수 있음)
+unit_of_work 는 커밋에 성공하면 등록된 작업을 등록 순서대로 실행하고, 롤백하면 버립니다.
+"""
+import logging
+from typing import Callable
+
+from sqlmodel import Session
+
+logger = logging.getLogger(__name__)
+
+_CALLBACKS = "unit_of_work.after_commit"
+
+
+def after_commit(session: Session, callback: Callable[[], None]):
+    session.info.setdefault(_CALLBACKS, []).append(callback)
+
+
+def has_after_commit(session: Session) -> bool:
+    return bool(session.info.get(_CALLBACKS))
+
+
+def run_after_commit(session: Session):
+    # 이미 커밋된 뒤이므로 작업 하나가 실패해도 요청을 실패시키지 않고 나머지를 계속 실행
+    for callback in session.info.pop(_CALLBACKS, []):
+        try:
+            callback()
+        except Exception:
+            logger.exception("after-commit callback failed")
+
+
+def discard_after_commit(session: Session):
+    session.info.pop(_CALLBACKS, None)
@@ -0,0 +1,176 @@
+import itertools
+import logging
+import threading
+import time
+from typing import List, Optional, Dict
+
+from sqlalchemy import event, text, exc
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from src.main.python.Infrastructure.config.write_tracking import has_writes
+
+logger = logging.getLogger(__name__)
+
+_PRIMARY_ONLY = "routing.primary_only"
+_REPLICA = "routing.replica"
+_LAST_BIND = "routing.last_bind"
+
+
+class ReplicaSet:
+    """
+    읽기 전용 복제본(replica) 엔진 목록과 상태
+
+    - 정상 복제본을 라운드 로빈으로 고릅니다.
+    - 연결 오류가 나거나 헬스 체크에 실패한 복제본은 eject_seconds 동안 제외(eject)합니다.
+    - 모든 복제본이 제외되면 choose() 는 None 을 반환하고 읽기는 primary 로 갑니다.
+    """
+
+    def __init__(self, engines: List[Engine], eject_seconds: float = 30):
+        self.engines = engines
+        self.eject_seconds = eject_seconds
+        self._ejected_until: Dict[Engine, float] = {}
+        self._lock = threading.Lock()
+        self._cycle = itertools.cycle(engines)
+        for engine in engines:
+            event.listen(engine, "handle_error", self._on_error)
+
+    def choose(self) -> Optional[Engine]:
+        now = time.monotonic()
+        with self._lock:
+            for _ in range(len(self.engines)):
+                engine = next(self._cycle)
+                if self._ejected_until.get(engine, 0) <= now:
+                    return engine
+        return None
+
+    def eject(self, engine: Engine):
+        with self._lock:
+            self._ejected_until[engine] = time.monotonic() + self.eject_seconds
+        logger.warning("replica ejected for %.0fs: %s", self.eject_seconds, engine.url.render_as_string())
+
+    def readmit(self, engine: Engine):
+        with self._lock:
+            ejected = self._ejected_until.pop(engine, None)
+        if ejected is not None:
+            logger.info("replica readmitted: %s", engine.url.render_as_string())
+
+    def check_health(self):
+        # 백그라운드 작업에서 주기적으로 호출 (실패 시 제외, 성공 시 복귀)
+        for engine in self.engines:
+            try:
+                with engine.connect() as connection:
+                    connection.execute(text("SELECT 1"))
+            except exc.DBAPIError:
+                self.eject(engine)
+            else:
+                self.readmit(engine)
+
+    def stats(self) -> List[dict]:
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {"url": engine.url.render_as_string(), "healthy": self._ejected_until.get(engine, 0) <= now}
+                for engine in self.engines
+            ]
+
+    def _on_error(self, context):
+        # 연결 끊김/접속 불가 계열 오류만 복제본 장애로 판단 (SQL 오류는 제외)
+        if context.is_disconnect or isinstance(context.sqlalchemy_exception, exc.OperationalError):
+            self.eject(context.engine)
+
+
+class ReadYourWrites:
+    """
+    쓰기 직후 읽기 고정(read-your-writes)
+
+    - 회원이 쓰기를 커밋하면 window_seconds 동안 그 회원의 읽기를 primary 로 보냅니다.
+      (복제 지연으로 방금 쓴 데이터가 안 보이는 문제 방지)
+    - 프로세스 메모리 기준이므로 워커가 여러 개면 같은 워커로 온 요청에만 적용됩니다.
+    """
+
+    def __init__(self, window_seconds: float = 5, max_entries: int = 100_000):
+        self.window_seconds = window_seconds
+        self.max_entries = max_entries
+        self._written_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def mark(self, key: Optional[str]):
+        if not key:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if len(self._written_at) >= self.max_entries:
+                self._written_at = {k: t for k, t in self._written_at.items() if now - t < self.window_seconds}
+            self._written_at[key] = now
+
+    def is_recent(self, key: Optional[str]) -> bool:
+        if not key:
+            return False
+        with self._lock:
+            written_at = self._written_at.get(key)
+        return written_at is not None and time.monotonic() - written_at < self.window_seconds
+
+
+class RoutingSession(Session):
+    """
+    읽기/쓰기 분리 세션
+
+    - 쓰기(flush, INSERT/UPDATE/DELETE), SELECT ... FOR UPDATE, 텍스트 SQL 은 primary 로 보냅니다.
+    - 세션에 쓰기가 한 번이라도 있었거나 primary_only 이면 이후 조회도 primary 로 보냅니다.
+    - 그 외 SELECT 는 세션마다 하나 고른 복제본으로 보내고, 복제본 연결에서 실패하면 그 복제본을 제외하고
+      primary 로 한 번 재시도합니다. (primary 연결에서 난 오류는 그대로 던짐)
+    """
+
+    def __init__(self, primary: Engine, replica_set: Optional[ReplicaSet] = None, primary_only: bool = False,
+                 **kwargs):
+        super().__init__(bind=primary, **kwargs)
+        self.primary = primary
+        self.replica_set = replica_set
+        self.info[_PRIMARY_ONLY] = primary_only
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        # 실패 시 어느 쪽(primary / 복제본) 연결에서 난 오류인지 알 수 있도록 마지막으로 고른 엔진을 기록
+        bind = self._choose_bind(clause)
+        self.info[_LAST_BIND] = bind
+        return bind
+
+    def _choose_bind(self, clause) -> Engine:
+        if self._reads_from_primary(clause):
+            return self.primary
+        replica = self.info.get(_REPLICA)
+        if replica is None:
+            replica = self.replica_set.choose()
+            if replica is None:
+                return self.primary
+            self.info[_REPLICA] = replica
+        return replica
+
+    def exec(self, statement, *args, **kwargs):
+        return self._with_replica_fallback(super().exec, statement, *args, **kwargs)
+
+    def execute(self, statement, *args, **kwargs):
+        return self._with_replica_fallback(super().execute, statement, *args, **kwargs)
+
+    def _with_replica_fallback(self, run, statement, *args, **kwargs):
+        self.info.pop(_LAST_BIND, None)
+        try:
+            return run(statement, *args, **kwargs)
+        except exc.OperationalError:
+            replica = self.info.get(_REPLICA)
+            # primary 에서 난 오류(락 대기, 데드락 등)는 복제본 장애가 아니므로 제외하지 않고 그대로 던짐
+            if replica is None or self.info.get(_LAST_BIND) is not replica or has_writes(self):
+                raise
+            # 복제본 장애: 복제본 연결을 정리하고 이번 세션은 primary 로 고정해 재시도
+            self.replica_set.eject(replica)
+            self.rollback()
+            self.info.pop(_REPLICA, None)
+            self.info[_PRIMARY_ONLY] = True
+            return run(statement, *args, **kwargs)
+
+    def _reads_from_primary(self, clause) -> bool:
+        if self.replica_set is None or self.info.get(_PRIMARY_ONLY) or self._flushing or has_writes(self):
+            return True
+        if clause is None or not getattr(clause, "is_select", False):
+            return True
+        return getattr(clause, "_for_update_arg", None) is not None
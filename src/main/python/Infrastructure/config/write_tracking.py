@@ -0,0 +1,47 @@
+"""
+세션 쓰기 여부 추적
+
+unit_of_work 는 쓰기가 있었던 세션만 커밋하고, 조회만 한 세션은 커밋 없이 닫습니다.
+flush 한 엔티티의 작성 회원(member_id, 회원 자신은 id)을 모아 두면 커밋 후 read-your-writes 구간을 시작합니다.
+"""
+from typing import Set
+
+from sqlalchemy import event
+from sqlmodel import Session
+
+from src.main.python.domain.model.user.member import Member
+
+_HAS_WRITES = "unit_of_work.has_writes"
+_WRITERS = "unit_of_work.writers"
+
+
+def track_writes(session: Session):
+    # flush 나 ORM 으로 실행한 INSERT/UPDATE/DELETE 가 있으면 세션에 표시
+    def mark_flush(flushed_session, flush_context):
+        flushed_session.info[_HAS_WRITES] = True
+        # after_flush 시점에는 new/dirty/deleted 가 아직 flush 전 상태이고, 새 회원의 id 는 채워져 있음
+        writers = flushed_session.info.setdefault(_WRITERS, set())
+        for entity in (*flushed_session.new, *flushed_session.dirty, *flushed_session.deleted):
+            member_id = entity.id if isinstance(entity, Member) else getattr(entity, "member_id", None)
+            if member_id is not None:
+                writers.add(str(member_id))
+
+    def mark_statement(orm_execute_state):
+        if not orm_execute_state.is_select:
+            orm_execute_state.session.info[_HAS_WRITES] = True
+
+    event.listen(session, "after_flush", mark_flush)
+    event.listen(session, "do_orm_execute", mark_statement)
+
+
+def has_writes(session: Session) -> bool:
+    return session.info.get(_HAS_WRITES, False) or bool(session.new or session.dirty or session.deleted)
+
+
+def written_member_ids(session: Session) -> Set[str]:
+    return session.info.get(_WRITERS, set())
+
+
+def clear_writes(session: Session):
+    session.info.pop(_HAS_WRITES, None)
+    session.info.pop(_WRITERS, None)
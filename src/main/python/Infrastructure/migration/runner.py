@@ -0,0 +1,56 @@
+import logging
+from datetime import datetime, timezone
+from typing import List
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+
+from src.main.python.Infrastructure.migration.versions import MIGRATIONS, Migration
+
+logger = logging.getLogger(__name__)
+
+schema_migrations = Table(
+    "schema_migrations",
+    MetaData(),
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("description", String(255), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+def head_version() -> int:
+    return MIGRATIONS[-1].version if MIGRATIONS else 0
+
+
+def current_version(engine: Engine) -> int:
+    """적용된 최신 마이그레이션 버전 (schema_migrations 테이블이 없으면 0), 테이블을 만들지 않고 조회만 합니다."""
+    try:
+        with engine.connect() as connection:
+            return connection.execute(select(func.max(schema_migrations.c.version))).scalar() or 0
+    except DBAPIError:
+        return 0
+
+
+def applied_versions(engine: Engine) -> List[int]:
+    schema_migrations.create(engine, checkfirst=True)
+    with engine.connect() as connection:
+        return list(connection.execute(select(schema_migrations.c.version)).scalars())
+
+
+def migrate(engine: Engine) -> List[Migration]:
+    """
+    적용되지 않은 마이그레이션을 버전 순서대로 각각의 트랜잭션에서 적용하고, 적용한 목록을 반환합니다.
+    """
+    applied = set(applied_versions(engine))
+    pending = [migration for migration in MIGRATIONS if migration.version not in applied]
+    for migration in pending:
+        logger.info("applying migration %d - %s", migration.version, migration.description)
+        with engine.begin() as connection:
+            migration.upgrade(connection)
+            connection.execute(schema_migrations.insert().values(
+                version=migration.version,
+                description=migration.description,
+                applied_at=datetime.now(timezone.utc),
+            ))
+    return pending
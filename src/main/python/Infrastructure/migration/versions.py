@@ -0,0 +1,85 @@
+from typing import Callable, List, Sequence
+
+from sqlalchemy import Index, inspect, select, update, bindparam
+from sqlalchemy.engine import Connection
+from sqlmodel import SQLModel
+
+
+class Migration:
+    """
+    버전 단위 스키마 변경
+
+    - version: 1부터 증가하는 정수 (적용 순서)
+    - description: 변경 내용 설명
+    - upgrade: 기존 데이터를 보존하면서 스키마를 변경하는 함수
+    """
+
+    def __init__(self, version: int, description: str, upgrade: Callable[[Connection], None]):
+        self.version = version
+        self.description = description
+        self.upgrade = upgrade
+
+
+def ensure_index(connection: Connection, table: str, name: str, columns: Sequence[str]):
+    """
+    인덱스가 없으면 만들고, 같은 이름의 인덱스가 다른 컬럼 구성이면 다시 만듭니다.
+    """
+    existing = {index["name"]: index["column_names"] for index in inspect(connection).get_indexes(table)}
+    if existing.get(name) == list(columns):
+        return
+    sa_table = SQLModel.metadata.tables[table]
+    index = Index(name, *[sa_table.c[column] for column in columns])
+    if name in existing:
+        index.drop(connection)
+    index.create(connection)
+
+
+def ensure_column(connection: Connection, table: str, column: str):
+    """
+    컬럼이 없으면 모델에 선언된 타입으로 추가합니다. (NULL 허용 컬럼만 대상)
+    """
+    if column in {existing["name"] for existing in inspect(connection).get_columns(table)}:
+        return
+    column_type = SQLModel.metadata.tables[table].c[column].type.compile(dialect=connection.dialect)
+    connection.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+
+
+def _hot_query_indexes(connection: Connection):
+    ensure_index(connection, "feeds", "ix_feeds_displayed_type_created", ["displayed", "feed_type", "created_at", "id"])
+    ensure_index(connection, "feeds", "ix_feeds_member_displayed_created", ["member_id", "displayed", "created_at"])
+    ensure_index(connection, "members", "ix_members_nickname", ["nickname"])
+    ensure_index(connection, "feed_likes", "ix_feed_likes_member_feed", ["member_id", "feed_id"])
+
+
+def _unfiltered_feed_list_index(connection: Connection):
+    ensure_index(connection, "feeds", "ix_feeds_displayed_created", ["displayed", "created_at", "id"])
+
+
+def _feed_cover_image(connection: Connection, batch_size: int = 1000):
+    # 목록 조회가 images JSON 배열을 읽지 않도록 대표 이미지(images[0])를 별도 컬럼에 저장
+    ensure_column(connection, "feeds", "cover_image")
+    feeds = SQLModel.metadata.tables["feeds"]
+    statement = (update(feeds)
+                 .where(feeds.c.id == bindparam("feed_id"))
+                 .values(cover_image=bindparam("cover")))
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            select(feeds.c.id, feeds.c.images)
+            .where(feeds.c.id > last_id, feeds.c.cover_image.is_(None))
+            .order_by(feeds.c.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            return
+        values = [{"feed_id": feed_id, "cover": images[0]} for feed_id, images in rows if images]
+        if values:
+            connection.execute(statement, values)
+        last_id = rows[-1][0]
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "hot query indexes (feeds list/member, members nickname, feed_likes member)", _hot_query_indexes),
+    Migration(2, "feeds (displayed, created_at, id) index for unfiltered list", _unfiltered_feed_list_index),
+    Migration(3, "feeds.cover_image column (images[0]) for list projection", _feed_cover_image),
+]
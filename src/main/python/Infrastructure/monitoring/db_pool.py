@@ -0,0 +1,108 @@
+import threading
+import time
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+
+class PoolMetrics:
+    """
+    커넥션 풀 계측 값
+
+    - checkout/checkin 풀 이벤트로 현재 대여 중인 연결 수와 누적 대여 횟수를 셉니다.
+    - 연결을 얻기까지 기다린 시간과 pool_timeout 초과 횟수는 Instrumented*Pool 이 기록합니다.
+    - 누적 값(합계/횟수)으로 노출하므로 수집 측에서 구간별 비율을 계산할 수 있습니다.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.pool = None
+        self._lock = threading.Lock()
+        self._checked_out = 0
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+
+    @classmethod
+    def attach(cls, name: str, engine) -> "PoolMetrics":
+        # AsyncEngine 은 내부 sync_engine 의 풀에 리스너를 붙임
+        pool = getattr(engine, "sync_engine", engine).pool
+        metrics = cls(name)
+        metrics.pool = pool
+        if isinstance(pool, _WaitTimingMixin):
+            pool.metrics = metrics
+        event.listen(pool, "checkout", metrics._on_checkout)
+        event.listen(pool, "checkin", metrics._on_checkin)
+        return metrics
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        with self._lock:
+            self._checked_out += 1
+            self._checkouts += 1
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        with self._lock:
+            self._checked_out = max(0, self._checked_out - 1)
+
+    def record_wait(self, seconds: float):
+        with self._lock:
+            self._wait_seconds_total += seconds
+            self._wait_seconds_max = max(self._wait_seconds_max, seconds)
+
+    def record_timeout(self, seconds: float):
+        with self._lock:
+            self._timeouts += 1
+            self._wait_seconds_total += seconds
+            self._wait_seconds_max = max(self._wait_seconds_max, seconds)
+
+    def stats(self) -> dict:
+        pool_size = self.pool.size() if isinstance(self.pool, QueuePool) else None
+        max_overflow = getattr(self.pool, "_max_overflow", None)
+        with self._lock:
+            capacity = pool_size + max_overflow if pool_size is not None and max_overflow is not None else None
+            return {
+                "name": self.name,
+                "pool_size": pool_size,
+                "max_overflow": max_overflow,
+                "checked_out": self._checked_out,
+                "utilization": round(self._checked_out / capacity, 3) if capacity else None,
+                "checkouts": self._checkouts,
+                "checkout_timeouts": self._timeouts,
+                "wait_seconds_total": round(self._wait_seconds_total, 6),
+                "wait_seconds_max": round(self._wait_seconds_max, 6),
+                "wait_seconds_avg": round(self._wait_seconds_total / self._checkouts, 6) if self._checkouts else 0.0,
+            }
+
+
+class _WaitTimingMixin:
+    """풀에서 연결을 얻는 구간(_do_get)의 대기 시간과 타임아웃을 PoolMetrics 에 기록합니다."""
+    metrics = None
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            if self.metrics is not None:
+                self.metrics.record_timeout(time.perf_counter() - started)
+            raise
+        if self.metrics is not None:
+            self.metrics.record_wait(time.perf_counter() - started)
+        return connection
+
+    def recreate(self):
+        # dispose()/무효화로 풀이 다시 만들어져도 같은 계측 객체를 유지
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        if self.metrics is not None:
+            self.metrics.pool = pool
+        return pool
+
+
+class InstrumentedQueuePool(_WaitTimingMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(_WaitTimingMixin, AsyncAdaptedQueuePool):
+    pass
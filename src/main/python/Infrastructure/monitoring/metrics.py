@@ -0,0 +1,65 @@
+from typing import Callable, Dict, Iterable, Sequence, Tuple
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+LabeledValue = Tuple[Dict[str, str], float]
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class GaugeCallback(Collector):
+    """
+    수집 시점에 callback() 이 돌려주는 [(라벨, 값)] 을 gauge 로 노출합니다.
+    (풀/캐시/스레드풀처럼 요청 경로에서 기록하지 않고 스크레이프할 때 읽는 값)
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str],
+                 callback: Callable[[], Iterable[LabeledValue]]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.callback = callback
+
+    def describe(self):
+        # 등록 시 이름 중복 확인용 (callback 을 호출하지 않음)
+        return [GaugeMetricFamily(self.name, self.documentation, labels=self.labelnames)]
+
+    def collect(self):
+        family = GaugeMetricFamily(self.name, self.documentation, labels=self.labelnames)
+        for labels, value in self.callback():
+            family.add_metric([str(labels[name]) for name in self.labelnames], value)
+        yield family
+
+
+def gauge_callback(name: str, documentation: str, labelnames: Sequence[str],
+                   callback: Callable[[], Iterable[LabeledValue]]) -> GaugeCallback:
+    collector = GaugeCallback(name, documentation, labelnames, callback)
+    registry.register(collector)
+    return collector
+
+
+# 애플리케이션 전역 레지스트리 (Infrastructure 계층에서도 기록해야 하므로 모듈 수준에 둠)
+# 기본 레지스트리(REGISTRY)의 프로세스/플랫폼 수집기는 포함하지 않음
+registry = CollectorRegistry()
+
+http_requests = Counter(
+    "petstagram_http_requests", "HTTP 요청 수 (라우트 템플릿/메서드/상태 클래스별)", ("route", "method", "status"),
+    registry=registry)
+http_request_duration = Histogram(
+    "petstagram_http_request_duration_seconds", "HTTP 요청 처리 시간(초)", ("route", "method", "status"),
+    buckets=DEFAULT_LATENCY_BUCKETS, registry=registry)
+http_requests_in_flight = Gauge(
+    "petstagram_http_requests_in_flight", "처리 중인 HTTP 요청 수", registry=registry)
+file_upload_bytes = Counter(
+    "petstagram_file_upload_bytes", "업로드로 받은 원본 파일 바이트 수", registry=registry)
+image_processing_duration = Histogram(
+    "petstagram_image_processing_duration_seconds", "이미지 처리 작업 시간(초, 워커 프로세스 안에서 측정)", ("operation",),
+    buckets=DEFAULT_LATENCY_BUCKETS, registry=registry)
+image_processing_queue_wait = Histogram(
+    "petstagram_image_processing_queue_wait_seconds", "이미지 처리 작업이 대기열에서 워커를 기다린 시간(초)", ("operation",),
+    buckets=DEFAULT_LATENCY_BUCKETS, registry=registry)
+image_processing_rejected = Counter(
+    "petstagram_image_processing_rejected", "대기열 초과/제한 시간 초과로 거절한 이미지 처리 작업 수", ("reason",),
+    registry=registry)
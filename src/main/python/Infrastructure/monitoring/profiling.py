@@ -0,0 +1,164 @@
+import asyncio
+import cProfile
+import functools
+import hmac
+import io
+import os
+import pstats
+import random
+import re
+import sys
+import threading
+import time
+from contextvars import ContextVar
+from typing import Callable, List, Optional
+from uuid import uuid4
+
+# 3.12 부터 cProfile 은 sys.monitoring 을 사용해 모든 스레드를 한 번에 기록 (스레드별 프로파일러 불필요, 동시 활성화 불가)
+_PROFILES_ALL_THREADS = sys.version_info >= (3, 12)
+
+# 호출 트리를 보여줄 함수 (서비스 / 리포지토리 / Pillow)
+_CALL_TREE_PATTERN = r"application[\\/]service|Infrastructure[\\/]persistence|PIL[\\/]"
+
+
+class RequestProfile:
+    """요청 하나의 프로파일 (이벤트 루프 스레드 프로파일러 + 스레드풀에서 실행된 호출별 프로파일러)"""
+
+    def __init__(self):
+        self.profiler = cProfile.Profile()
+        self.worker_profilers: List[cProfile.Profile] = []
+        self._lock = threading.Lock()
+
+    def add_worker_profiler(self, profiler: cProfile.Profile):
+        with self._lock:
+            self.worker_profilers.append(profiler)
+
+    def stats(self) -> pstats.Stats:
+        stats = pstats.Stats(self.profiler, stream=io.StringIO())
+        for profiler in self.worker_profilers:
+            stats.add(profiler)
+        return stats
+
+
+# 현재 요청이 프로파일링 대상이면 설정됨 (스레드풀로 넘어가도 contextvars 복사로 같은 객체를 참조)
+_active_profile: ContextVar[Optional[RequestProfile]] = ContextVar("active_request_profile", default=None)
+
+
+def profiled(func: Callable) -> Callable:
+    """
+    스레드풀에서 실행할 함수를 현재 요청의 프로파일러로 감쌉니다.
+    프로파일링 중이 아니면 func 를 그대로 돌려줍니다.
+    """
+    profile = _active_profile.get()
+    if profile is None or _PROFILES_ALL_THREADS:
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(func, *args, **kwargs)
+        finally:
+            profile.add_worker_profiler(profiler)
+    return wrapper
+
+
+def _profiled_endpoint(func: Callable) -> Callable:
+    @functools.wraps(func)
+    def wrapper(**values):
+        return profiled(func)(**values)
+    wrapper.profiled_endpoint = True
+    return wrapper
+
+
+class RequestProfiler:
+    """
+    요청 단위 온디맨드 프로파일러 (cProfile, 결정적 프로파일링)
+
+    - 관리자 헤더(X-Profile-Token == PROFILING_ADMIN_TOKEN) 또는 샘플링 비율(PROFILING_SAMPLE_RATE)로 요청 하나만 프로파일링합니다.
+    - 결과는 PROFILING_DIR 에 .prof(pstats 덤프, snakeviz 등으로 열람) 와 .txt(라우트/시간/호출 트리) 로 남깁니다.
+    - 동시에 한 요청만 프로파일링합니다. (이벤트 루프 스레드의 프로파일러에는 같은 시점의 다른 요청 코루틴이 섞일 수 있음)
+    """
+
+    TOKEN_HEADER = b"x-profile-token"
+
+    def __init__(self, output_dir: str, sample_rate: float = 0.0, admin_token: Optional[str] = None):
+        self.output_dir = output_dir
+        self.sample_rate = sample_rate
+        self.admin_token = admin_token
+        self._busy = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> Optional["RequestProfiler"]:
+        sample_rate = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+        admin_token = os.getenv("PROFILING_ADMIN_TOKEN") or None
+        # 둘 다 없으면 프로파일링 비활성 (미들웨어/래퍼를 설치하지 않음)
+        if sample_rate <= 0 and admin_token is None:
+            return None
+        return cls(os.getenv("PROFILING_DIR", "profiles"), sample_rate, admin_token)
+
+    def trigger(self, scope) -> Optional[str]:
+        if self.admin_token is not None:
+            for name, value in scope["headers"]:
+                if name == self.TOKEN_HEADER:
+                    if hmac.compare_digest(value, self.admin_token.encode()):
+                        return "admin"
+                    break
+        if self.sample_rate > 0 and random.random() < self.sample_rate:
+            return "sample"
+        return None
+
+    def try_start(self) -> Optional[RequestProfile]:
+        if not self._busy.acquire(blocking=False):
+            return None
+        profile = RequestProfile()
+        profile.profiler.enable()
+        return profile
+
+    def finish(self, profile: RequestProfile):
+        profile.profiler.disable()
+        self._busy.release()
+
+    def instrument_sync_endpoints(self, routes):
+        """동기(def) 엔드포인트는 FastAPI 가 스레드풀에서 실행하므로 호출 지점을 profiled() 로 감쌉니다."""
+        if _PROFILES_ALL_THREADS:
+            return
+        for route in routes:
+            dependant = getattr(route, "dependant", None)
+            if dependant is None or dependant.call is None:
+                continue
+            if getattr(dependant.call, "profiled_endpoint", False) or asyncio.iscoroutinefunction(dependant.call):
+                continue
+            dependant.call = _profiled_endpoint(dependant.call)
+
+    def write(self, profile: RequestProfile, name: str, header: str) -> str:
+        os.makedirs(self.output_dir, exist_ok=True)
+        base_path = os.path.join(self.output_dir, name)
+        stats = profile.stats()
+        stats.dump_stats(base_path + ".prof")
+
+        stream = io.StringIO()
+        stream.write(header + "\n\n")
+        stats.stream = stream
+        stats.sort_stats("cumulative").print_stats(60)
+        stats.print_callees(_CALL_TREE_PATTERN)
+        with open(base_path + ".txt", "w", encoding="utf-8") as file:
+            file.write(stream.getvalue())
+        return base_path
+
+    @staticmethod
+    def new_profile_id() -> str:
+        return uuid4().hex[:12]
+
+    @staticmethod
+    def file_name(method: str, route: str, profile_id: str) -> str:
+        slug = re.sub(r"[^A-Za-z0-9]+", "_", route).strip("_") or "root"
+        return f"{time.strftime('%Y%m%dT%H%M%S')}_{method}_{slug}_{profile_id}"
+
+
+def activate(profile: RequestProfile):
+    return _active_profile.set(profile)
+
+
+def deactivate(token):
+    _active_profile.reset(token)
@@ -0,0 +1,90 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Optional
+
+from sqlalchemy import event
+
+
+class QueryStats:
+    """SQL 실행 횟수와 누적 DB 시간 (요청 하나 또는 query_budget 블록 하나 단위)"""
+    __slots__ = ("count", "seconds")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def record(self, seconds: float):
+        self.count += 1
+        self.seconds += seconds
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+# 요청 단위 통계 (미들웨어가 설정, 스레드풀로 넘어가도 contextvars 복사로 같은 객체를 참조)
+_request_stats: ContextVar[Optional[QueryStats]] = ContextVar("request_query_stats", default=None)
+
+# query_budget() 블록 단위 통계 (스레드/이벤트 루프와 무관하게 모든 SQL 을 셈, 테스트용)
+_budgets: List[QueryStats] = []
+
+_STARTED = "query_stats.started"
+
+
+def instrument_queries(engine):
+    """
+    엔진에 SQL 실행 시간 측정 이벤트를 등록합니다. (AsyncEngine 은 sync_engine 에 등록)
+    측정 대상(요청/예산 블록)이 없으면 contextvar 조회 한 번으로 끝나므로 운영에서도 켜 둘 수 있습니다.
+    """
+    target = getattr(engine, "sync_engine", engine)
+    event.listen(target, "before_cursor_execute", _before_cursor_execute)
+    event.listen(target, "after_cursor_execute", _after_cursor_execute)
+
+
+def _before_cursor_execute(connection, cursor, statement, parameters, context, executemany):
+    if _request_stats.get() is None and not _budgets:
+        return
+    connection.info.setdefault(_STARTED, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(connection, cursor, statement, parameters, context, executemany):
+    started = connection.info.get(_STARTED)
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.record(elapsed)
+    for budget in list(_budgets):
+        budget.record(elapsed)
+
+
+@contextmanager
+def track_request_queries():
+    stats = QueryStats()
+    token = _request_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _request_stats.reset(token)
+
+
+@contextmanager
+def query_budget(max_queries: int, max_seconds: Optional[float] = None):
+    """
+    블록 안에서 실행된 SQL 이 max_queries(와 max_seconds)를 넘으면 QueryBudgetExceeded 를 던집니다.
+
+    with query_budget(3):
+        client.get("/feeds?limit=20")
+    """
+    stats = QueryStats()
+    _budgets.append(stats)
+    try:
+        yield stats
+    finally:
+        _budgets.remove(stats)
+    if stats.count > max_queries:
+        raise QueryBudgetExceeded(f"query budget exceeded: {stats.count} queries (budget {max_queries})")
+    if max_seconds is not None and stats.seconds > max_seconds:
+        raise QueryBudgetExceeded(f"query time budget exceeded: {stats.seconds:.4f}s (budget {max_seconds}s)")
@@ -0,0 +1,53 @@
+from typing import Optional, List, Set
+
+from sqlmodel import select, func, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.main.python.domain.model.feed.feed import Feed
+from src.main.python.domain.model.feed.feed_like import FeedLike
+from src.main.python.domain.repository.async_feed_like_interface import IAsyncFeedLikeRepository
+
+
+class AsyncFeedLikeRepository(IAsyncFeedLikeRepository):
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def save(self, feed_like: FeedLike) -> FeedLike:
+        self.db.add(feed_like)
+        await self.db.flush()
+        await self._change_feed_likes(feed_like.feed_id, 1)
+        return feed_like
+
+    async def delete(self, feed_like: FeedLike):
+        await self.db.delete(feed_like)
+        await self.db.flush()
+        await self._change_feed_likes(feed_like.feed_id, -1)
+
+    async def _change_feed_likes(self, feed_id: int, delta: int):
+        # 동기 FeedLikeRepository 와 동일하게 feeds.likes 를 같은 트랜잭션에서 증감
+        statement = update(Feed).where(Feed.id == feed_id).values(likes=Feed.likes + delta)
+        if delta < 0:
+            statement = statement.where(Feed.likes >= -delta)
+        await self.db.exec(statement)
+
+    async def find_by_feed_id_and_member_id(self, feed_id: int, member_id: int) -> Optional[FeedLike]:
+        statement = select(FeedLike).where(FeedLike.feed_id == feed_id, FeedLike.member_id == member_id)
+        result = await self.db.exec(statement)
+        return result.first()
+
+    async def exists_by_feed_id_and_member_id(self, feed_id: int, member_id: int) -> bool:
+        statement = select(FeedLike.id).where(FeedLike.feed_id == feed_id, FeedLike.member_id == member_id)
+        result = await self.db.exec(statement)
+        return result.first() is not None
+
+    async def find_liked_feed_ids(self, feed_ids: List[int], member_id: int) -> Set[int]:
+        if not feed_ids:
+            return set()
+        statement = select(FeedLike.feed_id).where(FeedLike.feed_id.in_(feed_ids), FeedLike.member_id == member_id)
+        result = await self.db.exec(statement)
+        return set(result.all())
+
+    async def count_by_feed_id(self, feed_id: int) -> int:
+        statement = select(func.count()).select_from(FeedLike).where(FeedLike.feed_id == feed_id)
+        result = await self.db.exec(statement)
+        return result.one()
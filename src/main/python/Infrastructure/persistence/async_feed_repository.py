@@ -0,0 +1,47 @@
+from datetime import datetime
+from typing import Optional, List, Tuple
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.main.python.Infrastructure.persistence import feed_statements
+from src.main.python.domain.model.feed.feed import Feed
+from src.main.python.domain.model.feed.feed_summary import FeedSummary
+from src.main.python.domain.repository.async_feed_repository_interface import IAsyncFeedRepository
+
+
+class AsyncFeedRepository(IAsyncFeedRepository):
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def save(self, feed: Feed) -> Feed:
+        self.db.add(feed)
+        await self.db.flush()
+        return feed
+
+    async def find_by_id(self, feed_id: int) -> Optional[Feed]:
+        result = await self.db.exec(feed_statements.find_by_id_statement(feed_id))
+        return result.first()
+
+    async def paginate(self, offset: int, limit: int, feed_type: Optional[str] = None,
+                       member_id: Optional[int] = None) -> List[FeedSummary]:
+        result = await self.db.exec(feed_statements.paginate_statement(offset, limit, feed_type, member_id))
+        return [FeedSummary(*row) for row in result]
+
+    async def paginate_with_total(self, offset: int, limit: int, feed_type: Optional[str] = None,
+                                  member_id: Optional[int] = None) -> Tuple[List[FeedSummary], Optional[int]]:
+        statement = feed_statements.paginate_with_total_statement(offset, limit, feed_type, member_id)
+        rows = (await self.db.exec(statement)).all()
+        if not rows:
+            return [], None
+        return [FeedSummary(*row[:-1]) for row in rows], rows[0][-1]
+
+    async def paginate_by_cursor(self, cursor_created_at: Optional[datetime], cursor_id: Optional[int], limit: int,
+                                 feed_type: Optional[str] = None, member_id: Optional[int] = None) -> List[FeedSummary]:
+        statement = feed_statements.paginate_by_cursor_statement(cursor_created_at, cursor_id, limit, feed_type,
+                                                                 member_id)
+        result = await self.db.exec(statement)
+        return [FeedSummary(*row) for row in result]
+
+    async def count(self, feed_type: Optional[str], member_id: Optional[int]) -> int:
+        total = (await self.db.exec(feed_statements.count_statement(feed_type, member_id))).one()
+        return total[0] if isinstance(total, tuple) else total
@@ -0,0 +1,37 @@
+from typing import Optional
+
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.main.python.domain.model.user.member import Member
+from src.main.python.domain.repository.async_member_repository_interface import IAsyncMemberRepository
+
+
+class AsyncMemberRepository(IAsyncMemberRepository):
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def save(self, member: Member) -> Member:
+        self.db.add(member)
+        await self.db.flush()
+        return member
+
+    async def find_by_id(self, member_id: int) -> Optional[Member]:
+        statement = select(Member).where(Member.id == member_id, Member.displayed == True)
+        result = await self.db.exec(statement)
+        return result.first()
+
+    async def find_by_email(self, email: str) -> Optional[Member]:
+        statement = select(Member).where(Member.email == email, Member.displayed == True)
+        result = await self.db.exec(statement)
+        return result.first()
+
+    async def find_by_nickname(self, nickname: str) -> Optional[Member]:
+        statement = select(Member).where(Member.nickname == nickname, Member.displayed == True)
+        result = await self.db.exec(statement)
+        return result.first()
+
+    async def exists_by_email(self, email: str) -> bool:
+        statement = select(Member.id).where(Member.email == email)
+        result = await self.db.exec(statement)
+        return result.first() is not None
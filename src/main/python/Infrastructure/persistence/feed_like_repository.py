@@ -1,7 +1,9 @@
-from typing import Optional
+from datetime import datetime, timezone, timedelta
+from typing import Optional, List, Set, Dict, Tuple
 
-from sqlmodel import Session, select, func
+from sqlmodel import Session, select, func, update, insert, delete, case, tuple_
 
+from src.main.python.domain.model.feed.feed import Feed
 from src.main.python.domain.model.feed.feed_like import FeedLike
 from src.main.python.domain.repository.feed_like_interface import IFeedLikeRepository
 
@@ -12,13 +14,64 @@ class FeedLikeRepository(IFeedLikeRepository):
 
     def save(self, feed_like: FeedLike) -> FeedLike:
         self.db.add(feed_like)
-        self.db.commit()
-        self.db.refresh(feed_like)
+        self.db.flush()
+        self._change_feed_likes(feed_like.feed_id, 1)
         return feed_like
 
     def delete(self, feed_like: FeedLike):
         self.db.delete(feed_like)
-        self.db.commit()
+        self.db.flush()
+        self._change_feed_likes(feed_like.feed_id, -1)
+
+    def _change_feed_likes(self, feed_id: int, delta: int):
+        # feeds.likes 비정규화 카운터를 같은 트랜잭션에서 DB 증감 연산으로 갱신 (read-modify-write 없음)
+        statement = update(Feed).where(Feed.id == feed_id).values(likes=Feed.likes + delta)
+        if delta < 0:
+            statement = statement.where(Feed.likes >= -delta)
+        self.db.exec(statement)
+
+    def save_all(self, pairs: List[Tuple[int, int]]):
+        # (feed_id, member_id) 목록을 한 번의 multi-row INSERT 로 저장하고 카운터를 함께 갱신 (커밋은 호출자)
+        if not pairs:
+            return
+        now = datetime.now(timezone.utc) + timedelta(hours=9)
+        self.db.exec(insert(FeedLike).values([
+            {"feed_id": feed_id, "member_id": member_id, "created_at": now} for feed_id, member_id in pairs
+        ]))
+        self._change_feed_likes_bulk(self._count_per_feed(pairs, 1))
+
+    def delete_all(self, pairs: List[Tuple[int, int]]):
+        # (feed_id, member_id) 목록을 한 번의 DELETE 로 삭제하고 카운터를 함께 갱신 (커밋은 호출자)
+        if not pairs:
+            return
+        self.db.exec(delete(FeedLike).where(tuple_(FeedLike.feed_id, FeedLike.member_id).in_(pairs)))
+        self._change_feed_likes_bulk(self._count_per_feed(pairs, -1))
+
+    @staticmethod
+    def _count_per_feed(pairs: List[Tuple[int, int]], sign: int) -> Dict[int, int]:
+        deltas: Dict[int, int] = {}
+        for feed_id, _ in pairs:
+            deltas[feed_id] = deltas.get(feed_id, 0) + sign
+        return deltas
+
+    def _change_feed_likes_bulk(self, deltas: Dict[int, int]):
+        statement = (update(Feed)
+                     .where(Feed.id.in_(list(deltas.keys())))
+                     .values(likes=Feed.likes + case(deltas, value=Feed.id, else_=0)))
+        self.db.exec(statement)
+
+    def find_existing_pairs(self, pairs: List[Tuple[int, int]]) -> Set[Tuple[int, int]]:
+        if not pairs:
+            return set()
+        statement = (select(FeedLike.feed_id, FeedLike.member_id)
+                     .where(tuple_(FeedLike.feed_id, FeedLike.member_id).in_(pairs)))
+        return {(feed_id, member_id) for feed_id, member_id in self.db.exec(statement).all()}
+
+    def find_by_pairs(self, pairs: List[Tuple[int, int]]) -> List[FeedLike]:
+        if not pairs:
+            return []
+        statement = select(FeedLike).where(tuple_(FeedLike.feed_id, FeedLike.member_id).in_(pairs))
+        return list(self.db.exec(statement).all())
 
     def find_by_feed_id_and_member_id(self, feed_id: int, member_id: int) -> Optional[FeedLike]:
         statement = select(FeedLike).where(FeedLike.feed_id == feed_id, FeedLike.member_id == member_id)
@@ -29,6 +82,20 @@ class FeedLikeRepository(IFeedLikeRepository):
         result = self.db.exec(statement).first() is not None
         return result
 
+    def find_liked_feed_ids(self, feed_ids: List[int], member_id: int) -> Set[int]:
+        if not feed_ids:
+            return set()
+        statement = select(FeedLike.feed_id).where(FeedLike.feed_id.in_(feed_ids), FeedLike.member_id == member_id)
+        return set(self.db.exec(statement).all())
+
+    def count_by_feed_ids(self, feed_ids: List[int]) -> Dict[int, int]:
+        if not feed_ids:
+            return {}
+        statement = (select(FeedLike.feed_id, func.count())
+                     .where(FeedLike.feed_id.in_(feed_ids))
+                     .group_by(FeedLike.feed_id))
+        return {feed_id: count for feed_id, count in self.db.exec(statement).all()}
+
     def count_by_feed_id(self, feed_id: int) -> int:
         statement = select(func.count()).select_from(FeedLike).where(FeedLike.feed_id == feed_id)
         result = self.db.exec(statement).scalar_one()
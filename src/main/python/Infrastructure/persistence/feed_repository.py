@@ -1,8 +1,13 @@
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Tuple, Dict
 
-from sqlmodel import Session, select, func
+from sqlalchemy import String, cast
+from sqlmodel import Session, select, update, case, func
 
+from src.main.python.Infrastructure.persistence import feed_statements
 from src.main.python.domain.model.feed.feed import Feed
+from src.main.python.domain.model.feed.feed_like import FeedLike
+from src.main.python.domain.model.feed.feed_summary import FeedSummary
 from src.main.python.domain.repository.feed_repository_interface import IFeedRepository
 
 
@@ -12,35 +17,81 @@ class FeedRepository(IFeedRepository):
 
     def save(self, feed: Feed) -> Feed:
         self.db.add(feed)
-        self.db.commit()
-        self.db.refresh(feed)
+        self.db.flush()
         return feed
 
     def find_by_id(self, feed_id: int) -> Optional[Feed]:
-        statement = select(Feed).where(Feed.id == feed_id, Feed.displayed == True)
-        result = self.db.exec(statement).first()
+        result = self.db.exec(feed_statements.find_by_id_statement(feed_id)).first()
         return result
 
     def find_by_user_id(self, user_id: int) -> Optional[Feed]:
-        statement = select(Feed).where(Feed.user_id == user_id, Feed.displayed == True)
+        statement = select(Feed).where(Feed.member_id == user_id, Feed.displayed == True)
         result = self.db.exec(statement).first()
         return result
 
-    def paginate(self, offset: int, limit: int, feed_type: Optional[str] = None, member_id: Optional[int] = None) -> List[Feed]:
-        statement = select(Feed).where(Feed.displayed == True)
-        if feed_type:
-            statement = statement.where(Feed.type == feed_type)
-        if member_id:
-            statement = statement.where(Feed.user_id == member_id)
-        statement = statement.offset(offset).limit(limit).order_by(Feed.created_at.desc())
-        results = self.db.exec(statement)
-        return results
-
-    def count(self, feed_type: Optional[str], member_id: Optional[str]) -> int:
-        statement = select(func.count()).select_from(Feed).where(Feed.displayed == True)
-        if feed_type:
-            statement = statement.where(Feed.feed_type == feed_type)
-        if member_id:
-            statement = statement.where(Feed.member_id == member_id)
-        total = self.db.exec(statement).one()
+    def paginate(self, offset: int, limit: int, feed_type: Optional[str] = None, member_id: Optional[int] = None) -> List[FeedSummary]:
+        rows = self.db.exec(feed_statements.paginate_statement(offset, limit, feed_type, member_id))
+        return [FeedSummary(*row) for row in rows]
+
+    def paginate_with_total(self, offset: int, limit: int, feed_type: Optional[str] = None,
+                            member_id: Optional[int] = None) -> Tuple[List[FeedSummary], Optional[int]]:
+        statement = feed_statements.paginate_with_total_statement(offset, limit, feed_type, member_id)
+        rows = self.db.exec(statement).all()
+        if not rows:
+            return [], None
+        return [FeedSummary(*row[:-1]) for row in rows], rows[0][-1]
+
+    def paginate_by_cursor(self, cursor_created_at: Optional[datetime], cursor_id: Optional[int], limit: int,
+                           feed_type: Optional[str] = None, member_id: Optional[int] = None) -> List[FeedSummary]:
+        statement = feed_statements.paginate_by_cursor_statement(cursor_created_at, cursor_id, limit, feed_type,
+                                                                 member_id)
+        return [FeedSummary(*row) for row in self.db.exec(statement)]
+
+    def find_existing_ids(self, feed_ids: List[int]) -> List[int]:
+        if not feed_ids:
+            return []
+        statement = select(Feed.id).where(Feed.id.in_(feed_ids), Feed.displayed == True)
+        return list(self.db.exec(statement).all())
+
+    def find_like_counters(self, after_id: int, limit: int) -> List[Tuple[int, int]]:
+        statement = select(Feed.id, Feed.likes).where(Feed.id > after_id).order_by(Feed.id).limit(limit)
+        return list(self.db.exec(statement).all())
+
+    def recount_likes(self, feed_ids: List[int]):
+        # 읽은 값을 다시 쓰지 않고 한 문장 안에서 센 값으로 갱신 (COUNT 와 UPDATE 사이에 들어온 좋아요를 덮어쓰지 않음)
+        if not feed_ids:
+            return
+        actual = (
+            select(func.count()).select_from(FeedLike).where(FeedLike.feed_id == Feed.id)
+            .correlate(Feed).scalar_subquery()
+        )
+        self.db.exec(update(Feed).where(Feed.id.in_(feed_ids)).values(likes=actual))
+
+    def increase_views_bulk(self, counts: Dict[int, int]):
+        # UPDATE feeds SET views = views + CASE id WHEN .. THEN .. END WHERE id IN (..)
+        if not counts:
+            return
+        statement = (update(Feed)
+                     .where(Feed.id.in_(list(counts.keys())))
+                     .values(views=Feed.views + case(counts, value=Feed.id, else_=0)))
+        self.db.exec(statement)
+
+    def count(self, feed_type: Optional[str], member_id: Optional[int]) -> int:
+        total = self.db.exec(feed_statements.count_statement(feed_type, member_id)).one()
         return total[0] if isinstance(total, tuple) else total
+
+    def references_image(self, file_path: str) -> bool:
+        # images 는 JSON 배열이므로 문자열로 바꿔 포함 여부 확인 (GC 에서 삭제 후보만 확인하므로 전체 스캔 허용)
+        statement = (select(Feed.id)
+                     .where(Feed.displayed == True, cast(Feed.images, String).contains(file_path, autoescape=True))
+                     .limit(1))
+        return self.db.exec(statement).first() is not None
+
+    def find_image_paths(self, after_id: int, limit: int) -> List[Tuple[int, List[str]]]:
+        # 소프트 삭제된 피드도 파일을 보관하므로 모두 대상
+        statement = select(Feed.id, Feed.images).where(Feed.id > after_id).order_by(Feed.id).limit(limit)
+        return list(self.db.exec(statement).all())
+
+    def update_image_paths(self, feed_id: int, images: List[str]):
+        self.db.exec(update(Feed).where(Feed.id == feed_id)
+                     .values(images=images, cover_image=images[0] if images else None))
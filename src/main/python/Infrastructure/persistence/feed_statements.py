@@ -0,0 +1,66 @@
+"""
+피드 조회 쿼리 빌더
+
+동기(FeedRepository) / 비동기(AsyncFeedRepository) 리포지토리가 같은 SQL 을 사용하도록 구문 생성만 담당합니다.
+"""
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy.orm import joinedload
+from sqlmodel import select, func, or_, and_
+
+from src.main.python.domain.model.feed.feed import Feed
+from src.main.python.domain.model.feed.feed_type import FeedType
+from src.main.python.domain.model.user.member import Member
+
+# 목록 조회 컬럼 (FeedSummary 생성자 인자 순서와 동일)
+SUMMARY_COLUMNS = (
+    Feed.id, Feed.feed_type, Feed.cover_image, Feed.content, Feed.likes, Feed.views, Feed.created_at,
+    Member.nickname, Member.profile_image,
+)
+
+
+def find_by_id_statement(feed_id: int):
+    return select(Feed).options(joinedload(Feed.member)).where(Feed.id == feed_id, Feed.displayed == True)
+
+
+def summary_statement(*extra_columns):
+    # 목록에 필요한 컬럼만 조회하고 작성자 컬럼은 조인으로 함께 가져옴 (Feed/Member 엔티티 로딩 없음)
+    return select(*SUMMARY_COLUMNS, *extra_columns).join(Member, Member.id == Feed.member_id)
+
+
+def paginate_statement(offset: int, limit: int, feed_type: Optional[str], member_id: Optional[int]):
+    statement = filter_statement(summary_statement(), feed_type, member_id)
+    return statement.order_by(Feed.created_at.desc(), Feed.id.desc()).offset(offset).limit(limit)
+
+
+def paginate_with_total_statement(offset: int, limit: int, feed_type: Optional[str], member_id: Optional[int]):
+    # COUNT(*) OVER () 로 페이지와 전체 개수를 한 번의 쿼리로 조회
+    total_column = func.count().over().label("total")
+    statement = filter_statement(summary_statement(total_column), feed_type, member_id)
+    return statement.order_by(Feed.created_at.desc(), Feed.id.desc()).offset(offset).limit(limit)
+
+
+def paginate_by_cursor_statement(cursor_created_at: Optional[datetime], cursor_id: Optional[int], limit: int,
+                                 feed_type: Optional[str], member_id: Optional[int]):
+    statement = filter_statement(summary_statement(), feed_type, member_id)
+    if cursor_created_at is not None and cursor_id is not None:
+        # (created_at, id) < (cursor_created_at, cursor_id) 를 인덱스가 탈 수 있는 형태로 풀어서 작성
+        statement = statement.where(or_(
+            Feed.created_at < cursor_created_at,
+            and_(Feed.created_at == cursor_created_at, Feed.id < cursor_id),
+        ))
+    return statement.order_by(Feed.created_at.desc(), Feed.id.desc()).limit(limit)
+
+
+def count_statement(feed_type: Optional[str], member_id: Optional[int]):
+    return filter_statement(select(func.count()).select_from(Feed), feed_type, member_id)
+
+
+def filter_statement(statement, feed_type: Optional[str], member_id: Optional[int]):
+    statement = statement.where(Feed.displayed == True)
+    if feed_type:
+        statement = statement.where(Feed.feed_type == FeedType.from_value(feed_type))
+    if member_id:
+        statement = statement.where(Feed.member_id == member_id)
+    return statement
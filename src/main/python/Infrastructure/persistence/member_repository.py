@@ -1,5 +1,5 @@
-from typing import Optional
-from sqlmodel import Session, select
+from typing import List, Optional, Tuple
+from sqlmodel import Session, select, update
 
 from src.main.python.domain.model.user.member import Member
 from src.main.python.domain.repository.member_repository_interface import IMemberRepository
@@ -11,8 +11,7 @@ class MemberRepository(IMemberRepository):
 
     def save(self, member: Member) -> Member:
         self.db.add(member)
-        self.db.commit()
-        self.db.refresh(member)
+        self.db.flush()
         return member
 
     def find_by_id(self, member_id: int) -> Optional[Member]:
@@ -34,3 +33,15 @@ class MemberRepository(IMemberRepository):
         statement = select(Member.id).where(Member.email == email)
         result = self.db.exec(statement).first()
         return result is not None
+
+    def references_image(self, file_path: str) -> bool:
+        statement = select(Member.id).where(Member.profile_image == file_path, Member.displayed == True).limit(1)
+        return self.db.exec(statement).first() is not None
+
+    def find_profile_images(self, after_id: int, limit: int) -> List[Tuple[int, Optional[str]]]:
+        statement = (select(Member.id, Member.profile_image)
+                     .where(Member.id > after_id).order_by(Member.id).limit(limit))
+        return list(self.db.exec(statement).all())
+
+    def update_profile_image(self, member_id: int, profile_image: str):
+        self.db.exec(update(Member).where(Member.id == member_id).values(profile_image=profile_image))
@@ -0,0 +1,192 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session
+
+from src.main.python.Infrastructure.persistence.feed_like_repository import FeedLikeRepository
+from src.main.python.Infrastructure.persistence.feed_repository import FeedRepository
+from src.main.python.core.exception.error_message import ErrorMessage
+from src.main.python.domain.model.feed.feed_like import FeedLike
+
+logger = logging.getLogger(__name__)
+
+LIKE = "like"
+UNLIKE = "unlike"
+
+
+class _LikeEvent:
+    __slots__ = ("action", "feed_id", "member_id", "future")
+
+    def __init__(self, action: str, feed_id: int, member_id: int):
+        self.action = action
+        self.feed_id = feed_id
+        self.member_id = member_id
+        self.future: Future = Future()
+
+
+class FeedLikeWritePipeline:
+    """
+    좋아요/좋아요 취소 그룹 커밋 파이프라인
+
+    - 요청 스레드는 이벤트를 큐에 넣고 Future 결과를 기다립니다.
+    - 워커 스레드는 window_seconds 동안 모인 이벤트를 (feed_id, member_id) 별로 순서대로 적용해
+      최종 상태만 계산한 뒤, 한 번의 multi-row INSERT / DELETE 와 한 번의 커밋으로 반영합니다.
+    - 각 이벤트의 결과(성공, 이미 좋아요, 좋아요 없음, 피드 없음)는 순차 처리했을 때와 같습니다.
+    - 커밋 후 좋아요/취소한 회원마다 mark_writer 를 호출합니다. (read-your-writes 구간 시작)
+    - 커밋 후 좋아요 수가 바뀐 피드 id 들로 likes_changed 를 호출합니다. (목록 캐시 갱신)
+    """
+
+    def __init__(self, session_factory: Callable[[], Session], window_seconds: float = 0.005,
+                 max_batch: int = 500, mark_writer: Optional[Callable[[str], None]] = None,
+                 likes_changed: Optional[Callable[[Set[int]], None]] = None):
+        self._session_factory = session_factory
+        self._mark_writer = mark_writer
+        self._likes_changed = likes_changed
+        self._window_seconds = window_seconds
+        self._max_batch = max_batch
+        self._queue: "queue.Queue[Optional[_LikeEvent]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    def submit(self, action: str, feed_id: int, member_id: int) -> Future:
+        self._ensure_started()
+        event = _LikeEvent(action, feed_id, member_id)
+        self._queue.put(event)
+        return event.future
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="feed-like-pipeline", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            event = self._queue.get()
+            if event is None:
+                break
+            batch = [event]
+            deadline = time.monotonic() + self._window_seconds
+            while len(batch) < self._max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    event = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if event is None:
+                    stopping = True
+                    break
+                batch.append(event)
+            self._apply(batch)
+
+    def _apply(self, batch: List[_LikeEvent]):
+        try:
+            results = self._commit(batch)
+        except IntegrityError:
+            # 조회 후 INSERT 전에 다른 워커 프로세스가 같은 (feed_id, member_id) 를 먼저 저장한 경우
+            # 배치 전체를 실패시키지 않고 이벤트를 하나씩 다시 적용 (각 이벤트가 최신 상태를 다시 조회)
+            logger.warning("feed like batch conflicted, applying events one by one - size: %d", len(batch))
+            for event in batch:
+                self._apply_one(event)
+            return
+        except Exception as exc:
+            logger.exception("feed like batch failed - size: %d", len(batch))
+            self._resolve([(event, exc, None) for event in batch])
+            return
+        self._resolve(results)
+
+    def _apply_one(self, event: _LikeEvent):
+        try:
+            results = self._commit([event])
+        except IntegrityError:
+            # 단건에서도 충돌하면 그 사이 다른 프로세스가 좋아요를 저장한 것 (순차 처리 결과와 같음)
+            results = [(event, ValueError(ErrorMessage.FEED_LIKE_ALREADY_EXISTS.value), None)]
+        except Exception as exc:
+            logger.exception("feed like event failed")
+            results = [(event, exc, None)]
+        self._resolve(results)
+
+    def _commit(self, batch: List[_LikeEvent]) -> List[Tuple[_LikeEvent, Optional[Exception], Optional[FeedLike]]]:
+        """
+        이벤트를 순서대로 적용한 최종 상태를 한 번에 저장하고 커밋한 뒤 (이벤트, 오류, 결과) 목록을 반환합니다.
+        좋아요 결과는 커밋된 행이고, 같은 배치에서 다시 취소된 좋아요와 좋아요 취소의 결과는 None 입니다.
+        """
+        keys = list(dict.fromkeys((event.feed_id, event.member_id) for event in batch))
+        with self._session_factory() as session:
+            feed_like_repository = FeedLikeRepository(session)
+            feed_ids = set(FeedRepository(session).find_existing_ids(list({key[0] for key in keys})))
+            existing = feed_like_repository.find_existing_pairs(keys)
+
+            state: Dict[Tuple[int, int], bool] = {key: key in existing for key in keys}
+            errors = []
+            last_like: Dict[Tuple[int, int], _LikeEvent] = {}
+            for event in batch:
+                key = (event.feed_id, event.member_id)
+                error = self._transition(event, state, key, feed_ids)
+                errors.append(error)
+                if error is None and event.action == LIKE:
+                    last_like[key] = event
+
+            feed_like_repository.save_all([key for key in keys if state[key] and key not in existing])
+            feed_like_repository.delete_all([key for key in keys if not state[key] and key in existing])
+
+            # 최종 상태가 좋아요인 키의 저장된 행을 조회하고, 커밋 후에도 읽을 수 있도록 세션에서 분리
+            liked = feed_like_repository.find_by_pairs([key for key, event in last_like.items() if state[key]])
+            for feed_like in liked:
+                session.expunge(feed_like)
+            session.commit()
+
+        rows = {(feed_like.feed_id, feed_like.member_id): feed_like for feed_like in liked}
+        return [
+            (event, error, rows.get((event.feed_id, event.member_id))
+             if last_like.get((event.feed_id, event.member_id)) is event else None)
+            for event, error in zip(batch, errors)
+        ]
+
+    def _resolve(self, results: List[Tuple[_LikeEvent, Optional[Exception], Optional[FeedLike]]]):
+        if self._mark_writer is not None:
+            for member_id in {event.member_id for event, error, _ in results if error is None}:
+                self._mark_writer(str(member_id))
+        feed_ids = {event.feed_id for event, error, _ in results if error is None}
+        if self._likes_changed is not None and feed_ids:
+            self._likes_changed(feed_ids)
+        for event, error, feed_like in results:
+            # 요청 쪽에서 취소한 Future 는 건너뜀
+            if not event.future.set_running_or_notify_cancel():
+                continue
+            if error is not None:
+                event.future.set_exception(error)
+            else:
+                event.future.set_result(feed_like)
+
+    @staticmethod
+    def _transition(event: _LikeEvent, state: Dict[Tuple[int, int], bool], key: Tuple[int, int],
+                    feed_ids: set) -> Optional[Exception]:
+        if event.action == LIKE:
+            if event.feed_id not in feed_ids:
+                return ValueError(ErrorMessage.FEED_NOT_FOUND.value)
+            if state[key]:
+                return ValueError(ErrorMessage.FEED_LIKE_ALREADY_EXISTS.value)
+            state[key] = True
+            return None
+        if not state[key]:
+            return ValueError(ErrorMessage.FEED_LIKE_NOT_FOUND.value)
+        state[key] = False
+        return None
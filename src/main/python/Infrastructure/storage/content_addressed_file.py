@@ -0,0 +1,169 @@
+import fcntl
+import hashlib
+import os
+import shutil
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+from src.main.python.core.exception.error_message import ErrorMessage
+from src.main.python.Infrastructure.storage.image_processing import ImageProcessingPool
+from src.main.python.Infrastructure.storage.image_variants import IMAGE_VARIANTS, STORED_IMAGE_EXTENSION, variant_path
+from src.main.python.Infrastructure.storage.local_file import LocalFileStorage
+
+
+class ContentAddressedFileStorage(LocalFileStorage):
+    """
+    내용 주소 기반 저장소 (FILE_STORAGE_MODE=content)
+
+    - 확정(confirm_file)된 이미지는 정규화된 JPEG 원본의 sha256 으로 objects/ab/cd/<hash>.jpeg 에 저장합니다.
+      같은 이미지를 여러 번 올려도(재게시, 같은 프로필 사진 재업로드) 파일은 하나만 남습니다. (context 와 무관하게 공유)
+    - 파일마다 <hash>.jpeg.refs 에 참조 수를 두고 flock 으로 보호합니다. (여러 워커 프로세스에서 안전)
+      confirm_file 이 1 증가, release_file(피드/회원 삭제, 이미지 교체) 이 1 감소시킵니다.
+    - 참조 수가 0 이 된 파일은 바로 지우지 않고 collect_garbage 가 정리합니다.
+    """
+
+    _HASH_CHUNK_SIZE = 1024 * 1024
+    _UNSHARDED_DIRS = ("temp", "objects")
+
+    def __init__(self, base_dir: Optional[str] = None, image_pool: Optional[ImageProcessingPool] = None):
+        super().__init__(base_dir, image_pool)
+        self._objects_dir = os.path.join(self._base_dir, "objects")
+        os.makedirs(self._objects_dir, exist_ok=True)
+
+    def _content_hash(self, file_path: str) -> str:
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as file:
+            for chunk in iter(lambda: file.read(self._HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _object_path(self, content_hash: str) -> str:
+        return self._layout_path(self._objects_dir, content_hash + STORED_IMAGE_EXTENSION)
+
+    def _is_object(self, file_path: Optional[str]) -> bool:
+        if not file_path or "://" in file_path:
+            return False
+        objects_dir = os.path.abspath(self._objects_dir)
+        return os.path.commonpath([os.path.abspath(file_path), objects_dir]) == objects_dir
+
+    @contextmanager
+    def _locked_refs(self, object_path: str):
+        # 참조 수 파일을 잠근 채로 (참조 수 파일 객체) 를 돌려줌
+        # GC 가 잠금 대기 중에 파일을 지웠을 수 있으므로, 잠근 파일이 아직 경로에 있는 파일인지 확인하고 아니면 다시 엶
+        refs_path = object_path + ".refs"
+        while True:
+            file = open(refs_path, "a+")
+            try:
+                fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+                try:
+                    current = os.stat(refs_path)
+                except FileNotFoundError:
+                    current = None
+                if current is not None and current.st_ino == os.fstat(file.fileno()).st_ino:
+                    yield file
+                    return
+            finally:
+                file.close()
+
+    @staticmethod
+    def _read_count(refs) -> int:
+        refs.seek(0)
+        value = refs.read().strip()
+        return int(value) if value else 0
+
+    @staticmethod
+    def _write_count(refs, count: int):
+        refs.seek(0)
+        refs.truncate()
+        refs.write(str(count))
+        refs.flush()
+
+    def confirm_file(self, temp_path: str, context: str) -> str:
+        if not os.path.exists(temp_path):
+            raise FileNotFoundError(ErrorMessage.FILE_NOT_FOUND)
+
+        object_path = self._object_path(self._content_hash(temp_path))
+        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+        with self._locked_refs(object_path) as refs:
+            if os.path.exists(object_path):
+                # 같은 내용이 이미 있으면 임시 파일은 버리고 기존 파일을 참조
+                self._remove_with_variants(temp_path)
+            else:
+                for variant in IMAGE_VARIANTS:
+                    temp_variant_path = variant_path(temp_path, variant.name)
+                    if os.path.exists(temp_variant_path):
+                        shutil.move(temp_variant_path, variant_path(object_path, variant.name))
+                # 원본을 마지막에 옮겨, 원본이 보이면 파생본도 모두 있는 상태가 되게 함
+                shutil.move(temp_path, object_path)
+            self._write_count(refs, self._read_count(refs) + 1)
+        return object_path
+
+    def revert_to_temp(self, file_path: str) -> str:
+        # 다른 참조가 남아 있을 수 있으므로 옮기지 않고 임시 디렉터리로 복사한 뒤 참조를 반납
+        if not self._is_object(file_path):
+            return super().revert_to_temp(file_path)
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(ErrorMessage.FILE_NOT_FOUND)
+
+        temp_path = os.path.join(self._temp_dir, self._generate_unique_filename(STORED_IMAGE_EXTENSION, self._temp_dir))
+        for variant in IMAGE_VARIANTS:
+            object_variant_path = variant_path(file_path, variant.name)
+            if os.path.exists(object_variant_path):
+                shutil.copyfile(object_variant_path, variant_path(temp_path, variant.name))
+        shutil.copyfile(file_path, temp_path)
+        self.release_file(file_path)
+        return temp_path
+
+    def release_file(self, file_path: Optional[str]):
+        # objects 밖의 파일(기존 uuid 업로드, 외부 URL 등)은 참조 수 관리 대상이 아님
+        if not self._is_object(file_path):
+            return
+        with self._locked_refs(file_path) as refs:
+            self._write_count(refs, max(self._read_count(refs) - 1, 0))
+
+    def collect_garbage(self, is_referenced: Optional[Callable[[str], bool]] = None) -> int:
+        """
+        참조 수가 0 인 파일과 파생본, 참조 수 파일을 지우고 지운 파일 수를 돌려줍니다.
+        is_referenced 가 주어지면 지우기 전에 한 번 더 확인합니다.
+        (참조 반납 후 트랜잭션이 롤백되어 참조 수가 실제보다 작아진 경우 보호, 참조 수는 1 로 복구)
+        """
+        removed = 0
+        for directory, _, names in os.walk(self._objects_dir):
+            for name in names:
+                if not name.endswith(".refs"):
+                    continue
+                object_path = os.path.join(directory, name[:-len(".refs")])
+                with self._locked_refs(object_path) as refs:
+                    if self._read_count(refs) > 0:
+                        continue
+                    if is_referenced is not None and is_referenced(object_path):
+                        self._write_count(refs, 1)
+                        continue
+                    self._remove_with_variants(object_path)
+                    os.remove(object_path + ".refs")
+                    removed += 1
+        return removed
+
+    def _relocation_target(self, file_path: Optional[str]) -> Optional[str]:
+        # objects/<hash>.jpeg (샤딩 전) → objects/ab/cd/<hash>.jpeg
+        if self._shard_depth > 0 and self._is_object(file_path) \
+                and os.path.dirname(os.path.abspath(file_path)) == os.path.abspath(self._objects_dir):
+            return self._layout_path(os.path.dirname(file_path), os.path.basename(file_path))
+        return super()._relocation_target(file_path)
+
+    def remove_previous_layout(self) -> int:
+        # 평면 배치 객체의 참조 수를 샤딩 위치로 합친 뒤 지움 (참조 수 파일은 옮기지 않고 이 단계에서 합침)
+        removed = 0
+        for name in os.listdir(self._objects_dir):
+            if not name.endswith(".refs"):
+                continue
+            object_path = os.path.join(self._objects_dir, name[:-len(".refs")])
+            target = self._layout_path(self._objects_dir, os.path.basename(object_path))
+            if not os.path.exists(target):
+                continue
+            with self._locked_refs(target) as target_refs, self._locked_refs(object_path) as refs:
+                self._write_count(target_refs, self._read_count(target_refs) + self._read_count(refs))
+                self._remove_with_variants(object_path)
+                os.remove(object_path + ".refs")
+            removed += 1
+        return removed + super().remove_previous_layout()
@@ -0,0 +1,237 @@
+import logging
+import multiprocessing
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from PIL import Image
+
+from src.main.python.core.exception.error_message import ErrorMessage
+from src.main.python.domain.storage.exceptions import ImageProcessingBusyError
+from src.main.python.Infrastructure.monitoring.metrics import (
+    image_processing_duration, image_processing_queue_wait, image_processing_rejected
+)
+from src.main.python.Infrastructure.storage.image_variants import (
+    IMAGE_MAX_PIXELS, IMAGE_MAX_SIDE, IMAGE_REDUCING_GAP, IMAGE_VARIANTS, variant_path
+)
+
+logger = logging.getLogger(__name__)
+
+ORIGINAL_IMAGE_QUALITY = 85
+
+# Pillow 자체 압축 폭탄 검사도 같은 한도로 맞춤 (워커 프로세스에도 임포트 시 적용)
+Image.MAX_IMAGE_PIXELS = IMAGE_MAX_PIXELS
+
+
+def _save_variants(image: Image.Image, file_path: str):
+    # IMAGE_VARIANTS 는 큰 것부터 정렬되어 있으므로 직전 결과를 다시 축소
+    resized = image
+    for variant in IMAGE_VARIANTS:
+        destination_path = variant_path(file_path, variant.name)
+        if max(resized.size) > variant.max_side:
+            resized = resized.copy()
+            resized.thumbnail((variant.max_side, variant.max_side), Image.Resampling.LANCZOS)
+        elif resized is image and variant.quality >= ORIGINAL_IMAGE_QUALITY:
+            # 축소가 필요 없고 품질도 원본 이상이면 다시 인코딩하지 않고 원본 파일을 복사
+            shutil.copyfile(file_path, destination_path)
+            continue
+        resized.save(destination_path, format="JPEG", quality=variant.quality)
+
+
+def check_image_header(source_path: str):
+    """
+    헤더만 읽어(디코딩 없이) 이미지 여부와 픽셀 수를 확인합니다.
+    대기열 슬롯을 쓰기 전에 요청 스레드에서 호출해 압축 폭탄을 거릅니다.
+    """
+    try:
+        with Image.open(source_path) as opened:
+            width, height = opened.size
+    except Image.DecompressionBombError:
+        raise ValueError(ErrorMessage.FILE_IMAGE_TOO_MANY_PIXELS.value)
+    except Exception:
+        raise ValueError(ErrorMessage.FILE_INVALID_IMAGE.value)
+    if width * height > IMAGE_MAX_PIXELS:
+        raise ValueError(ErrorMessage.FILE_IMAGE_TOO_MANY_PIXELS.value)
+
+
+def _decode_scaled(source_path: str) -> Image.Image:
+    """긴 변이 IMAGE_MAX_SIDE 이하인 RGB 이미지로 디코딩 (큰 이미지를 원본 해상도로 펼치지 않음)"""
+    with Image.open(source_path) as opened:
+        scale = min(1.0, IMAGE_MAX_SIDE / max(opened.size))
+        # JPEG 은 DCT 단계에서 1/2 ~ 1/8 로 줄여 디코딩 (결과는 요청 크기 이상, 다른 형식은 영향 없음)
+        opened.draft("RGB", (int(opened.width * scale), int(opened.height * scale)))
+        opened.load()
+        # 이미 RGB 면 변환 복사본을 만들지 않음
+        image = opened if opened.mode == "RGB" else opened.convert("RGB")
+    # 남은 배율은 reduce(정수배 박스 축소) 후 LANCZOS 로 마무리
+    image.thumbnail((IMAGE_MAX_SIDE, IMAGE_MAX_SIDE), Image.Resampling.LANCZOS, reducing_gap=IMAGE_REDUCING_GAP)
+    return image
+
+
+def process_upload(source_path: str, file_path: str):
+    """
+    업로드 원본(source_path)을 디코딩해 file_path 에 JPEG 원본과 파생본을 저장합니다.
+    워커 프로세스에서 실행되므로 모듈 최상위 함수로 두고 인자는 경로만 받습니다. (바이트를 피클링하지 않음)
+    """
+    try:
+        image = _decode_scaled(source_path)
+    except Image.DecompressionBombError:
+        raise ValueError(ErrorMessage.FILE_IMAGE_TOO_MANY_PIXELS.value)
+    except Exception:
+        raise ValueError(ErrorMessage.FILE_INVALID_IMAGE.value)
+
+    image.save(file_path, format="JPEG", quality=ORIGINAL_IMAGE_QUALITY)
+    _save_variants(image, file_path)
+
+
+def _timed_call(func: Callable, *args) -> Tuple[Any, float]:
+    # 작업 시간은 워커 안에서 재야 대기열 대기 시간과 분리됨
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+class ImageProcessingPool:
+    """
+    이미지 디코딩/리사이즈/인코딩 전용 프로세스 풀
+
+    - Pillow 작업이 요청 스레드에서 GIL 을 오래 잡지 않도록 코어 수만큼의 워커 프로세스에서 실행합니다.
+    - 처리 중 + 대기 중 작업 수를 max_pending 으로 제한하고, 가득 차면 ImageProcessingBusyError 를 던집니다.
+      (업로드가 몰려도 메모리에 작업이 쌓이지 않고 503 + Retry-After 로 응답)
+    - 워커 프로세스는 첫 작업 때 만듭니다. (임포트/앱 시작 시점에 프로세스를 띄우지 않음)
+    - workers 가 0 이면 호출한 스레드에서 바로 실행합니다. (개발/디버깅용, 대기열 제한은 그대로 적용)
+    """
+
+    def __init__(self, workers: int, max_pending: int, timeout: float, retry_after: int,
+                 start_method: str = "spawn"):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self._start_method = start_method
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[Executor] = None
+
+    @classmethod
+    def from_env(cls) -> "ImageProcessingPool":
+        workers = int(os.getenv("IMAGE_PROCESS_WORKERS", str(os.cpu_count() or 1)))
+        max_pending = int(os.getenv("IMAGE_PROCESS_QUEUE_SIZE", str(max(workers, 1) * 4)))
+        return cls(
+            workers=workers,
+            max_pending=max_pending,
+            timeout=float(os.getenv("IMAGE_PROCESS_TIMEOUT", "30")),
+            retry_after=int(os.getenv("IMAGE_PROCESS_RETRY_AFTER", "2")),
+            # fork 는 부모의 스레드/락 상태를 복사하므로 기본값은 spawn
+            start_method=os.getenv("IMAGE_PROCESS_START_METHOD", "spawn"),
+        )
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers, mp_context=multiprocessing.get_context(self._start_method)
+                    )
+        return self._executor
+
+    def _acquire(self):
+        if not self._slots.acquire(blocking=False):
+            image_processing_rejected.labels("queue_full").inc()
+            raise ImageProcessingBusyError(self.retry_after)
+        with self._lock:
+            self._pending += 1
+
+    def _release(self, _future: Optional[Future] = None):
+        with self._lock:
+            self._pending -= 1
+        self._slots.release()
+
+    def run(self, operation: str, func: Callable, *args, cleanup: Optional[Callable[[], None]] = None,
+            discard: Optional[Callable[[], None]] = None) -> Any:
+        """
+        func(*args) 를 워커 프로세스에서 실행하고 결과를 돌려줍니다. (func 와 인자는 피클링 가능해야 함)
+        func 가 던진 예외(ValueError 등)는 그대로 다시 던집니다.
+
+        - cleanup: 작업이 실제로 끝났거나 실행되지 않게 된 뒤 한 번 호출 (입력 파일 삭제 등)
+          제한 시간이 지나 요청이 먼저 끝나도 실행 중인 작업이 입력을 읽고 있을 수 있으므로 호출한 쪽에서 지우지 않음
+        - discard: 제한 시간이 지나 취소하지 못한(이미 실행 중인) 작업이 끝난 뒤 호출 (아무도 참조하지 않는 결과 파일 삭제)
+        """
+        try:
+            self._acquire()
+        except BaseException:
+            self._call_quietly(cleanup)
+            raise
+        submitted = time.perf_counter()
+
+        if self.workers <= 0:
+            try:
+                result, elapsed = _timed_call(func, *args)
+            finally:
+                self._release()
+                self._call_quietly(cleanup)
+            image_processing_duration.labels(operation).observe(elapsed)
+            return result
+
+        try:
+            future = self._get_executor().submit(_timed_call, func, *args)
+        except BaseException:
+            self._release()
+            self._call_quietly(cleanup)
+            raise
+        # 제한 시간이 지나 요청이 먼저 끝나도 슬롯 반납과 정리는 작업이 실제로 끝날 때 (취소되면 바로) 실행
+        future.add_done_callback(self._release)
+        if cleanup is not None:
+            future.add_done_callback(lambda _: self._call_quietly(cleanup))
+
+        try:
+            result, elapsed = future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            image_processing_rejected.labels("timeout").inc()
+            # 대기열에 있으면 취소하고, 이미 실행 중이면 끝난 뒤 결과를 지움 (끝나 있으면 바로 호출됨)
+            if not future.cancel() and discard is not None:
+                future.add_done_callback(lambda _: self._call_quietly(discard))
+            raise ImageProcessingBusyError(self.retry_after)
+        except BrokenProcessPool:
+            # 워커가 비정상 종료(OOM 등)되면 풀을 버리고 다음 작업에서 새로 만듦
+            self._discard_executor()
+            raise
+
+        image_processing_duration.labels(operation).observe(elapsed)
+        image_processing_queue_wait.labels(operation).observe(max(time.perf_counter() - submitted - elapsed, 0.0))
+        return result
+
+    @staticmethod
+    def _call_quietly(callback: Optional[Callable[[], None]]):
+        # 정리 작업 실패가 요청 결과나 다른 done 콜백을 바꾸지 않도록 로그만 남김
+        if callback is None:
+            return
+        try:
+            callback()
+        except Exception:
+            logger.exception("image processing cleanup failed")
+
+    def _discard_executor(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "pending": self._pending,
+            "capacity": self.max_pending,
+            "workers": self.workers,
+        }
+
+    def shutdown(self):
+        # 워커를 띄운 적이 없으면 아무 것도 하지 않음
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
@@ -0,0 +1,74 @@
+import os
+from typing import List, Optional
+
+
+class ImageVariant:
+    """
+    업로드 시 원본과 함께 만드는 축소 이미지(파생본) 설정
+
+    - name: 파생본 이름 (/file/view?size= 값, 파일 이름 접미사)
+    - max_side: 긴 변 최대 픽셀 (원본이 더 작으면 원본 크기 유지)
+    - quality: JPEG 품질
+    """
+
+    def __init__(self, name: str, max_side: int, quality: int):
+        self.name = name
+        self.max_side = max_side
+        self.quality = quality
+
+    @classmethod
+    def parse_list(cls, spec: str) -> List["ImageVariant"]:
+        # "thumb:160:70,card:640:80" 형식 (이름:긴 변 최대 픽셀:JPEG 품질)
+        variants = []
+        for item in spec.split(","):
+            if not item.strip():
+                continue
+            name, max_side, quality = item.strip().split(":")
+            variants.append(cls(name, int(max_side), int(quality)))
+        # 큰 것부터 만들어 다음 파생본을 직전 결과에서 축소 (원본에서 매번 축소하는 것보다 빠름)
+        return sorted(variants, key=lambda variant: variant.max_side, reverse=True)
+
+
+# 업로드 이미지는 모두 JPEG 로 다시 저장됨
+STORED_IMAGE_EXTENSION = ".jpeg"
+
+DEFAULT_IMAGE_VARIANTS = "thumb:160:70,card:640:80,full:1600:85"
+
+# FILE_IMAGE_VARIANTS 로 파생본 구성을 바꿀 수 있음
+IMAGE_VARIANTS = ImageVariant.parse_list(os.getenv("FILE_IMAGE_VARIANTS", DEFAULT_IMAGE_VARIANTS))
+IMAGE_VARIANT_NAMES = frozenset(variant.name for variant in IMAGE_VARIANTS)
+
+# 원본으로 저장하는 JPEG 의 긴 변 최대 픽셀 (더 큰 업로드는 이 크기로 줄여 디코딩/저장)
+IMAGE_MAX_SIDE = int(os.getenv("FILE_IMAGE_MAX_SIDE", "2048"))
+# 디코딩 전 헤더로 확인하는 최대 픽셀 수 (압축 폭탄 차단)
+IMAGE_MAX_PIXELS = int(os.getenv("FILE_IMAGE_MAX_PIXELS", str(80_000_000)))
+# JPEG 이 아닌 이미지를 reduce 로 줄인 뒤 LANCZOS 로 마무리할 때 남겨 둘 배율 여유 (클수록 품질↑, 메모리↑)
+IMAGE_REDUCING_GAP = float(os.getenv("FILE_IMAGE_REDUCING_GAP", "2.0"))
+# 업로드 요청 본문 / 파일 하나의 최대 바이트 수
+UPLOAD_MAX_BYTES = int(os.getenv("FILE_UPLOAD_MAX_BYTES", str(20 * 1024 * 1024)))
+
+# 목록 이미지 / 작성자 프로필 이미지에 사용할 파생본
+LIST_IMAGE_VARIANT = os.getenv("FILE_LIST_IMAGE_VARIANT", "card")
+PROFILE_IMAGE_VARIANT = os.getenv("FILE_PROFILE_IMAGE_VARIANT", "thumb")
+
+
+def variant_path(file_path: Optional[str], name: str) -> Optional[str]:
+    """
+    원본 경로의 파생본 경로 (/a/b/abc.jpeg → /a/b/abc.thumb.jpeg)
+    업로드로 저장한 JPEG 가 아닌 경로(외부 URL, 소셜 로그인 프로필 이미지 등)는 그대로 돌려줍니다.
+    """
+    if not file_path or "://" in file_path:
+        return file_path
+    root, extension = os.path.splitext(file_path)
+    if extension != STORED_IMAGE_EXTENSION:
+        return file_path
+    return f"{root}.{name}{extension}"
+
+
+def original_path(file_path: str) -> Optional[str]:
+    """파생본 경로이면 원본 경로, 아니면 None"""
+    root, extension = os.path.splitext(file_path)
+    stem, _, name = root.rpartition(".")
+    if stem and name in IMAGE_VARIANT_NAMES:
+        return stem + extension
+    return None
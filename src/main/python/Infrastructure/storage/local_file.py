@@ -1,21 +1,35 @@
 import os
 import shutil
+from typing import Callable, Optional
 
 from uuid import uuid4
 from fastapi import UploadFile
-from PIL import Image
 
 from src.main.python.core.exception.error_message import ErrorMessage
+from src.main.python.Infrastructure.monitoring.metrics import file_upload_bytes
+from src.main.python.Infrastructure.storage.image_processing import (
+    ImageProcessingPool, check_image_header, process_upload
+)
+from src.main.python.Infrastructure.storage.image_variants import (
+    IMAGE_VARIANTS, STORED_IMAGE_EXTENSION, UPLOAD_MAX_BYTES, original_path, variant_path
+)
 from src.main.python.domain.storage.file_storage_interface import IFileStorage
 
 
 class LocalFileStorage(IFileStorage):
-
-    _BASE_DIR = os.getenv("FILE_STORAGE_BASE_DIR")
-    _TEMP_DIR = os.path.join(_BASE_DIR, "temp")
-
-    def __init__(self):
-        os.makedirs(self._TEMP_DIR, exist_ok=True)
+    _SPOOL_CHUNK_SIZE = 256 * 1024
+    _SHARD_WIDTH = 2
+    # 샤딩 배치로 옮기지 않는 디렉터리
+    _UNSHARDED_DIRS = ("temp",)
+
+    def __init__(self, base_dir: Optional[str] = None, image_pool: Optional[ImageProcessingPool] = None):
+        # 환경 변수는 클래스 정의(임포트) 시점이 아닌 생성 시점에 읽음
+        self._base_dir = base_dir or os.getenv("FILE_STORAGE_BASE_DIR")
+        self._image_pool = image_pool or ImageProcessingPool.from_env()
+        self._temp_dir = os.path.join(self._base_dir, "temp")
+        # 확정 파일의 하위 디렉터리 단계 수 (0 이면 샤딩 전과 같은 평면 배치)
+        self._shard_depth = int(os.getenv("FILE_STORAGE_SHARD_DEPTH", "2"))
+        os.makedirs(self._temp_dir, exist_ok=True)
 
     def _generate_unique_filename(self, extension: str, directory: str) -> str:
         while True:
@@ -23,32 +37,90 @@ class LocalFileStorage(IFileStorage):
             if not os.path.exists(os.path.join(directory, filename)):
                 return filename
 
-    def _generate_jpeg_image(self, upload_file: UploadFile) -> Image.Image:
-        try:
-            image = Image.open(upload_file.file)
-        except Exception:
-            raise ValueError(ErrorMessage.FILE_INVALID_IMAGE.value)
-        return image.convert("RGB")
+    def _layout_path(self, directory: str, filename: str) -> str:
+        # 파일 이름 앞 글자로 하위 디렉터리를 나눔 (ab/cd/abcd....jpeg), 디렉터리 하나에 파일이 몰리지 않게 함
+        # 파생본(abcd....thumb.jpeg)도 이름 앞부분이 같으므로 원본과 같은 디렉터리에 놓임
+        shards = [filename[index * self._SHARD_WIDTH:(index + 1) * self._SHARD_WIDTH]
+                  for index in range(self._shard_depth)]
+        return os.path.join(directory, *shards, filename)
 
-    def _move_with_unique_name(self, src_path: str, dest_dir: str) -> str:
+    def _move_with_unique_name(self, src_path: str, dest_dir: str, sharded: bool = True) -> str:
         extension = os.path.splitext(src_path)[1].lower()
         filename = os.path.basename(src_path)
-        destination_path = os.path.join(dest_dir, filename)
+        destination_path = self._layout_path(dest_dir, filename) if sharded else os.path.join(dest_dir, filename)
 
-        if os.path.exists(destination_path):
-            filename = self._generate_unique_filename(extension, dest_dir)
-            destination_path = os.path.join(dest_dir, filename)
+        while os.path.exists(destination_path):
+            filename = f"{uuid4().hex}{extension}"
+            destination_path = self._layout_path(dest_dir, filename) if sharded else os.path.join(dest_dir, filename)
 
+        os.makedirs(os.path.dirname(destination_path), exist_ok=True)
         shutil.move(src_path, destination_path)
         return destination_path
 
+    def _move_with_variants(self, src_path: str, dest_dir: str, sharded: bool = True) -> str:
+        # 원본 이름이 바뀌면 파생본도 바뀐 이름을 따라감
+        destination_path = self._move_with_unique_name(src_path, dest_dir, sharded)
+        for variant in IMAGE_VARIANTS:
+            src_variant_path = variant_path(src_path, variant.name)
+            if os.path.exists(src_variant_path):
+                shutil.move(src_variant_path, variant_path(destination_path, variant.name))
+        return destination_path
+
+    def _remove_with_variants(self, file_path: str):
+        for path in [file_path] + [variant_path(file_path, variant.name) for variant in IMAGE_VARIANTS]:
+            if os.path.exists(path):
+                os.remove(path)
+
+    @staticmethod
+    def _remove_if_exists(file_path: str):
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+    @staticmethod
+    def _link_or_copy(src_path: str, dest_path: str):
+        # 같은 파일 시스템이면 하드 링크 (복사 없이 즉시, 이전 경로로도 계속 읽힘)
+        try:
+            os.link(src_path, dest_path)
+        except FileExistsError:
+            pass
+        except OSError:
+            shutil.copyfile(src_path, dest_path)
+
+    def _spool_upload(self, file: UploadFile, source_path: str):
+        # 청크 단위로 옮기며 크기를 세고, 제한을 넘는 순간 더 읽지 않음
+        if file.size is not None and file.size > UPLOAD_MAX_BYTES:
+            raise ValueError(ErrorMessage.FILE_TOO_LARGE.value)
+        written = 0
+        with open(source_path, "wb") as source:
+            while True:
+                chunk = file.file.read(self._SPOOL_CHUNK_SIZE)
+                if not chunk:
+                    break
+                written += len(chunk)
+                if written > UPLOAD_MAX_BYTES:
+                    raise ValueError(ErrorMessage.FILE_TOO_LARGE.value)
+                source.write(chunk)
+
     def save_image_to_temp(self, file: UploadFile) -> str:
-        image = self._generate_jpeg_image(file)
+        if file.size is not None:
+            file_upload_bytes.inc(file.size)
 
-        filename = self._generate_unique_filename(".jpeg", self._TEMP_DIR)
-        file_path = os.path.join(self._TEMP_DIR, filename)
+        filename = self._generate_unique_filename(STORED_IMAGE_EXTENSION, self._temp_dir)
+        file_path = os.path.join(self._temp_dir, filename)
 
-        image.save(file_path, format="JPEG", quality=85)
+        # 업로드 원본은 파일로 받아 두고 워커 프로세스에는 경로만 넘김
+        source_path = file_path + ".upload"
+        try:
+            self._spool_upload(file, source_path)
+            check_image_header(source_path)
+        except BaseException:
+            self._remove_if_exists(source_path)
+            raise
+        # 업로드 원본 삭제는 작업이 실제로 끝난 뒤 (제한 시간이 지나도 실행 중인 작업이 읽고 있을 수 있음)
+        # 제한 시간이 지난 작업이 나중에 만든 임시 원본/파생본은 아무도 참조하지 않으므로 지움
+        self._image_pool.run("save_to_temp", process_upload, source_path, file_path,
+                             cleanup=lambda: self._remove_if_exists(source_path),
+                             discard=lambda: self._remove_with_variants(file_path))
 
         return file_path
 
@@ -56,22 +128,85 @@ class LocalFileStorage(IFileStorage):
         if not os.path.exists(temp_path):
             raise FileNotFoundError(ErrorMessage.FILE_NOT_FOUND)
 
-        target_dir = os.path.join(self._BASE_DIR, context)
+        target_dir = os.path.join(self._base_dir, context)
         os.makedirs(target_dir, exist_ok=True)
 
-        return self._move_with_unique_name(temp_path, target_dir)
+        return self._move_with_variants(temp_path, target_dir)
 
     def revert_to_temp(self, file_path: str) -> str:
         if not os.path.exists(file_path):
             raise FileNotFoundError(ErrorMessage.FILE_NOT_FOUND)
 
-        return self._move_with_unique_name(file_path, self._TEMP_DIR)
+        return self._move_with_variants(file_path, self._temp_dir, sharded=False)
 
     def clear_temp_directory(self):
-        for filename in os.listdir(self._TEMP_DIR):
-            file_path = os.path.join(self._TEMP_DIR, filename)
+        for filename in os.listdir(self._temp_dir):
+            file_path = os.path.join(self._temp_dir, filename)
             if os.path.isfile(file_path):
                 os.remove(file_path)
 
     def file_exists(self, file_path: str) -> bool:
         return os.path.exists(file_path)
+
+    def resolve_variant(self, file_path: str, size: Optional[str] = None) -> str:
+        original = original_path(file_path) or file_path
+        candidate = variant_path(original, size) if size else file_path
+        if os.path.exists(candidate):
+            return candidate
+        # 파생본이 없는 기존 업로드는 원본으로 대체
+        if os.path.exists(original):
+            return original
+        raise FileNotFoundError(ErrorMessage.FILE_NOT_FOUND)
+
+    def release_file(self, file_path: Optional[str]):
+        # 업로드마다 파일이 따로 있으므로 참조 수를 관리하지 않음 (소프트 삭제된 피드/회원의 파일도 그대로 보관)
+        pass
+
+    def collect_garbage(self, is_referenced: Optional[Callable[[str], bool]] = None) -> int:
+        return 0
+
+    def _relocation_target(self, file_path: Optional[str]) -> Optional[str]:
+        """샤딩 전 평면 배치(<base>/<context>/<파일>) 경로의 샤딩 위치, 옮길 대상이 아니면 None"""
+        if not file_path or "://" in file_path or self._shard_depth == 0:
+            return None
+        directory, filename = os.path.split(file_path)
+        if os.path.dirname(os.path.abspath(directory)) != os.path.abspath(self._base_dir):
+            return None
+        if os.path.basename(directory) in self._UNSHARDED_DIRS:
+            return None
+        return self._layout_path(directory, filename)
+
+    def stage_relocation(self, file_path: Optional[str], dry_run: bool = False) -> Optional[str]:
+        target = self._relocation_target(file_path)
+        if target is None:
+            return file_path
+        # 이미 옮겨진 경로(재실행, 같은 파일을 가리키는 다른 행)는 그대로 사용
+        if dry_run or os.path.exists(target):
+            return target
+        if not os.path.exists(file_path):
+            return file_path
+
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        for variant in IMAGE_VARIANTS:
+            src_variant_path = variant_path(file_path, variant.name)
+            if os.path.exists(src_variant_path):
+                self._link_or_copy(src_variant_path, variant_path(target, variant.name))
+        # 원본을 마지막에 만들어, 원본이 있으면 파생본도 모두 있는 상태가 되게 함
+        self._link_or_copy(file_path, target)
+        return target
+
+    def remove_previous_layout(self) -> int:
+        removed = 0
+        for name in os.listdir(self._base_dir):
+            directory = os.path.join(self._base_dir, name)
+            if name in self._UNSHARDED_DIRS or not os.path.isdir(directory):
+                continue
+            for entry in os.scandir(directory):
+                if not entry.is_file():
+                    continue
+                target = self._layout_path(directory, entry.name)
+                # 샤딩 위치에 같은 파일(하드 링크 또는 복사본)이 있을 때만 지움
+                if os.path.exists(target) and os.path.getsize(target) == entry.stat().st_size:
+                    os.remove(entry.path)
+                    removed += 1
+        return removed
@@ -0,0 +1,165 @@
+from typing import List, Optional, Dict, Any, Callable
+
+from starlette.concurrency import run_in_threadpool
+
+from src.main.python.Infrastructure.buffer.feed_view_buffer import FeedViewBuffer
+from src.main.python.Infrastructure.cache.feed_count import FeedCountCache
+from src.main.python.Infrastructure.cache.lru_ttl import LruTtlCache
+from src.main.python.application.service.async_feed_like import AsyncFeedLikeService
+from src.main.python.application.service.feed import FeedService
+from src.main.python.application.service.file import FileService
+from src.main.python.core.exception.error_message import ErrorMessage
+from src.main.python.core.pagination.feed_cursor import FeedCursor
+from src.main.python.domain.model.feed.feed import Feed
+from src.main.python.domain.repository.async_feed_repository_interface import IAsyncFeedRepository
+from src.main.python.domain.repository.async_member_repository_interface import IAsyncMemberRepository
+
+
+class AsyncFeedService:
+    """
+    FeedService 의 비동기 버전 (DB_ASYNC=true)
+
+    캐시/버퍼 싱글톤과 목록 아이템 변환은 FeedService 와 공유하고, DB 접근만 비동기 리포지토리로 수행합니다.
+    """
+    _FEED_IMAGE_CONTEXT = "feed"
+
+    def __init__(self, feed_repository: IAsyncFeedRepository, member_repository: IAsyncMemberRepository,
+                 file_service: FileService, feed_like_service: AsyncFeedLikeService,
+                 feed_count_cache: FeedCountCache, feed_page_cache: LruTtlCache, feed_view_buffer: FeedViewBuffer,
+                 after_commit: Callable[[Callable[[], None]], None]):
+        self.feed_repository = feed_repository
+        self.member_repository = member_repository
+        self.file_service = file_service
+        self.feed_like_service = feed_like_service
+        self.feed_count_cache = feed_count_cache
+        self.feed_page_cache = feed_page_cache
+        self.feed_view_buffer = feed_view_buffer
+        # 커밋 후 작업은 async_unit_of_work 가 스레드풀에서 실행 (파일 I/O 포함)
+        self.after_commit = after_commit
+
+    async def create(self, member_id: int, feed_type: str, images: List[str], content: str) -> Feed:
+        await self.member_repository.find_by_id(member_id)
+
+        confirmed_images = []
+        for image_path in images:
+            # 파일 이동은 블로킹 I/O 이므로 스레드풀에서 실행
+            moved_path = await run_in_threadpool(self.file_service.confirm, image_path, self._FEED_IMAGE_CONTEXT)
+            confirmed_images.append(moved_path)
+
+        feed = Feed.create(member_id, feed_type, confirmed_images, content)
+        feed = await self.feed_repository.save(feed)
+        self.after_commit(self._feed_changed_callback(feed.member_id, added=feed.feed_type.value))
+        return feed
+
+    async def update(self, feed_id: int, subject: str, feed_type: str, images: List[str], content: str) -> Feed:
+        feed = await self.find_by_id(feed_id)
+        previous_feed_type = feed.feed_type.value
+        previous_images = list(feed.images)
+        # 기존 이미지는 그대로 두고 새로 올린 이미지만 확정, 빠진 이미지는 참조 반납
+        confirmed_images = []
+        for image_path in images:
+            if image_path not in previous_images:
+                image_path = await run_in_threadpool(self.file_service.confirm, image_path, self._FEED_IMAGE_CONTEXT)
+            confirmed_images.append(image_path)
+        feed.change(feed_type, confirmed_images, content)
+        feed = await self.feed_repository.save(feed)
+        released_images = [image for image in previous_images if image not in confirmed_images]
+        self.after_commit(lambda: self.file_service.release(released_images))
+        if feed.feed_type.value != previous_feed_type:
+            self.after_commit(self._feed_changed_callback(feed.member_id, added=feed.feed_type.value,
+                                                          removed=previous_feed_type))
+        else:
+            self.after_commit(self.feed_page_cache.clear)
+        return feed
+
+    async def soft_delete(self, feed_id: int) -> Feed:
+        feed = await self.find_by_id(feed_id)
+        feed.change_displayed()
+        feed = await self.feed_repository.save(feed)
+        released_images = list(feed.images)
+        self.after_commit(lambda: self.file_service.release(released_images))
+        self.after_commit(self._feed_changed_callback(feed.member_id, removed=feed.feed_type.value))
+        return feed
+
+    def _feed_changed_callback(self, member_id: int, added: Optional[str] = None,
+                               removed: Optional[str] = None) -> Callable[[], None]:
+        return FeedService.feed_changed_callback(self.feed_count_cache, self.feed_page_cache, member_id, added, removed)
+
+    async def find_by_id(self, feed_id: int) -> Optional[Feed]:
+        feed = await self.feed_repository.find_by_id(feed_id)
+        if feed is None:
+            raise ValueError(ErrorMessage.FEED_NOT_FOUND.value)
+        return feed
+
+    async def view_feed(self, feed_id: int, member_id: Optional[int] = None) -> dict:
+        feed = await self.find_by_id(feed_id)
+        pending_views = self.feed_view_buffer.add(feed_id)
+        has_liked = feed_id in await self.feed_like_service.find_liked_feed_ids([feed_id], member_id)
+        return {"feed": feed, "has_liked": has_liked, "views": feed.views + pending_views}
+
+    async def paginate(self, offset: int, limit: int, feed_type: Optional[str] = None,
+                       member_id: Optional[int] = None, exact_total: bool = False) -> Dict[str, Any]:
+        key = FeedService.page_cache_key("offset", offset, limit, feed_type, member_id)
+        page = None if exact_total else self.feed_page_cache.get(key)
+        if page is None:
+            generation = self.feed_page_cache.generation()
+            page = await self._load_offset_page(offset, limit, feed_type, member_id, exact_total)
+            self.feed_page_cache.put(key, page, generation)
+        return await self._with_has_liked(page, member_id)
+
+    async def _load_offset_page(self, offset: int, limit: int, feed_type: Optional[str], member_id: Optional[int],
+                                exact_total: bool) -> Dict[str, Any]:
+        total = None
+        if exact_total:
+            generation = self.feed_count_cache.generation()
+            feeds, total = await self.feed_repository.paginate_with_total(offset, limit, feed_type, member_id)
+            if total is not None:
+                self.feed_count_cache.put(feed_type, member_id, total, generation)
+        else:
+            feeds = await self.feed_repository.paginate(offset, limit, feed_type, member_id)
+        if total is None:
+            total = await self.count(feed_type, member_id)
+
+        items = [FeedService.to_list_item(feed) for feed in feeds]
+        return {"total": total, "feeds": items, "has_more": offset + len(items) < total}
+
+    async def count(self, feed_type: Optional[str] = None, member_id: Optional[int] = None) -> int:
+        total = self.feed_count_cache.get(feed_type, member_id)
+        if total is None:
+            # COUNT 하는 동안 다른 요청의 등록/삭제가 반영(adjust)되었다면 센 값은 캐시하지 않음
+            generation = self.feed_count_cache.generation()
+            total = await self.feed_repository.count(feed_type, member_id)
+            self.feed_count_cache.put(feed_type, member_id, total, generation)
+        return total
+
+    async def paginate_by_cursor(self, cursor: Optional[str], limit: int, feed_type: Optional[str] = None,
+                                 member_id: Optional[int] = None) -> Dict[str, Any]:
+        key = FeedService.page_cache_key("cursor", cursor or "", limit, feed_type, member_id)
+        page = self.feed_page_cache.get(key)
+        if page is None:
+            generation = self.feed_page_cache.generation()
+            page = await self._load_cursor_page(cursor, limit, feed_type, member_id)
+            self.feed_page_cache.put(key, page, generation)
+        return await self._with_has_liked(page, member_id)
+
+    async def _load_cursor_page(self, cursor: Optional[str], limit: int, feed_type: Optional[str],
+                                member_id: Optional[int]) -> Dict[str, Any]:
+        position = FeedCursor.decode(cursor) if cursor else None
+        feeds = await self.feed_repository.paginate_by_cursor(
+            position.created_at if position else None,
+            position.feed_id if position else None,
+            limit + 1, feed_type, member_id
+        )
+
+        has_more = len(feeds) > limit
+        feeds = feeds[:limit]
+        next_cursor = FeedCursor(feeds[-1].created_at, feeds[-1].id).encode() if has_more else None
+
+        items = [FeedService.to_list_item(feed) for feed in feeds]
+        return {"feeds": items, "next_cursor": next_cursor, "has_more": has_more}
+
+    async def _with_has_liked(self, page: Dict[str, Any], member_id: Optional[int]) -> Dict[str, Any]:
+        liked_feed_ids = await self.feed_like_service.find_liked_feed_ids(
+            [item["feed_id"] for item in page["feeds"]], member_id
+        )
+        return FeedService.merge_has_liked(page, liked_feed_ids)
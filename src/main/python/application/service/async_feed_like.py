@@ -0,0 +1,69 @@
+import asyncio
+from typing import Callable, List, Set, Optional
+
+from src.main.python.Infrastructure.pipeline.feed_like_pipeline import FeedLikeWritePipeline, LIKE, UNLIKE
+from src.main.python.application.service.async_member import AsyncMemberService
+from src.main.python.core.exception.error_message import ErrorMessage
+from src.main.python.domain.model.feed.exceptions import FeedLikePendingError
+from src.main.python.domain.model.feed.feed_like import FeedLike
+from src.main.python.domain.repository.async_feed_like_interface import IAsyncFeedLikeRepository
+
+
+class AsyncFeedLikeService:
+    _PIPELINE_TIMEOUT_SECONDS = 10
+
+    def __init__(self, feed_like_repository: IAsyncFeedLikeRepository, member_service: AsyncMemberService,
+                 after_commit: Callable[[Callable[[], None]], None], likes_changed: Callable[[Set[int]], None],
+                 feed_like_pipeline: Optional[FeedLikeWritePipeline] = None):
+        self.feed_like_repository = feed_like_repository
+        self.member_service = member_service
+        # 좋아요 수가 바뀐 피드를 커밋 후 알림 (목록 캐시 갱신, 그룹 커밋 모드는 파이프라인이 커밋 후 알림)
+        self.after_commit = after_commit
+        self.likes_changed = likes_changed
+        self.feed_like_pipeline = feed_like_pipeline
+
+    async def like(self, feed_id: int, member_id: int) -> Optional[FeedLike]:
+        await self.member_service.find_by_id(member_id)
+        if self.feed_like_pipeline is not None:
+            return await self._wait_pipeline(LIKE, feed_id, member_id)
+        if await self.exists_by_feed_id_and_member_id(feed_id, member_id):
+            raise ValueError(ErrorMessage.FEED_LIKE_ALREADY_EXISTS.value)
+        feed_like = FeedLike.create(feed_id=feed_id, member_id=member_id)
+        feed_like = await self.feed_like_repository.save(feed_like)
+        self.after_commit(lambda: self.likes_changed({feed_id}))
+        return feed_like
+
+    async def unlike(self, feed_id: int, member_id: int):
+        if self.feed_like_pipeline is not None:
+            return await self._wait_pipeline(UNLIKE, feed_id, member_id)
+        feed_like = await self.find_by_feed_id_and_member_id(feed_id, member_id)
+        result = await self.feed_like_repository.delete(feed_like)
+        self.after_commit(lambda: self.likes_changed({feed_id}))
+        return result
+
+    async def _wait_pipeline(self, action: str, feed_id: int, member_id: int) -> Optional[FeedLike]:
+        # 파이프라인의 Future 를 스레드를 점유하지 않고 기다림
+        # 제한 시간이 지나도 이벤트는 대기열에 남아 나중에 반영될 수 있으므로 결과를 알 수 없음(503)으로 응답
+        future = self.feed_like_pipeline.submit(action, feed_id, member_id)
+        try:
+            # shield: 시간 초과로 대기를 취소해도 파이프라인의 Future 는 취소하지 않음
+            return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), self._PIPELINE_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            raise FeedLikePendingError()
+
+    async def find_by_feed_id_and_member_id(self, feed_id: int, member_id: int) -> FeedLike:
+        feed_like = await self.feed_like_repository.find_by_feed_id_and_member_id(feed_id, member_id)
+        if feed_like is None:
+            raise ValueError(ErrorMessage.FEED_LIKE_NOT_FOUND.value)
+        return feed_like
+
+    async def exists_by_feed_id_and_member_id(self, feed_id: int, member_id: int) -> bool:
+        return await self.feed_like_repository.exists_by_feed_id_and_member_id(feed_id, member_id)
+
+    async def find_liked_feed_ids(self, feed_ids: List[int], member_id: Optional[int]) -> Set[int]:
+        if not member_id:
+            return set()
+        return await self.feed_like_repository.find_liked_feed_ids(feed_ids, member_id)
+
+    async def count(self, feed_id: int) -> int:
+        return await self.feed_like_repository.count_by_feed_id(feed_id)
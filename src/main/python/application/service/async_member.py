@@ -0,0 +1,71 @@
+from typing import Optional, Callable
+
+from starlette.concurrency import run_in_threadpool
+
+from src.main.python.application.service.file import FileService
+from src.main.python.core.exception.error_message import ErrorMessage
+from src.main.python.domain.model.user.member import Member
+from src.main.python.domain.repository.async_member_repository_interface import IAsyncMemberRepository
+
+
+class AsyncMemberService:
+    _MEMBER_IMAGE_CONTEXT = "member"
+
+    def __init__(self, member_repository: IAsyncMemberRepository, file_service: FileService,
+                 after_commit: Callable[[Callable[[], None]], None]):
+        self.repository = member_repository
+        self.file_service = file_service
+        self.after_commit = after_commit
+
+    async def create(self, email: str, nickname: str, profile_image: Optional[str]) -> Member:
+        if await self.repository.exists_by_email(email):
+            raise ValueError(ErrorMessage.MEMBER_EMAIL_DUPLICATE.value)
+        member = Member.create(email, nickname, profile_image)
+        return await self.repository.save(member)
+
+    async def update(self, member_id: int, nickname: str, profile_image: str, animal_name: str) -> Member:
+        member = await self.find_by_id(member_id)
+        if nickname and nickname != member.nickname:
+            if await self.repository.find_by_nickname(nickname):
+                raise ValueError(ErrorMessage.MEMBER_NICKNAME_DUPLICATE.value)
+            member.change_nickname(nickname)
+        if profile_image is not None and profile_image != member.profile_image:
+            # 파일 이동은 블로킹 I/O 이므로 스레드풀에서 실행, 임시 경로가 아닌 이동된 경로를 저장하고 이전 이미지 참조는 커밋 후 반납
+            previous_image = member.profile_image
+            member.change_profile_image(
+                await run_in_threadpool(self.file_service.confirm, profile_image, self._MEMBER_IMAGE_CONTEXT)
+            )
+            self.after_commit(lambda: self.file_service.release([previous_image]))
+        if animal_name is not None:
+            member.change_animal_name(animal_name)
+        member.update_timestamp()
+        return await self.repository.save(member)
+
+    async def soft_delete(self, member_id: int) -> Member:
+        member = await self.find_by_id(member_id)
+        member.change_displayed()
+        member = await self.repository.save(member)
+        profile_image = member.profile_image
+        self.after_commit(lambda: self.file_service.release([profile_image]))
+        return member
+
+    async def find_by_id(self, member_id: int) -> Optional[Member]:
+        member = await self.repository.find_by_id(member_id)
+        if member is None:
+            raise ValueError(ErrorMessage.MEMBER_NOT_FOUND.value)
+        return member
+
+    async def find_by_email(self, email: str) -> Optional[Member]:
+        member = await self.repository.find_by_email(email)
+        if member is None:
+            raise ValueError(ErrorMessage.MEMBER_NOT_FOUND.value)
+        return member
+
+    async def find_by_nickname(self, nickname: str) -> Optional[Member]:
+        member = await self.repository.find_by_nickname(nickname)
+        if member is None:
+            raise ValueError(ErrorMessage.MEMBER_NOT_FOUND.value)
+        return member
+
+    async def exists_by_email(self, email: str) -> bool:
+        return await self.repository.exists_by_email(email)
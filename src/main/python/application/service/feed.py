@@ -1,22 +1,35 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Callable
 
+from src.main.python.Infrastructure.buffer.feed_view_buffer import FeedViewBuffer
+from src.main.python.Infrastructure.cache.feed_count import FeedCountCache
+from src.main.python.Infrastructure.cache.lru_ttl import LruTtlCache
+from src.main.python.Infrastructure.storage.image_variants import LIST_IMAGE_VARIANT, PROFILE_IMAGE_VARIANT, variant_path
 from src.main.python.domain.repository.feed_repository_interface import IFeedRepository
 from src.main.python.domain.repository.member_repository_interface import IMemberRepository
 from src.main.python.application.service.feed_like import FeedLikeService
 from src.main.python.application.service.file import FileService
 from src.main.python.core.exception.error_message import ErrorMessage
+from src.main.python.core.pagination.feed_cursor import FeedCursor
 from src.main.python.domain.model.feed.feed import Feed
+from src.main.python.domain.model.feed.feed_summary import FeedSummary
 
 
 class FeedService:
     _FEED_IMAGE_CONTEXT = "feed"
 
     def __init__(self, feed_repository: IFeedRepository, member_repository: IMemberRepository,
-                 file_service: FileService, feed_like_service: FeedLikeService):
+                 file_service: FileService, feed_like_service: FeedLikeService, feed_count_cache: FeedCountCache,
+                 feed_page_cache: LruTtlCache, feed_view_buffer: FeedViewBuffer,
+                 after_commit: Callable[[Callable[[], None]], None]):
         self.feed_repository = feed_repository
         self.member_repository = member_repository
         self.file_service = file_service
         self.feed_like_service = feed_like_service
+        self.feed_count_cache = feed_count_cache
+        self.feed_page_cache = feed_page_cache
+        self.feed_view_buffer = feed_view_buffer
+        # 캐시 갱신과 이미지 참조 반납은 트랜잭션이 커밋된 뒤에 실행 (커밋 실패 시 DB 와 어긋나지 않게 함)
+        self.after_commit = after_commit
 
     def create(self, member_id: int, feed_type: str, images: List[str], content: str) -> Feed:
         self.member_repository.find_by_id(member_id)
@@ -27,18 +40,53 @@ class FeedService:
             confirmed_images.append(moved_path)
 
         feed = Feed.create(member_id, feed_type, confirmed_images, content)
-        return self.feed_repository.save(feed)
+        feed = self.feed_repository.save(feed)
+        self.after_commit(self._feed_changed_callback(feed.member_id, added=feed.feed_type.value))
+        return feed
 
     def update(self, feed_id: int, subject: str, feed_type: str, images: List[str], content: str) -> Feed:
-        feed = self.feed_repository.find_by_id(feed_id)
-        feed.change(subject, feed_type, images, content)
-        return self.feed_repository.save(feed)
+        feed = self.find_by_id(feed_id)
+        previous_feed_type = feed.feed_type.value
+        previous_images = list(feed.images)
+        # 기존 이미지는 그대로 두고 새로 올린 이미지만 확정, 빠진 이미지는 참조 반납
+        images = [image if image in previous_images else self.file_service.confirm(image, self._FEED_IMAGE_CONTEXT)
+                  for image in images]
+        feed.change(feed_type, images, content)
+        feed = self.feed_repository.save(feed)
+        released_images = [image for image in previous_images if image not in images]
+        self.after_commit(lambda: self.file_service.release(released_images))
+        if feed.feed_type.value != previous_feed_type:
+            self.after_commit(self._feed_changed_callback(feed.member_id, added=feed.feed_type.value,
+                                                          removed=previous_feed_type))
+        else:
+            self.after_commit(self.feed_page_cache.clear)
+        return feed
 
     def soft_delete(self, feed_id: int) -> Feed:
-        feed = self.feed_repository.find_by_id(feed_id)
+        feed = self.find_by_id(feed_id)
         feed.change_displayed()
+        feed = self.feed_repository.save(feed)
+        released_images = list(feed.images)
+        self.after_commit(lambda: self.file_service.release(released_images))
+        self.after_commit(self._feed_changed_callback(feed.member_id, removed=feed.feed_type.value))
         return feed
 
+    def _feed_changed_callback(self, member_id: int, added: Optional[str] = None,
+                               removed: Optional[str] = None) -> Callable[[], None]:
+        return self.feed_changed_callback(self.feed_count_cache, self.feed_page_cache, member_id, added, removed)
+
+    @staticmethod
+    def feed_changed_callback(feed_count_cache: FeedCountCache, feed_page_cache: LruTtlCache, member_id: int,
+                              added: Optional[str] = None, removed: Optional[str] = None) -> Callable[[], None]:
+        # 커밋 후 실행할 피드 개수 증감 + 목록 캐시 비우기 (커밋 후에는 엔티티 속성이 만료되므로 값을 미리 꺼내 둠)
+        def apply():
+            if removed is not None:
+                feed_count_cache.adjust(removed, member_id, -1)
+            if added is not None:
+                feed_count_cache.adjust(added, member_id, 1)
+            feed_page_cache.clear()
+        return apply
+
     def find_by_id(self, feed_id: int) -> Optional[Feed]:
         feed = self.feed_repository.find_by_id(feed_id)
         if feed is None:
@@ -47,35 +95,108 @@ class FeedService:
 
     def view_feed(self, feed_id: int, member_id: Optional[int] = None) -> dict:
         feed = self.find_by_id(feed_id)
-        feed.increase_views()
-        self.feed_repository.save(feed)
-        has_liked = bool(member_id and self.feed_like_service.exists_by_feed_id_and_member_id(feed_id, member_id))
-        return {"feed": feed, "has_liked": has_liked}
-
-    def paginate(self, offset: int, limit: int, feed_type: Optional[str] = None, member_id: Optional[int] = None) -> \
-    Dict[str, Any]:
-        feeds = self.feed_repository.paginate(offset, limit, feed_type, member_id)
-        total = self.feed_repository.count(feed_type, member_id)
-
-        items = []
-        for feed in feeds:
-            image = feed.images[0]
-            has_liked = False
-            if member_id:
-                has_liked = self.feed_like_service.exists_by_feed_id_and_member_id(feed.id, member_id)
-
-            # 필드 순서/명 맞추기
-            items.append({
-                "has_liked": bool(has_liked),
-                "author_nickname": feed.member.nickname,
-                "author_profile_image": feed.member.profile_image,
-                "feed_id": feed.id,
-                "feed_type": feed.feed_type.value.lower(),
-                "image": image,
-                "content": feed.content,
-                "likes": feed.likes,
-                "views": feed.views,
-                "created_at": feed.created_at.isoformat(),
-            })
-
-        return {"total": total, "feeds": items}
+        # 조회수는 버퍼에만 쌓고 백그라운드에서 일괄 반영 (상세 조회 경로에서는 쓰기 없음)
+        pending_views = self.feed_view_buffer.add(feed_id)
+        has_liked = feed_id in self.feed_like_service.find_liked_feed_ids([feed_id], member_id)
+        return {"feed": feed, "has_liked": has_liked, "views": feed.views + pending_views}
+
+    def paginate(self, offset: int, limit: int, feed_type: Optional[str] = None, member_id: Optional[int] = None,
+                 exact_total: bool = False) -> Dict[str, Any]:
+        key = self.page_cache_key("offset", offset, limit, feed_type, member_id)
+        page = None if exact_total else self.feed_page_cache.get(key)
+        if page is None:
+            # 읽는 동안 다른 요청의 쓰기가 커밋되어 캐시가 비워졌다면 읽은 페이지는 캐시하지 않음
+            generation = self.feed_page_cache.generation()
+            page = self._load_offset_page(offset, limit, feed_type, member_id, exact_total)
+            self.feed_page_cache.put(key, page, generation)
+        return self._with_has_liked(page, member_id)
+
+    def _load_offset_page(self, offset: int, limit: int, feed_type: Optional[str], member_id: Optional[int],
+                          exact_total: bool) -> Dict[str, Any]:
+        total = None
+        if exact_total:
+            generation = self.feed_count_cache.generation()
+            feeds, total = self.feed_repository.paginate_with_total(offset, limit, feed_type, member_id)
+            if total is not None:
+                self.feed_count_cache.put(feed_type, member_id, total, generation)
+        else:
+            feeds = self.feed_repository.paginate(offset, limit, feed_type, member_id)
+        if total is None:
+            total = self.count(feed_type, member_id)
+
+        items = [self.to_list_item(feed) for feed in feeds]
+        return {"total": total, "feeds": items, "has_more": offset + len(items) < total}
+
+    def count(self, feed_type: Optional[str] = None, member_id: Optional[int] = None) -> int:
+        total = self.feed_count_cache.get(feed_type, member_id)
+        if total is None:
+            # COUNT 하는 동안 다른 요청의 등록/삭제가 반영(adjust)되었다면 센 값은 캐시하지 않음
+            generation = self.feed_count_cache.generation()
+            total = self.feed_repository.count(feed_type, member_id)
+            self.feed_count_cache.put(feed_type, member_id, total, generation)
+        return total
+
+    def paginate_by_cursor(self, cursor: Optional[str], limit: int, feed_type: Optional[str] = None,
+                           member_id: Optional[int] = None) -> Dict[str, Any]:
+        key = self.page_cache_key("cursor", cursor or "", limit, feed_type, member_id)
+        page = self.feed_page_cache.get(key)
+        if page is None:
+            generation = self.feed_page_cache.generation()
+            page = self._load_cursor_page(cursor, limit, feed_type, member_id)
+            self.feed_page_cache.put(key, page, generation)
+        return self._with_has_liked(page, member_id)
+
+    def _load_cursor_page(self, cursor: Optional[str], limit: int, feed_type: Optional[str],
+                          member_id: Optional[int]) -> Dict[str, Any]:
+        position = FeedCursor.decode(cursor) if cursor else None
+        # limit + 1 개를 조회해 다음 페이지 존재 여부를 count() 없이 판단
+        feeds = self.feed_repository.paginate_by_cursor(
+            position.created_at if position else None,
+            position.feed_id if position else None,
+            limit + 1, feed_type, member_id
+        )
+
+        has_more = len(feeds) > limit
+        feeds = feeds[:limit]
+        next_cursor = FeedCursor(feeds[-1].created_at, feeds[-1].id).encode() if has_more else None
+
+        items = [self.to_list_item(feed) for feed in feeds]
+        return {"feeds": items, "next_cursor": next_cursor, "has_more": has_more}
+
+    def _with_has_liked(self, page: Dict[str, Any], member_id: Optional[int]) -> Dict[str, Any]:
+        # 캐시된 페이지는 회원과 무관하게 공유되므로, 좋아요 여부는 캐시 밖에서 매 요청마다 합칩니다.
+        # 페이지 전체의 좋아요 여부를 한 번의 쿼리로 조회 (피드별 조회 N+1 제거)
+        liked_feed_ids = self.feed_like_service.find_liked_feed_ids([item["feed_id"] for item in page["feeds"]],
+                                                                    member_id)
+        return self.merge_has_liked(page, liked_feed_ids)
+
+    @staticmethod
+    def page_cache_key(mode: str, position: Any, limit: int, feed_type: Optional[str],
+                       member_id: Optional[int]) -> tuple:
+        return mode, position, limit, feed_type.lower() if feed_type else None, member_id
+
+    @staticmethod
+    def discard_feed_pages(feed_page_cache: LruTtlCache, feed_ids: Set[int]):
+        # 좋아요/조회수가 바뀐 피드가 포함된 페이지만 비움 (커밋 후에 호출)
+        feed_page_cache.discard_if(lambda page: any(item["feed_id"] in feed_ids for item in page["feeds"]))
+
+    @staticmethod
+    def merge_has_liked(page: Dict[str, Any], liked_feed_ids: Set[int]) -> Dict[str, Any]:
+        items = [{"has_liked": item["feed_id"] in liked_feed_ids, **item} for item in page["feeds"]]
+        return {**page, "feeds": items}
+
+    @staticmethod
+    def to_list_item(feed: FeedSummary) -> Dict[str, Any]:
+        # 필드 순서/명 맞추기 (has_liked 는 _with_has_liked 에서 맨 앞에 추가)
+        # 목록 이미지와 작성자 이미지는 작은 파생본 경로로 내려줌 (파생본이 없으면 /file/view 가 원본으로 대체)
+        return {
+            "author_nickname": feed.author_nickname,
+            "author_profile_image": variant_path(feed.author_profile_image, PROFILE_IMAGE_VARIANT),
+            "feed_id": feed.id,
+            "feed_type": feed.feed_type.value.lower(),
+            "image": variant_path(feed.cover_image, LIST_IMAGE_VARIANT),
+            "content": feed.content,
+            "likes": feed.likes,
+            "views": feed.views,
+            "created_at": feed.created_at.isoformat(),
+        }
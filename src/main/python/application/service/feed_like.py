@@ -1,24 +1,53 @@
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable, List, Set, Optional
+
+from src.main.python.Infrastructure.pipeline.feed_like_pipeline import FeedLikeWritePipeline, LIKE, UNLIKE
 from src.main.python.application.service.member import MemberService
 from src.main.python.core.exception.error_message import ErrorMessage
+from src.main.python.domain.model.feed.exceptions import FeedLikePendingError
 from src.main.python.domain.model.feed.feed_like import FeedLike
 from src.main.python.domain.repository.feed_like_interface import IFeedLikeRepository
 
 
 class FeedLikeService:
-    def __init__(self, feed_like_repository: IFeedLikeRepository, member_service: MemberService):
+    _PIPELINE_TIMEOUT_SECONDS = 10
+
+    def __init__(self, feed_like_repository: IFeedLikeRepository, member_service: MemberService,
+                 after_commit: Callable[[Callable[[], None]], None], likes_changed: Callable[[Set[int]], None],
+                 feed_like_pipeline: Optional[FeedLikeWritePipeline] = None):
         self.feed_like_repository = feed_like_repository
         self.member_service = member_service
+        # 좋아요 수가 바뀐 피드를 커밋 후 알림 (목록 캐시 갱신, 그룹 커밋 모드는 파이프라인이 커밋 후 알림)
+        self.after_commit = after_commit
+        self.likes_changed = likes_changed
+        self.feed_like_pipeline = feed_like_pipeline
 
-    def like(self, feed_id: int, member_id: int) -> FeedLike:
+    def like(self, feed_id: int, member_id: int) -> Optional[FeedLike]:
         self.member_service.find_by_id(member_id)
+        if self.feed_like_pipeline is not None:
+            # 그룹 커밋 모드: 중복 여부 판단과 저장은 파이프라인이 배치 단위로 처리
+            return self._wait_pipeline(LIKE, feed_id, member_id)
         if self.exists_by_feed_id_and_member_id(feed_id, member_id):
             raise ValueError(ErrorMessage.FEED_LIKE_ALREADY_EXISTS.value)
         feed_like = FeedLike.create(feed_id=feed_id, member_id=member_id)
-        return self.feed_like_repository.save(feed_like)
+        feed_like = self.feed_like_repository.save(feed_like)
+        self.after_commit(lambda: self.likes_changed({feed_id}))
+        return feed_like
 
     def unlike(self, feed_id: int, member_id: int):
+        if self.feed_like_pipeline is not None:
+            return self._wait_pipeline(UNLIKE, feed_id, member_id)
         feed_like = self.find_by_feed_id_and_member_id(feed_id, member_id)
-        return self.feed_like_repository.delete(feed_like)
+        result = self.feed_like_repository.delete(feed_like)
+        self.after_commit(lambda: self.likes_changed({feed_id}))
+        return result
+
+    def _wait_pipeline(self, action: str, feed_id: int, member_id: int) -> Optional[FeedLike]:
+        # 제한 시간이 지나도 이벤트는 대기열에 남아 나중에 반영될 수 있으므로 결과를 알 수 없음(503)으로 응답
+        try:
+            return self.feed_like_pipeline.submit(action, feed_id, member_id).result(self._PIPELINE_TIMEOUT_SECONDS)
+        except FutureTimeoutError:
+            raise FeedLikePendingError()
 
     def find_by_feed_id_and_member_id(self, feed_id: int, member_id: int) -> FeedLike:
         feed_like = self.feed_like_repository.find_by_feed_id_and_member_id(feed_id, member_id)
@@ -29,5 +58,10 @@ class FeedLikeService:
     def exists_by_feed_id_and_member_id(self, feed_id: int, member_id: int) -> bool:
         return self.feed_like_repository.exists_by_feed_id_and_member_id(feed_id, member_id)
 
+    def find_liked_feed_ids(self, feed_ids: List[int], member_id: Optional[int]) -> Set[int]:
+        if not member_id:
+            return set()
+        return self.feed_like_repository.find_liked_feed_ids(feed_ids, member_id)
+
     def count(self, feed_id: int) -> int:
         return self.feed_like_repository.count_by_feed_id(feed_id)
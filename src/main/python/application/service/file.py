@@ -1,5 +1,8 @@
+from typing import Callable, Iterable, Optional
+
 from fastapi import UploadFile
 
+from src.main.python.Infrastructure.storage.image_variants import IMAGE_VARIANT_NAMES
 from src.main.python.core.exception.error_message import ErrorMessage
 from src.main.python.domain.storage.file_storage_interface import IFileStorage
 
@@ -14,6 +17,19 @@ class FileService:
     def confirm(self, temp_path: str, context: str) -> str:
         return self.storage.confirm_file(temp_path, context)
 
+    def release(self, file_paths: Iterable[Optional[str]]):
+        for file_path in file_paths:
+            self.storage.release_file(file_path)
+
+    def collect_garbage(self, is_referenced: Optional[Callable[[str], bool]] = None) -> int:
+        return self.storage.collect_garbage(is_referenced)
+
+    def stage_relocation(self, file_path: Optional[str], dry_run: bool = False) -> Optional[str]:
+        return self.storage.stage_relocation(file_path, dry_run)
+
+    def remove_previous_layout(self) -> int:
+        return self.storage.remove_previous_layout()
+
     def revert_file_to_temp(self, file_path: str) -> str:
         return self.storage.revert_to_temp(file_path)
 
@@ -23,3 +39,8 @@ class FileService:
     def file_exists(self, file_path: str) -> bool:
         if not self.storage.file_exists(file_path):
             raise FileNotFoundError(ErrorMessage.FILE_NOT_FOUND)
+
+    def resolve_image(self, file_path: str, size: Optional[str] = None) -> str:
+        if size is not None and size not in IMAGE_VARIANT_NAMES:
+            raise ValueError(ErrorMessage.FILE_INVALID_IMAGE_SIZE.value)
+        return self.storage.resolve_variant(file_path, size)
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Callable
 
 from src.main.python.application.service.file import FileService
 from src.main.python.core.exception.error_message import ErrorMessage
@@ -9,9 +9,12 @@ from src.main.python.domain.repository.member_repository_interface import IMembe
 class MemberService:
     _MEMBER_IMAGE_CONTEXT = "member"
 
-    def __init__(self, member_repository: IMemberRepository, file_service: FileService):
+    def __init__(self, member_repository: IMemberRepository, file_service: FileService,
+                 after_commit: Callable[[Callable[[], None]], None]):
         self.repository = member_repository
         self.file_service = file_service
+        # 이전 이미지 참조 반납은 트랜잭션이 커밋된 뒤에 실행 (롤백되면 이미지는 계속 참조 중)
+        self.after_commit = after_commit
 
     def create(self, email: str, nickname: str, profile_image: Optional[str]) -> Member:
         # 닉네임 중복 체크
@@ -26,9 +29,11 @@ class MemberService:
             if self.repository.find_by_nickname(nickname):
                 raise ValueError(ErrorMessage.MEMBER_NICKNAME_DUPLICATE.value)
             member.change_nickname(nickname)
-        if profile_image is not None:
-            member.change_profile_image(profile_image)
-            self.file_service.confirm(profile_image, self._MEMBER_IMAGE_CONTEXT)
+        if profile_image is not None and profile_image != member.profile_image:
+            # 임시 경로가 아닌 이동된 경로(파생본도 같은 이름으로 이동됨)를 저장하고, 이전 이미지 참조는 커밋 후 반납
+            previous_image = member.profile_image
+            member.change_profile_image(self.file_service.confirm(profile_image, self._MEMBER_IMAGE_CONTEXT))
+            self.after_commit(lambda: self.file_service.release([previous_image]))
         if animal_name is not None:
             member.change_animal_name(animal_name)
         member.update_timestamp()
@@ -37,7 +42,10 @@ class MemberService:
     def soft_delete(self, member_id: int) -> Member:
         member = self.repository.find_by_id(member_id)
         member.change_displayed()
-        return self.repository.save(member)
+        member = self.repository.save(member)
+        profile_image = member.profile_image
+        self.after_commit(lambda: self.file_service.release([profile_image]))
+        return member
 
     def find_by_id(self, member_id: int) -> Optional[Member]:
         member = self.repository.find_by_id(member_id)
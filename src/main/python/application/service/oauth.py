@@ -1,5 +1,6 @@
 from src.main.python.Infrastructure.oauth.google_provider import GoogleOAuthProvider
 from src.main.python.application.service.member import MemberService
+from src.main.python.core.concurrency.service_call import call_service
 
 
 class AuthService:
@@ -13,8 +14,9 @@ class AuthService:
         userinfo = await self.google_manager.fetch_user_info(token.access_token)
         email = userinfo.get('email')
 
-        if not self.member_service.exists_by_email(email):
-            self.member_service.create(email, userinfo.get("name"), userinfo.get("picture"))
+        # member_service 는 DB_ASYNC 설정에 따라 동기/비동기 구현이 주입됨
+        if not await call_service(self.member_service.exists_by_email, email):
+            await call_service(self.member_service.create, email, userinfo.get("name"), userinfo.get("picture"))
 
-        member = self.member_service.find_by_email(email)
+        member = await call_service(self.member_service.find_by_email, email)
         return member.id, member.role.name.lower()
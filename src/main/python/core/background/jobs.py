@@ -0,0 +1,51 @@
+import logging
+
+from src.main.python.Infrastructure.config.database import unit_of_work, get_engines
+from src.main.python.Infrastructure.persistence.feed_repository import FeedRepository
+from src.main.python.Infrastructure.persistence.member_repository import MemberRepository
+from src.main.python.application.service.feed import FeedService
+from src.main.python.core.dependencies.feed_cache import get_feed_count_cache, get_feed_page_cache, get_feed_view_buffer
+from src.main.python.core.dependencies.file import get_file_service
+
+logger = logging.getLogger(__name__)
+
+
+def reconcile_feed_counts():
+    with unit_of_work() as session:
+        drifted = get_feed_count_cache().reconcile(FeedRepository(session).count)
+    if drifted:
+        logger.info("feed count cache reconciled - drifted keys: %d", drifted)
+
+
+def flush_feed_views():
+    buffer = get_feed_view_buffer()
+    counts = buffer.drain()
+    if not counts:
+        return
+    try:
+        with unit_of_work() as session:
+            FeedRepository(session).increase_views_bulk(counts)
+    except Exception:
+        buffer.restore(counts)
+        raise
+    # 조회수가 반영된 피드가 포함된 목록 페이지 캐시만 비움
+    FeedService.discard_feed_pages(get_feed_page_cache(), set(counts))
+
+
+def check_replica_health():
+    # 장애 복제본 제외 / 복구된 복제본 복귀 (DB_REPLICA_URLS 가 있을 때만 실행)
+    replica_set = get_engines().replica_set
+    if replica_set is not None:
+        replica_set.check_health()
+
+
+def collect_image_garbage():
+    # 참조 수가 0 인 이미지 정리, 지우기 전에 표시 중인 피드/회원이 아직 참조하는지 primary 에서 다시 확인
+    with unit_of_work(primary_only=True) as session:
+        feed_repository = FeedRepository(session)
+        member_repository = MemberRepository(session)
+        removed = get_file_service().collect_garbage(
+            lambda path: feed_repository.references_image(path) or member_repository.references_image(path)
+        )
+    if removed:
+        logger.info("image garbage collected - removed files: %d", removed)
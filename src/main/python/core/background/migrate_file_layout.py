@@ -0,0 +1,128 @@
+"""
+확정 파일을 샤딩 배치(<context>/ab/cd/<파일>)로 옮기는 온라인 마이그레이션 커맨드
+
+- 1단계: feeds(images, cover_image) → members(profile_image) 순으로 id 순 batch_size 개씩 처리합니다.
+  평면 배치 파일은 샤딩 위치에 하드 링크(다른 파일 시스템이면 복사)로 만들고, 배치마다 경로를 바꿔 커밋합니다.
+  이전 경로도 그대로 남아 있으므로 마이그레이션 중에도 아직 커밋 전인 경로를 계속 읽을 수 있습니다.
+- 진행 위치는 --state-file 에 배치마다 기록하며, 중단 후 다시 실행하면 이어서 처리합니다. (재처리해도 결과는 같음)
+- 2단계: 처음부터 한 번 더 훑어 남은 평면 경로(마이그레이션 중 다른 요청이 이전 경로로 저장한 행)까지 바꾼 뒤,
+  샤딩 위치에 같은 파일이 있는 이전 배치 파일을 지웁니다. (내용 주소 모드는 참조 수를 합침)
+- --dry-run 은 바뀔 경로 수만 보고하고 파일과 DB 는 건드리지 않습니다.
+
+실행: python -m src.main.python.core.background.migrate_file_layout --batch-size 500 [--dry-run] [--reset]
+"""
+import argparse
+import json
+import logging
+import os
+from typing import Dict, List, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from src.main.python.Infrastructure.config.database import unit_of_work
+from src.main.python.Infrastructure.persistence.feed_repository import FeedRepository
+from src.main.python.Infrastructure.persistence.member_repository import MemberRepository
+from src.main.python.application.service.file import FileService
+from src.main.python.core.dependencies.file import get_file_service
+
+logger = logging.getLogger(__name__)
+
+_TABLES = ("feeds", "members")
+
+
+def _load_state(state_path: Optional[str]) -> Dict[str, int]:
+    if state_path is None or not os.path.exists(state_path):
+        return {}
+    with open(state_path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def _save_state(state_path: Optional[str], state: Dict[str, int]):
+    if state_path is None:
+        return
+    # 중간에 끊겨도 깨진 파일이 남지 않도록 임시 파일에 쓰고 교체
+    with open(state_path + ".tmp", "w", encoding="utf-8") as file:
+        json.dump(state, file)
+    os.replace(state_path + ".tmp", state_path)
+
+
+def _relocate(file_service: FileService, paths: List[Optional[str]], dry_run: bool,
+              staged: Dict[str, str]) -> List[Optional[str]]:
+    # 한 배치 안에서 같은 경로(내용 주소 모드의 공유 파일)는 한 번만 처리
+    relocated = []
+    for path in paths:
+        if path not in staged:
+            staged[path] = file_service.stage_relocation(path, dry_run)
+        relocated.append(staged[path])
+    return relocated
+
+
+def _migrate_batch(file_service: FileService, table: str, last_id: int, batch_size: int, dry_run: bool,
+                   report: Dict[str, int]) -> Optional[int]:
+    # 배치마다 하나의 작업 단위 (dry-run 은 쓰기가 없으므로 커밋되지 않음), 다음 배치 시작 id 반환
+    staged: Dict[str, str] = {}
+    with unit_of_work(primary_only=True) as session:
+        if table == "feeds":
+            repository = FeedRepository(session)
+            rows = repository.find_image_paths(last_id, batch_size)
+            for feed_id, images in rows:
+                relocated = _relocate(file_service, images or [], dry_run, staged)
+                if relocated != images:
+                    report["feeds_updated"] += 1
+                    if not dry_run:
+                        repository.update_image_paths(feed_id, relocated)
+        else:
+            repository = MemberRepository(session)
+            rows = repository.find_profile_images(last_id, batch_size)
+            for member_id, profile_image in rows:
+                relocated = _relocate(file_service, [profile_image], dry_run, staged)[0]
+                if relocated != profile_image:
+                    report["members_updated"] += 1
+                    if not dry_run:
+                        repository.update_profile_image(member_id, relocated)
+
+    report["files_staged"] += sum(1 for old, new in staged.items() if old != new)
+    return rows[-1][0] if rows else None
+
+
+def _migrate_tables(file_service: FileService, state: Dict[str, int], state_path: Optional[str], batch_size: int,
+                    dry_run: bool, report: Dict[str, int]):
+    for table in _TABLES:
+        last_id = state.get(table, 0)
+        while True:
+            next_id = _migrate_batch(file_service, table, last_id, batch_size, dry_run, report)
+            if next_id is None:
+                break
+            last_id = next_id
+            if not dry_run:
+                state[table] = last_id
+                _save_state(state_path, state)
+        logger.info("%s migrated up to id %d", table, last_id)
+
+
+def migrate_file_layout(batch_size: int = 500, dry_run: bool = False, state_path: Optional[str] = None,
+                        reset: bool = False) -> Dict[str, int]:
+    file_service = get_file_service()
+    report = {"feeds_updated": 0, "members_updated": 0, "files_staged": 0, "previous_files_removed": 0}
+    state = {} if reset else _load_state(state_path)
+    _migrate_tables(file_service, state, state_path, batch_size, dry_run, report)
+    if dry_run:
+        return report
+
+    # 2단계: 전체를 다시 확인한 뒤 이전 배치 파일 정리 (상태 파일 없이 처음부터)
+    _migrate_tables(file_service, {}, None, batch_size, False, report)
+    report["previous_files_removed"] = file_service.remove_previous_layout()
+    return report
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="확정 파일을 샤딩 디렉터리 배치로 옮기고 DB 경로를 바꿉니다.")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--dry-run", action="store_true", help="바뀔 경로 수만 보고하고 파일/DB 는 수정하지 않음")
+    parser.add_argument("--state-file", default="file_layout_migration.json", help="진행 위치 기록 파일 (재실행 시 이어서 처리)")
+    parser.add_argument("--reset", action="store_true", help="진행 위치를 무시하고 처음부터 처리")
+    args = parser.parse_args()
+    print(migrate_file_layout(args.batch_size, args.dry_run, args.state_file, args.reset))
@@ -0,0 +1,20 @@
+import asyncio
+import logging
+from typing import Callable
+
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+
+async def run_periodically(interval_seconds: float, job: Callable[[], object]):
+    """
+    동기 job 을 interval_seconds 마다 스레드풀에서 실행합니다.
+    job 에서 발생한 예외는 로그만 남기고 다음 주기에 다시 실행합니다.
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await run_in_threadpool(job)
+        except Exception:
+            logger.exception("periodic job failed: %s", getattr(job, "__name__", job))
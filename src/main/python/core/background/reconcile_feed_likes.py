@@ -0,0 +1,60 @@
+"""
+피드 좋아요 카운터(feeds.likes) 재계산 커맨드
+
+- feeds 를 id 순으로 batch_size 만큼 나눠 feed_likes 의 실제 개수와 비교합니다.
+- 값이 다른 피드(drift)를 로그로 남기고, --dry-run 이 아니면 실제 개수로 다시 셉니다.
+- 다시 셀 때는 비교에 쓴 개수를 쓰지 않고 UPDATE 한 문장 안에서 COUNT 합니다.
+  (비교와 쓰기 사이에 들어온 좋아요/취소를 덮어쓰지 않음)
+
+실행: python -m src.main.python.core.background.reconcile_feed_likes --batch-size 500 [--dry-run]
+"""
+import argparse
+import logging
+from typing import Dict
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from src.main.python.Infrastructure.config.database import unit_of_work
+from src.main.python.Infrastructure.persistence.feed_like_repository import FeedLikeRepository
+from src.main.python.Infrastructure.persistence.feed_repository import FeedRepository
+
+logger = logging.getLogger(__name__)
+
+
+def reconcile_feed_likes(batch_size: int = 500, dry_run: bool = False) -> Dict[str, int]:
+    report = {"checked": 0, "drifted": 0, "total_drift": 0}
+    last_id = 0
+    while True:
+        # 배치마다 하나의 작업 단위 (dry-run 은 쓰기가 없으므로 커밋되지 않음)
+        with unit_of_work() as session:
+            feed_repository = FeedRepository(session)
+            counters = feed_repository.find_like_counters(last_id, batch_size)
+            if not counters:
+                break
+
+            actual_counts = FeedLikeRepository(session).count_by_feed_ids([feed_id for feed_id, _ in counters])
+            drifted = []
+            for feed_id, likes in counters:
+                actual = actual_counts.get(feed_id, 0)
+                if likes != actual:
+                    logger.warning("feed %d likes drift - stored: %d, actual: %d", feed_id, likes, actual)
+                    drifted.append(feed_id)
+                    report["total_drift"] += abs(likes - actual)
+            report["drifted"] += len(drifted)
+            if drifted and not dry_run:
+                feed_repository.recount_likes(drifted)
+
+        report["checked"] += len(counters)
+        last_id = counters[-1][0]
+    return report
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="feeds.likes 카운터를 feed_likes 기준으로 재계산합니다.")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--dry-run", action="store_true", help="drift 만 보고하고 값은 수정하지 않음")
+    args = parser.parse_args()
+    print(reconcile_feed_likes(args.batch_size, args.dry_run))
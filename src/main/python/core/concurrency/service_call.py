@@ -0,0 +1,17 @@
+import inspect
+from typing import Callable, Any
+
+from starlette.concurrency import run_in_threadpool
+
+from src.main.python.Infrastructure.monitoring.profiling import profiled
+
+
+async def call_service(method: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    서비스 메서드를 이벤트 루프를 막지 않고 호출합니다.
+    DB_ASYNC 설정에 따라 주입되는 서비스가 달라지므로, 비동기 서비스는 그대로 await 하고
+    동기 서비스는 스레드풀에서 실행합니다. (요청 프로파일링 중이면 스레드풀 호출도 프로파일러로 감쌈)
+    """
+    if inspect.iscoroutinefunction(method):
+        return await method(*args, **kwargs)
+    return await run_in_threadpool(profiled(method), *args, **kwargs)
@@ -0,0 +1,30 @@
+from functools import partial
+from typing import Callable, List, Optional
+
+from fastapi import Depends
+
+from src.main.python.Infrastructure.config.database import get_engines, get_session, get_async_session
+from src.main.python.Infrastructure.config.post_commit import after_commit
+from src.main.python.Infrastructure.config.replica import ReplicaSet
+from src.main.python.Infrastructure.monitoring.db_pool import PoolMetrics
+
+
+def get_db_pool_metrics() -> List[PoolMetrics]:
+    return get_engines().pool_metrics()
+
+
+def get_replica_set() -> Optional[ReplicaSet]:
+    # DB_REPLICA_URLS 가 없으면 None
+    return get_engines().replica_set
+
+
+AfterCommit = Callable[[Callable[[], None]], None]
+
+
+def get_sync_after_commit(session=Depends(get_session)) -> AfterCommit:
+    # 요청의 세션(리포지토리와 같은 세션)이 커밋된 뒤 실행할 작업을 등록하는 함수
+    return partial(after_commit, session)
+
+
+def get_async_after_commit(session=Depends(get_async_session)) -> AfterCommit:
+    return partial(after_commit, session.sync_session)
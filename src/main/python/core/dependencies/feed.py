@@ -0,0 +1,55 @@
+from fastapi import Depends
+
+from src.main.python.Infrastructure.config.database import get_session, get_async_session, DB_ASYNC
+from src.main.python.Infrastructure.persistence.async_feed_repository import AsyncFeedRepository
+from src.main.python.Infrastructure.persistence.feed_repository import FeedRepository
+from src.main.python.application.service.async_feed import AsyncFeedService
+from src.main.python.application.service.feed import FeedService
+from src.main.python.core.dependencies.database import get_sync_after_commit, get_async_after_commit
+from src.main.python.core.dependencies.feed_cache import get_feed_count_cache, get_feed_page_cache, get_feed_view_buffer
+from src.main.python.core.dependencies.feed_like import get_sync_feed_like_service, get_async_feed_like_service
+from src.main.python.core.dependencies.file import get_file_service
+from src.main.python.core.dependencies.member import get_sync_member_repository, get_async_member_repository
+from src.main.python.domain.repository.async_feed_repository_interface import IAsyncFeedRepository
+from src.main.python.domain.repository.feed_repository_interface import IFeedRepository
+
+
+def get_sync_feed_repository(session=Depends(get_session)) -> IFeedRepository:
+    return FeedRepository(session)
+
+
+def get_async_feed_repository(session=Depends(get_async_session)) -> IAsyncFeedRepository:
+    return AsyncFeedRepository(session)
+
+
+def get_sync_feed_service(
+        feed_repository: IFeedRepository = Depends(get_sync_feed_repository),
+        member_repository=Depends(get_sync_member_repository),
+        file_service=Depends(get_file_service),
+        feed_like_service=Depends(get_sync_feed_like_service),
+        feed_count_cache=Depends(get_feed_count_cache),
+        feed_page_cache=Depends(get_feed_page_cache),
+        feed_view_buffer=Depends(get_feed_view_buffer),
+        after_commit=Depends(get_sync_after_commit)
+) -> FeedService:
+    return FeedService(feed_repository, member_repository, file_service, feed_like_service, feed_count_cache,
+                       feed_page_cache, feed_view_buffer, after_commit)
+
+
+def get_async_feed_service(
+        feed_repository: IAsyncFeedRepository = Depends(get_async_feed_repository),
+        member_repository=Depends(get_async_member_repository),
+        file_service=Depends(get_file_service),
+        feed_like_service=Depends(get_async_feed_like_service),
+        feed_count_cache=Depends(get_feed_count_cache),
+        feed_page_cache=Depends(get_feed_page_cache),
+        feed_view_buffer=Depends(get_feed_view_buffer),
+        after_commit=Depends(get_async_after_commit)
+) -> AsyncFeedService:
+    return AsyncFeedService(feed_repository, member_repository, file_service, feed_like_service, feed_count_cache,
+                            feed_page_cache, feed_view_buffer, after_commit)
+
+
+# DB_ASYNC 설정에 따라 동기/비동기 구현을 선택
+get_feed_repository = get_async_feed_repository if DB_ASYNC else get_sync_feed_repository
+get_feed_service = get_async_feed_service if DB_ASYNC else get_sync_feed_service
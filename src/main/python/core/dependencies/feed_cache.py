@@ -0,0 +1,36 @@
+import os
+
+from src.main.python.Infrastructure.buffer.feed_view_buffer import FeedViewBuffer
+from src.main.python.Infrastructure.cache.feed_count import FeedCountCache
+from src.main.python.Infrastructure.cache.lru_ttl import LruTtlCache
+
+
+# 싱글톤 피드 개수 캐시 객체
+feed_count_cache_singleton = FeedCountCache(ttl_seconds=float(os.getenv("FEED_COUNT_CACHE_TTL", "300")))
+
+
+def get_feed_count_cache() -> FeedCountCache:
+    return feed_count_cache_singleton
+
+
+# 싱글톤 피드 목록 페이지 캐시 객체
+# - 피드 등록/수정/삭제는 캐시 전체를, 같은 프로세스의 좋아요/취소와 조회수 반영은 해당 피드가 포함된 페이지만 비웁니다.
+# - 다른 워커 프로세스의 변경은 비울 수 없으므로 좋아요/조회수는 최대 FEED_PAGE_CACHE_TTL 초 늦게 보일 수 있습니다.
+# - 조회수는 버퍼에 쌓였다가 반영되므로 목록에는 최대 FEED_VIEW_FLUSH_INTERVAL 초 (+ TTL) 늦게 보입니다.
+# - 회원별 값(has_liked)은 캐시하지 않고 요청마다 합칩니다.
+feed_page_cache_singleton = LruTtlCache(
+    max_entries=int(os.getenv("FEED_PAGE_CACHE_SIZE", "256")),
+    ttl_seconds=float(os.getenv("FEED_PAGE_CACHE_TTL", "30")),
+)
+
+
+def get_feed_page_cache() -> LruTtlCache:
+    return feed_page_cache_singleton
+
+
+# 싱글톤 피드 조회수 버퍼 객체
+feed_view_buffer_singleton = FeedViewBuffer()
+
+
+def get_feed_view_buffer() -> FeedViewBuffer:
+    return feed_view_buffer_singleton
@@ -1,18 +1,76 @@
+import os
+from typing import Set
+
 from fastapi import Depends
+from sqlmodel import Session
 
-from src.main.python.Infrastructure.config.database import get_session
+from src.main.python.Infrastructure.config.database import (
+    get_session, get_async_session, get_engines, read_your_writes, DB_ASYNC, FEED_LIKE_GROUP_COMMIT
+)
+from src.main.python.Infrastructure.persistence.async_feed_like_repository import AsyncFeedLikeRepository
 from src.main.python.Infrastructure.persistence.feed_like_repository import FeedLikeRepository
+from src.main.python.Infrastructure.pipeline.feed_like_pipeline import FeedLikeWritePipeline
+from src.main.python.application.service.async_feed_like import AsyncFeedLikeService
+from src.main.python.application.service.feed import FeedService
 from src.main.python.application.service.feed_like import FeedLikeService
-from src.main.python.core.dependencies.member import get_member_service
+from src.main.python.core.dependencies.database import get_sync_after_commit, get_async_after_commit
+from src.main.python.core.dependencies.feed_cache import get_feed_page_cache
+from src.main.python.core.dependencies.member import get_sync_member_service, get_async_member_service
+from src.main.python.domain.repository.async_feed_like_interface import IAsyncFeedLikeRepository
 from src.main.python.domain.repository.feed_like_interface import IFeedLikeRepository
 
+def discard_liked_feed_pages(feed_ids: Set[int]):
+    # 좋아요/취소가 커밋된 피드가 포함된 목록 페이지 캐시만 비움
+    FeedService.discard_feed_pages(get_feed_page_cache(), feed_ids)
+
+
+def pipeline_session() -> Session:
+    # 요청 풀이 아닌 파이프라인 전용 엔진 사용 (요청 풀 고갈 시 워커가 막혀 대기 중인 요청이 모두 503 이 되는 것 방지)
+    return Session(get_engines().pipeline_engine)
+
+
+# 싱글톤 좋아요 그룹 커밋 파이프라인 객체 (FEED_LIKE_GROUP_COMMIT=true 일 때만 사용)
+feed_like_pipeline_singleton = FeedLikeWritePipeline(
+    session_factory=pipeline_session,
+    window_seconds=float(os.getenv("FEED_LIKE_GROUP_COMMIT_WINDOW_MS", "5")) / 1000,
+    max_batch=int(os.getenv("FEED_LIKE_GROUP_COMMIT_MAX_BATCH", "500")),
+    mark_writer=read_your_writes.mark,
+    likes_changed=discard_liked_feed_pages,
+) if FEED_LIKE_GROUP_COMMIT else None
+
+
+def get_feed_like_pipeline():
+    return feed_like_pipeline_singleton
 
-def get_feed_like_repository(session=Depends(get_session)) -> IFeedLikeRepository:
+
+def get_sync_feed_like_repository(session=Depends(get_session)) -> IFeedLikeRepository:
     return FeedLikeRepository(session)
 
 
-def get_feed_like_service(
-        feed_like_repository: IFeedLikeRepository = Depends(get_feed_like_repository),
-        member_service=Depends(get_member_service)
+def get_async_feed_like_repository(session=Depends(get_async_session)) -> IAsyncFeedLikeRepository:
+    return AsyncFeedLikeRepository(session)
+
+
+def get_sync_feed_like_service(
+        feed_like_repository: IFeedLikeRepository = Depends(get_sync_feed_like_repository),
+        member_service=Depends(get_sync_member_service),
+        after_commit=Depends(get_sync_after_commit),
+        feed_like_pipeline=Depends(get_feed_like_pipeline)
 ) -> FeedLikeService:
-    return FeedLikeService(feed_like_repository, member_service)
+    return FeedLikeService(feed_like_repository, member_service, after_commit, discard_liked_feed_pages,
+                           feed_like_pipeline)
+
+
+def get_async_feed_like_service(
+        feed_like_repository: IAsyncFeedLikeRepository = Depends(get_async_feed_like_repository),
+        member_service=Depends(get_async_member_service),
+        after_commit=Depends(get_async_after_commit),
+        feed_like_pipeline=Depends(get_feed_like_pipeline)
+) -> AsyncFeedLikeService:
+    return AsyncFeedLikeService(feed_like_repository, member_service, after_commit, discard_liked_feed_pages,
+                                feed_like_pipeline)
+
+
+# DB_ASYNC 설정에 따라 동기/비동기 구현을 선택
+get_feed_like_repository = get_async_feed_like_repository if DB_ASYNC else get_sync_feed_like_repository
+get_feed_like_service = get_async_feed_like_service if DB_ASYNC else get_sync_feed_like_service
@@ -1,18 +1,33 @@
+import os
+from functools import lru_cache
+
+from src.main.python.Infrastructure.storage.content_addressed_file import ContentAddressedFileStorage
+from src.main.python.Infrastructure.storage.image_processing import ImageProcessingPool
 from src.main.python.Infrastructure.storage.local_file import LocalFileStorage
 from src.main.python.application.service.file import FileService
 from src.main.python.domain.storage.file_storage_interface import IFileStorage
 
-# 싱글톤 스토리지 객체
-local_file_storage_singleton = LocalFileStorage()
 
+# 싱글톤 이미지 처리 프로세스 풀 (워커 프로세스는 첫 업로드 때 생성)
+@lru_cache(maxsize=None)
+def get_image_processing_pool() -> ImageProcessingPool:
+    return ImageProcessingPool.from_env()
 
-def get_local_file_storage() -> IFileStorage:
-    return local_file_storage_singleton
 
+def content_addressed_storage_enabled() -> bool:
+    # FILE_STORAGE_MODE=content 이면 같은 이미지를 하나의 파일로 저장 (기본값 uuid: 업로드마다 새 파일)
+    return os.getenv("FILE_STORAGE_MODE", "uuid") == "content"
 
-# 싱글톤 FileService 객체
-file_service_singleton = FileService(local_file_storage_singleton)
+
+# 싱글톤 스토리지 객체 (첫 요청 시 생성, 임포트 시점에 환경 변수 읽기/디렉터리 생성을 하지 않음)
+@lru_cache(maxsize=None)
+def get_local_file_storage() -> IFileStorage:
+    if content_addressed_storage_enabled():
+        return ContentAddressedFileStorage(image_pool=get_image_processing_pool())
+    return LocalFileStorage(image_pool=get_image_processing_pool())
 
 
+# 싱글톤 FileService 객체
+@lru_cache(maxsize=None)
 def get_file_service() -> FileService:
-    return file_service_singleton
+    return FileService(get_local_file_storage())
@@ -1,19 +1,41 @@
 from fastapi import Depends
 
-from src.main.python.Infrastructure.config.database import get_session
+from src.main.python.Infrastructure.config.database import get_session, get_async_session, DB_ASYNC
+from src.main.python.Infrastructure.persistence.async_member_repository import AsyncMemberRepository
 from src.main.python.Infrastructure.persistence.member_repository import MemberRepository
+from src.main.python.application.service.async_member import AsyncMemberService
 from src.main.python.application.service.member import MemberService
+from src.main.python.core.dependencies.database import get_sync_after_commit, get_async_after_commit
 from src.main.python.core.dependencies.file import get_file_service
+from src.main.python.domain.repository.async_member_repository_interface import IAsyncMemberRepository
 from src.main.python.domain.repository.member_repository_interface import IMemberRepository
 
 
-def get_member_repository(session=Depends(get_session)) -> IMemberRepository:
+def get_sync_member_repository(session=Depends(get_session)) -> IMemberRepository:
     return MemberRepository(session)
 
 
+def get_async_member_repository(session=Depends(get_async_session)) -> IAsyncMemberRepository:
+    return AsyncMemberRepository(session)
+
+
 # 싱글톤 MemberService 객체는 불가 (repository가 매번 달라짐)
-def get_member_service(
-        member_repository: IMemberRepository = Depends(get_member_repository),
-        file_service=Depends(get_file_service)
+def get_sync_member_service(
+        member_repository: IMemberRepository = Depends(get_sync_member_repository),
+        file_service=Depends(get_file_service),
+        after_commit=Depends(get_sync_after_commit)
 ) -> MemberService:
-    return MemberService(member_repository, file_service)
+    return MemberService(member_repository, file_service, after_commit)
+
+
+def get_async_member_service(
+        member_repository: IAsyncMemberRepository = Depends(get_async_member_repository),
+        file_service=Depends(get_file_service),
+        after_commit=Depends(get_async_after_commit)
+) -> AsyncMemberService:
+    return AsyncMemberService(member_repository, file_service, after_commit)
+
+
+# DB_ASYNC 설정에 따라 동기/비동기 구현을 선택
+get_member_repository = get_async_member_repository if DB_ASYNC else get_sync_member_repository
+get_member_service = get_async_member_service if DB_ASYNC else get_sync_member_service
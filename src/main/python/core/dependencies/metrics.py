@@ -0,0 +1,54 @@
+from anyio import to_thread
+
+from prometheus_client import CollectorRegistry
+
+from src.main.python.Infrastructure.monitoring.metrics import gauge_callback, registry
+from src.main.python.core.dependencies.database import get_db_pool_metrics
+from src.main.python.core.dependencies.feed_cache import get_feed_page_cache
+from src.main.python.core.dependencies.file import get_image_processing_pool
+
+
+def _threadpool_samples():
+    # 기본 스레드풀(run_in_threadpool / 동기 라우트) 점유 현황, 이벤트 루프 안에서만 조회 가능
+    try:
+        limiter = to_thread.current_default_thread_limiter()
+    except RuntimeError:
+        return []
+    return [
+        ({"state": "busy"}, limiter.borrowed_tokens),
+        ({"state": "total"}, limiter.total_tokens),
+    ]
+
+
+def _db_pool_samples():
+    samples = []
+    for metrics in get_db_pool_metrics():
+        stats = metrics.stats()
+        samples.append(({"pool": stats["name"], "state": "checked_out"}, stats["checked_out"]))
+        samples.append(({"pool": stats["name"], "state": "capacity"}, stats["pool_size"] + stats["max_overflow"]))
+    return samples
+
+
+def _feed_page_cache_samples():
+    stats = get_feed_page_cache().stats()
+    return [({"stat": key}, value) for key, value in stats.items()]
+
+
+def _image_processing_samples():
+    stats = get_image_processing_pool().stats()
+    return [({"state": key}, value) for key, value in stats.items()]
+
+
+gauge_callback(
+    "petstagram_threadpool_tokens", "기본 스레드풀 점유 현황 (busy / total)", ("state",), _threadpool_samples)
+gauge_callback(
+    "petstagram_db_pool_connections", "DB 커넥션 풀 대여 중 연결 수와 최대 연결 수", ("pool", "state"), _db_pool_samples)
+gauge_callback(
+    "petstagram_feed_page_cache", "피드 목록 캐시 통계 (hits/misses 등은 누적 값)", ("stat",), _feed_page_cache_samples)
+gauge_callback(
+    "petstagram_image_processing_queue", "이미지 처리 대기열 깊이 (pending: 처리 중 + 대기 중, capacity, workers)",
+    ("state",), _image_processing_samples)
+
+
+def get_metrics_registry() -> CollectorRegistry:
+    return registry
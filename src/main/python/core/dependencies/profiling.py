@@ -0,0 +1,10 @@
+from typing import Optional
+
+from src.main.python.Infrastructure.monitoring.profiling import RequestProfiler
+
+# PROFILING_ADMIN_TOKEN / PROFILING_SAMPLE_RATE 가 없으면 None (프로파일링 비활성)
+request_profiler_singleton = RequestProfiler.from_env()
+
+
+def get_request_profiler() -> Optional[RequestProfiler]:
+    return request_profiler_singleton
@@ -4,6 +4,9 @@ import traceback
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 
+from src.main.python.domain.model.feed.exceptions import FeedLikePendingError
+from src.main.python.domain.storage.exceptions import ImageProcessingBusyError
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,6 +42,27 @@ def file_not_found_error_handler(request: Request, exc: FileNotFoundError) -> JS
         }
     )
 
+def image_processing_busy_error_handler(request: Request, exc: ImageProcessingBusyError) -> JSONResponse:
+    # 과부하 응답이므로 스택 트레이스 없이 경고만 남김
+    logger.warning(f"[{request.method}] {request.url.path} - {str(exc)}")
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={
+            "error": str(exc)
+        },
+        headers={"Retry-After": str(exc.retry_after)}
+    )
+
+def feed_like_pending_error_handler(request: Request, exc: FeedLikePendingError) -> JSONResponse:
+    # 결과를 알 수 없는 상태이므로 Retry-After 로 재시도를 유도하지 않음 (다시 조회해 확인)
+    logger.warning(f"[{request.method}] {request.url.path} - {str(exc)}")
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={
+            "error": str(exc)
+        }
+    )
+
 # def validation_error_handler(request: Request, exc: ValidationError) -> JSONResponse:
 #     tb = traceback.format_exc()
 #     logger.error(f"[{request.method}] {request.url.path} - {str(exc)}\n{tb}")
@@ -0,0 +1,31 @@
+import base64
+import json
+from datetime import datetime
+
+from src.main.python.core.exception.error_message import ErrorMessage
+
+
+class FeedCursor:
+    """
+    피드 목록 커서(Keyset) 페이지네이션용 커서
+
+    - created_at DESC, id DESC 정렬 기준의 마지막 항목 위치를 나타냅니다.
+    - 클라이언트에는 base64url 로 인코딩된 불투명 문자열로 전달됩니다.
+    """
+
+    def __init__(self, created_at: datetime, feed_id: int):
+        self.created_at = created_at
+        self.feed_id = feed_id
+
+    def encode(self) -> str:
+        payload = json.dumps({"c": self.created_at.isoformat(), "i": self.feed_id}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, value: str) -> "FeedCursor":
+        try:
+            padded = value + "=" * (-len(value) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            return cls(datetime.fromisoformat(payload["c"]), int(payload["i"]))
+        except Exception:
+            raise ValueError(ErrorMessage.FEED_INVALID_CURSOR.value)
@@ -0,0 +1,13 @@
+from src.main.python.core.exception.error_message import ErrorMessage
+
+
+class FeedLikePendingError(Exception):
+    """
+    그룹 커밋 파이프라인이 제한 시간 안에 좋아요/취소 결과를 돌려주지 못함 (503 으로 응답)
+
+    이벤트는 이미 대기열에 들어갔으므로 나중에 반영될 수도, 반영되지 않을 수도 있습니다. (결과 알 수 없음)
+    클라이언트는 피드를 다시 조회해 좋아요 여부(has_liked)를 확인해야 합니다.
+    """
+
+    def __init__(self):
+        super().__init__(ErrorMessage.FEED_LIKE_PENDING.value)
@@ -1,7 +1,7 @@
 from typing import Optional, List
 from datetime import datetime, timezone, timedelta
 
-from sqlmodel import SQLModel, Field, Column, JSON, Relationship
+from sqlmodel import SQLModel, Field, Column, JSON, Relationship, Index
 
 from src.main.python.domain.model.feed.feed_type import FeedType
 
@@ -18,6 +18,7 @@ class Feed(SQLModel, table=True):
     - member_id: 회원 ID (ForeignKey, members.id)
     - feed_type: 타입 (예: FOOD, CARE, MEDICAL, GROOMING)
     - images: 이미지 URL 리스트 (JSON 배열)
+    - cover_image: 대표 이미지 URL (images[0], 목록 조회 시 JSON 배열을 읽지 않기 위해 따로 저장)
     - content: 내용
     - likes: 좋아요 개수
     - views: 조회수
@@ -27,14 +28,25 @@ class Feed(SQLModel, table=True):
 
     Relationship:
     - member: 피드 작성자 (Member와의 관계)
+
+    Index:
+    - ix_feeds_displayed_created: 전체 목록 (displayed, created_at, id)
+    - ix_feeds_displayed_type_created: 타입별 목록 (displayed, feed_type, created_at, id)
+    - ix_feeds_member_displayed_created: 회원별 목록 (member_id, displayed, created_at)
     """
 
     __tablename__ = "feeds"
+    __table_args__ = (
+        Index("ix_feeds_displayed_created", "displayed", "created_at", "id"),
+        Index("ix_feeds_displayed_type_created", "displayed", "feed_type", "created_at", "id"),
+        Index("ix_feeds_member_displayed_created", "member_id", "displayed", "created_at"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     member_id: int = Field(foreign_key="members.id")
     feed_type: FeedType = Field(nullable=False)
     images: List[str] = Field(sa_column=Column(JSON, nullable=False))
+    cover_image: Optional[str] = Field(default=None, max_length=255)
     content: str
     likes: int = Field(default=0, nullable=False)
     views: int = Field(default=0, nullable=False)
@@ -50,12 +62,14 @@ class Feed(SQLModel, table=True):
             member_id=member_id,
             feed_type=FeedType.from_value(feed_type),
             images=images,
+            cover_image=images[0] if images else None,
             content=content
         )
 
     def change(self, feed_type: str, images: List[str], content: str):
         self.feed_type = FeedType.from_value(feed_type)
         self.images = images
+        self.cover_image = images[0] if images else None
         self.content = content
 
     def change_displayed(self):
@@ -1,7 +1,7 @@
 from typing import Optional
 from datetime import datetime, timezone, timedelta
 
-from sqlmodel import SQLModel, Field, UniqueConstraint
+from sqlmodel import SQLModel, Field, UniqueConstraint, Index
 
 
 class FeedLike(SQLModel, table=True):
@@ -14,6 +14,7 @@ class FeedLike(SQLModel, table=True):
     Description:
     - feed_likes 테이블은 피드에 대한 회원의 좋아요 기록을 저장합니다.
     - 하나의 회원이 같은 피드에 중복으로 좋아요를 남길 수 없도록 feed_id, member_id에 유니크 제약조건이 있습니다.
+    - 회원 기준 좋아요 조회를 위해 (member_id, feed_id) 인덱스가 있습니다.
 
     Field Description:
     - id: 고유 식별자 (AutoIncrement)
@@ -24,6 +25,7 @@ class FeedLike(SQLModel, table=True):
     __tablename__ = "feed_likes"
     __table_args__ = (
         UniqueConstraint("feed_id", "member_id", name="uq_feed_member"),
+        Index("ix_feed_likes_member_feed", "member_id", "feed_id"),
     )
 
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -0,0 +1,27 @@
+from datetime import datetime
+from typing import Optional
+
+from src.main.python.domain.model.feed.feed_type import FeedType
+
+
+class FeedSummary:
+    """
+    피드 목록 읽기 모델
+
+    - 목록 한 항목에 필요한 컬럼(작성자 컬럼 포함)만 담습니다. (images JSON 배열, Member 엔티티를 로딩하지 않음)
+    - 페이지마다 limit 개씩 만들어지므로 __slots__ 로 인스턴스 크기와 생성 비용을 줄입니다.
+    """
+    __slots__ = ("id", "feed_type", "cover_image", "content", "likes", "views", "created_at",
+                 "author_nickname", "author_profile_image")
+
+    def __init__(self, id: int, feed_type: FeedType, cover_image: Optional[str], content: str, likes: int,
+                 views: int, created_at: datetime, author_nickname: str, author_profile_image: Optional[str]):
+        self.id = id
+        self.feed_type = feed_type
+        self.cover_image = cover_image
+        self.content = content
+        self.likes = likes
+        self.views = views
+        self.created_at = created_at
+        self.author_nickname = author_nickname
+        self.author_profile_image = author_profile_image
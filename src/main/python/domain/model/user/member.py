@@ -1,7 +1,7 @@
 from typing import Optional
 from datetime import datetime, timezone, timedelta
 
-from sqlmodel import SQLModel, Field, Column, String
+from sqlmodel import SQLModel, Field, Column, String, Index
 
 from src.main.python.core.exception.error_message import ErrorMessage
 from src.main.python.domain.model.user.user_authority import UserAuthority
@@ -24,9 +24,15 @@ class Member(SQLModel, table=True):
     - displayed: 표시 여부 (소프트 삭제 시 False)
     - created_at: 생성 시각 (KST, 기본값: 현재 시간)
     - updated_at: 수정된 시각 (KST, 기본값: 현재 시간)
+
+    Index:
+    - ix_members_nickname: 닉네임 중복 확인/조회 (nickname)
     """
 
     __tablename__ = "members"
+    __table_args__ = (
+        Index("ix_members_nickname", "nickname"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     email: str = Field(sa_column=Column(String(255), nullable=False, unique=True))
@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from typing import Optional, List, Set
+
+from src.main.python.domain.model.feed.feed_like import FeedLike
+
+
+class IAsyncFeedLikeRepository(ABC):
+    @abstractmethod
+    async def save(self, feed_like: FeedLike) -> FeedLike:
+        pass
+
+    @abstractmethod
+    async def delete(self, feed_like: FeedLike):
+        pass
+
+    @abstractmethod
+    async def find_by_feed_id_and_member_id(self, feed_id: int, member_id: int) -> Optional[FeedLike]:
+        pass
+
+    @abstractmethod
+    async def exists_by_feed_id_and_member_id(self, feed_id: int, member_id: int) -> bool:
+        pass
+
+    @abstractmethod
+    async def find_liked_feed_ids(self, feed_ids: List[int], member_id: int) -> Set[int]:
+        pass
+
+    @abstractmethod
+    async def count_by_feed_id(self, feed_id: int) -> int:
+        pass
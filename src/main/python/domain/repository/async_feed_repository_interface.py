@@ -0,0 +1,35 @@
+from datetime import datetime
+from typing import Optional, List, Tuple
+from abc import ABC, abstractmethod
+
+from src.main.python.domain.model.feed.feed import Feed
+from src.main.python.domain.model.feed.feed_summary import FeedSummary
+
+
+class IAsyncFeedRepository(ABC):
+    @abstractmethod
+    async def save(self, feed: Feed) -> Feed:
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, feed_id: int) -> Optional[Feed]:
+        pass
+
+    @abstractmethod
+    async def paginate(self, offset: int, limit: int, feed_type: Optional[str] = None,
+                       member_id: Optional[int] = None) -> List[FeedSummary]:
+        pass
+
+    @abstractmethod
+    async def paginate_with_total(self, offset: int, limit: int, feed_type: Optional[str] = None,
+                                  member_id: Optional[int] = None) -> Tuple[List[FeedSummary], Optional[int]]:
+        pass
+
+    @abstractmethod
+    async def paginate_by_cursor(self, cursor_created_at: Optional[datetime], cursor_id: Optional[int], limit: int,
+                                 feed_type: Optional[str] = None, member_id: Optional[int] = None) -> List[FeedSummary]:
+        pass
+
+    @abstractmethod
+    async def count(self, feed_type: Optional[str], member_id: Optional[int]) -> int:
+        pass
@@ -0,0 +1,26 @@
+from typing import Optional
+from abc import ABC, abstractmethod
+
+from src.main.python.domain.model.user.member import Member
+
+
+class IAsyncMemberRepository(ABC):
+    @abstractmethod
+    async def save(self, member: Member) -> Member:
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, member_id: int) -> Optional[Member]:
+        pass
+
+    @abstractmethod
+    async def find_by_email(self, email: str) -> Optional[Member]:
+        pass
+
+    @abstractmethod
+    async def find_by_nickname(self, nickname: str) -> Optional[Member]:
+        pass
+
+    @abstractmethod
+    async def exists_by_email(self, email: str) -> bool:
+        pass
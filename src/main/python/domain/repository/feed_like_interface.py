@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, List, Set, Dict, Tuple
 
 from src.main.python.domain.model.feed.feed_like import FeedLike
 
@@ -13,6 +13,22 @@ class IFeedLikeRepository(ABC):
     def delete(self, feed_like_id: int):
         pass
 
+    @abstractmethod
+    def save_all(self, pairs: List[Tuple[int, int]]):
+        pass
+
+    @abstractmethod
+    def delete_all(self, pairs: List[Tuple[int, int]]):
+        pass
+
+    @abstractmethod
+    def find_existing_pairs(self, pairs: List[Tuple[int, int]]) -> Set[Tuple[int, int]]:
+        pass
+
+    @abstractmethod
+    def find_by_pairs(self, pairs: List[Tuple[int, int]]) -> List[FeedLike]:
+        pass
+
     @abstractmethod
     def find_by_feed_id_and_member_id(self, feed_id: int, member_id: int) -> Optional[FeedLike]:
         pass
@@ -21,6 +37,14 @@ class IFeedLikeRepository(ABC):
     def exists_by_feed_id_and_member_id(self, feed_id: int, member_id: int) -> bool:
         pass
 
+    @abstractmethod
+    def find_liked_feed_ids(self, feed_ids: List[int], member_id: int) -> Set[int]:
+        pass
+
+    @abstractmethod
+    def count_by_feed_ids(self, feed_ids: List[int]) -> Dict[int, int]:
+        pass
+
     @abstractmethod
     def count_by_feed_id(self, feed_id: int) -> int:
         pass
@@ -1,7 +1,9 @@
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Tuple, Dict
 from abc import ABC, abstractmethod
 
 from src.main.python.domain.model.feed.feed import Feed
+from src.main.python.domain.model.feed.feed_summary import FeedSummary
 
 
 class IFeedRepository(ABC):
@@ -18,9 +20,47 @@ class IFeedRepository(ABC):
         pass
 
     @abstractmethod
-    def paginate(self, offset: int, limit: int, feed_type: Optional[str] = None, member_id: Optional[int] = None) -> List[Feed]:
+    def paginate(self, offset: int, limit: int, feed_type: Optional[str] = None, member_id: Optional[int] = None) -> List[FeedSummary]:
         pass
 
     @abstractmethod
-    def count(self, feed_type: Optional[str], member_id: Optional[str]) -> int:
+    def paginate_with_total(self, offset: int, limit: int, feed_type: Optional[str] = None,
+                            member_id: Optional[int] = None) -> Tuple[List[FeedSummary], Optional[int]]:
+        pass
+
+    @abstractmethod
+    def paginate_by_cursor(self, cursor_created_at: Optional[datetime], cursor_id: Optional[int], limit: int,
+                           feed_type: Optional[str] = None, member_id: Optional[int] = None) -> List[FeedSummary]:
+        pass
+
+    @abstractmethod
+    def find_existing_ids(self, feed_ids: List[int]) -> List[int]:
+        pass
+
+    @abstractmethod
+    def find_like_counters(self, after_id: int, limit: int) -> List[Tuple[int, int]]:
+        pass
+
+    @abstractmethod
+    def recount_likes(self, feed_ids: List[int]):
+        pass
+
+    @abstractmethod
+    def increase_views_bulk(self, counts: Dict[int, int]):
+        pass
+
+    @abstractmethod
+    def count(self, feed_type: Optional[str], member_id: Optional[int]) -> int:
+        pass
+
+    @abstractmethod
+    def references_image(self, file_path: str) -> bool:
+        pass
+
+    @abstractmethod
+    def find_image_paths(self, after_id: int, limit: int) -> List[Tuple[int, List[str]]]:
+        pass
+
+    @abstractmethod
+    def update_image_paths(self, feed_id: int, images: List[str]):
         pass
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional, Tuple
 from abc import ABC, abstractmethod
 
 from src.main.python.domain.model.user.member import Member
@@ -24,3 +24,15 @@ class IMemberRepository(ABC):
     @abstractmethod
     def exists_by_email(self, email: str) -> bool:
         pass
+
+    @abstractmethod
+    def references_image(self, file_path: str) -> bool:
+        pass
+
+    @abstractmethod
+    def find_profile_images(self, after_id: int, limit: int) -> List[Tuple[int, Optional[str]]]:
+        pass
+
+    @abstractmethod
+    def update_profile_image(self, member_id: int, profile_image: str):
+        pass
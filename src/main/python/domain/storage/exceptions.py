@@ -0,0 +1,9 @@
+from src.main.python.core.exception.error_message import ErrorMessage
+
+
+class ImageProcessingBusyError(Exception):
+    """이미지 처리 대기열이 가득 찼거나 제한 시간 안에 처리하지 못함 (503 + Retry-After 로 응답)"""
+
+    def __init__(self, retry_after: int):
+        super().__init__(ErrorMessage.FILE_IMAGE_PROCESSING_BUSY.value)
+        self.retry_after = retry_after
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Callable, Optional
 from fastapi import UploadFile
 
 
@@ -23,3 +24,31 @@ class IFileStorage(ABC):
     @abstractmethod
     def file_exists(self, file_path: str) -> bool:
         pass
+
+    @abstractmethod
+    def resolve_variant(self, file_path: str, size: Optional[str] = None) -> str:
+        """size 파생본 경로 (파생본이 없으면 원본 경로), 둘 다 없으면 FileNotFoundError"""
+        pass
+
+    @abstractmethod
+    def release_file(self, file_path: Optional[str]):
+        """확정된 파일 참조 하나를 반납 (피드/회원 삭제, 이미지 교체 시)"""
+        pass
+
+    @abstractmethod
+    def collect_garbage(self, is_referenced: Optional[Callable[[str], bool]] = None) -> int:
+        """참조가 없는 파일을 지우고 지운 파일 수를 반환"""
+        pass
+
+    @abstractmethod
+    def stage_relocation(self, file_path: Optional[str], dry_run: bool = False) -> Optional[str]:
+        """
+        샤딩 전 배치의 파일을 현재 배치 위치에도 만들고(이전 경로는 그대로 유지) 새 경로를 반환
+        옮길 대상이 아니면 file_path 를 그대로 반환, dry_run 이면 파일은 건드리지 않음
+        """
+        pass
+
+    @abstractmethod
+    def remove_previous_layout(self) -> int:
+        """현재 배치 위치에 같은 파일이 있는 이전 배치 파일을 지우고 지운 수를 반환"""
+        pass
@@ -0,0 +1,55 @@
+import time
+
+from src.main.python.Infrastructure.monitoring.metrics import (
+    http_requests, http_request_duration, http_requests_in_flight
+)
+
+# 매칭되지 않은 경로(404 등)는 라벨 수가 늘지 않도록 하나로 묶음
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    라우트별 요청 수 / 처리 시간 히스토그램 / 처리 중 요청 수 기록 (순수 ASGI 미들웨어)
+
+    - route 라벨은 실제 경로가 아닌 라우트 템플릿(/feeds/{feed_id}) 을 사용합니다.
+    - status 라벨은 상태 클래스(2xx, 4xx, 5xx) 로 기록합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._in_flight = http_requests_in_flight
+        # (route, method, status_code) -> (카운터 series, 히스토그램 series), 요청마다 라벨 문자열을 만들지 않기 위한 캐시
+        self._series = {}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = [500]
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status_code[0] = message["status"]
+            await send(message)
+
+        self._in_flight.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self._in_flight.dec()
+            elapsed = time.perf_counter() - started
+            route = getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE
+            key = (route, scope["method"], status_code[0])
+            series = self._series.get(key)
+            if series is None:
+                series = self._series.setdefault(key, self._create_series(*key))
+            series[0].inc()
+            series[1].observe(elapsed)
+
+    @staticmethod
+    def _create_series(route: str, method: str, status_code: int):
+        labels = (route, method, f"{status_code // 100}xx")
+        return http_requests.labels(*labels), http_request_duration.labels(*labels)
@@ -0,0 +1,73 @@
+import logging
+import time
+
+from starlette.concurrency import run_in_threadpool
+
+from src.main.python.Infrastructure.monitoring.profiling import RequestProfiler, activate, deactivate
+
+logger = logging.getLogger("petstagram.profiling")
+
+PROFILE_ID_HEADER = b"x-profile-id"
+
+
+class ProfilingMiddleware:
+    """
+    온디맨드 요청 프로파일링 (순수 ASGI 미들웨어)
+
+    - PROFILING_ADMIN_TOKEN / PROFILING_SAMPLE_RATE 가 설정된 경우에만 등록됩니다. (비활성 시 오버헤드 없음)
+    - 관리자 헤더로 요청한 경우 응답 헤더 X-Profile-Id 로 결과 파일 이름의 식별자를 알려줍니다.
+    - 결과 파일은 응답을 보낸 뒤 스레드풀에서 기록합니다.
+    """
+
+    def __init__(self, app, profiler: RequestProfiler):
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trigger = self.profiler.trigger(scope)
+        profile = self.profiler.try_start() if trigger is not None else None
+        if profile is None:
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = self.profiler.new_profile_id()
+        status_code = [500]
+
+        async def send_with_profile_id(message):
+            if message["type"] == "http.response.start":
+                status_code[0] = message["status"]
+                if trigger == "admin":
+                    message["headers"] = list(message.get("headers", [])) + [(PROFILE_ID_HEADER, profile_id.encode())]
+            await send(message)
+
+        started = time.perf_counter()
+        token = activate(profile)
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            elapsed = time.perf_counter() - started
+            deactivate(token)
+            self.profiler.finish(profile)
+            await self._write(scope, profile, profile_id, trigger, status_code[0], elapsed)
+
+    async def _write(self, scope, profile, profile_id: str, trigger: str, status_code: int, elapsed_seconds: float):
+        route = getattr(scope.get("route"), "path", None) or scope["path"]
+        header = "\n".join([
+            f"route: {scope['method']} {route}",
+            f"path: {scope['path']}?{scope.get('query_string', b'').decode('latin-1')}",
+            f"status: {status_code}",
+            f"duration_ms: {elapsed_seconds * 1000:.2f}",
+            f"trigger: {trigger}",
+            f"profile_id: {profile_id}",
+        ])
+        name = self.profiler.file_name(scope["method"], route, profile_id)
+        try:
+            path = await run_in_threadpool(self.profiler.write, profile, name, header)
+        except Exception:
+            logger.exception("프로파일 기록 실패: %s", name)
+            return
+        logger.info("프로파일 기록: %s (%s %s, %.2fms)", path, scope["method"], route, elapsed_seconds * 1000)
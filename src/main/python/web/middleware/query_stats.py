@@ -0,0 +1,64 @@
+import json
+import logging
+import os
+import time
+
+from src.main.python.Infrastructure.monitoring.query_stats import track_request_queries
+
+logger = logging.getLogger("petstagram.query_stats")
+
+QUERY_COUNT_HEADER = b"x-db-query-count"
+QUERY_TIME_HEADER = b"x-db-query-time-ms"
+
+
+class QueryStatsMiddleware:
+    """
+    요청별 SQL 실행 횟수 / DB 시간 계측 (순수 ASGI 미들웨어)
+
+    - 응답 헤더 X-DB-Query-Count, X-DB-Query-Time-Ms 로 노출합니다.
+    - 요청마다 JSON 한 줄을 INFO 로 남기고, DB_QUERY_WARN_COUNT 를 넘으면 WARNING 으로 남깁니다. (N+1 탐지)
+    """
+
+    def __init__(self, app, warn_count: int = None):
+        self.app = app
+        self.warn_count = warn_count if warn_count is not None else int(os.getenv("DB_QUERY_WARN_COUNT", "20"))
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = [500]
+        with track_request_queries() as stats:
+            async def send_with_stats(message):
+                if message["type"] == "http.response.start":
+                    status_code[0] = message["status"]
+                    # 응답 시작 시점까지의 값 (커밋은 의존성 종료 시 응답 전에 끝남)
+                    message.setdefault("headers", [])
+                    message["headers"] = list(message["headers"]) + [
+                        (QUERY_COUNT_HEADER, str(stats.count).encode()),
+                        (QUERY_TIME_HEADER, f"{stats.seconds * 1000:.2f}".encode()),
+                    ]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_stats)
+            finally:
+                self._log(scope, status_code[0], stats, time.perf_counter() - started)
+
+    def _log(self, scope, status_code: int, stats, elapsed_seconds: float):
+        level = logging.WARNING if stats.count > self.warn_count else logging.INFO
+        if not logger.isEnabledFor(level):
+            return
+        route = scope.get("route")
+        logger.log(level, json.dumps({
+            "event": "db_query_stats",
+            "method": scope["method"],
+            "path": scope["path"],
+            "route": getattr(route, "path", None),
+            "status": status_code,
+            "query_count": stats.count,
+            "query_time_ms": round(stats.seconds * 1000, 2),
+            "duration_ms": round(elapsed_seconds * 1000, 2),
+        }, ensure_ascii=False))
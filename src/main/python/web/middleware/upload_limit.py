@@ -0,0 +1,80 @@
+import json
+from typing import Iterable
+
+from src.main.python.core.exception.error_message import ErrorMessage
+
+
+class _BodyTooLarge(Exception):
+    pass
+
+
+class UploadLimitMiddleware:
+    """
+    업로드 경로의 요청 본문 크기 제한 (순수 ASGI 미들웨어)
+
+    - Content-Length 가 제한을 넘으면 본문을 읽지 않고 바로 413 으로 응답합니다.
+    - Content-Length 가 없거나(chunked) 값보다 많이 들어오면, 받은 바이트를 세다가 제한을 넘는 순간 읽기를 멈추고 413 으로 응답합니다.
+      (multipart 파싱이 임시 파일에 끝까지 받아 쓰기 전에 끊음)
+    """
+
+    def __init__(self, app, max_body_bytes: int, paths: Iterable[str] = ("/file/upload-file",)):
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+        self.paths = frozenset(paths)
+        self._body = json.dumps({"error": ErrorMessage.FILE_TOO_LARGE.value}, ensure_ascii=False).encode()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                if value.isdigit() and int(value) > self.max_body_bytes:
+                    await self._reject(send)
+                    return
+                break
+
+        received = 0
+        too_large = False
+        response_started = False
+
+        async def limited_receive():
+            nonlocal received, too_large
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_bytes:
+                    too_large = True
+                    raise _BodyTooLarge()
+            return message
+
+        async def guarded_send(message):
+            nonlocal response_started
+            # 본문 파싱 중 끊기면 앱은 자체 오류 응답(400 등)을 만들므로 413 응답으로 바꿔 보냄
+            if too_large:
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:
+            # 읽기를 끊어서 생긴 예외는 413 으로 대신 응답
+            if not too_large or response_started:
+                raise
+        if too_large and not response_started:
+            await self._reject(send)
+
+    async def _reject(self, send):
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(self._body)).encode()),
+                (b"connection", b"close"),
+            ],
+        })
+        await send({"type": "http.response.body", "body": self._body})
@@ -1,6 +1,7 @@
-from typing import List
+from typing import List, Optional
 from pydantic import Field
 
+from src.main.python.Infrastructure.storage.image_variants import PROFILE_IMAGE_VARIANT, variant_path
 from src.main.python.domain.model.feed.feed import Feed
 from src.main.python.web.payload.response.base_response import BaseResponse
 
@@ -18,17 +19,17 @@ class FeedInfoResponse(BaseResponse):
     created_at: str = Field(..., description="피드 생성 일시 (ISO 8601 형식)")
 
     @classmethod
-    def from_feed(cls, feed: Feed, has_liked: bool, message: str) -> "FeedInfoResponse":
+    def from_feed(cls, feed: Feed, has_liked: bool, message: str, views: Optional[int] = None) -> "FeedInfoResponse":
         return cls(
             message=message,
             has_liked=has_liked,
             author_nickname=feed.member.nickname,
-            author_profile_image=feed.member.profile_image,
+            author_profile_image=variant_path(feed.member.profile_image, PROFILE_IMAGE_VARIANT),
             feed_id=feed.id,
             feed_type=feed.feed_type.value.lower(),
             images=feed.images,
             content=feed.content,
             likes=feed.likes,
-            views=feed.views,
+            views=feed.views if views is None else views,
             created_at=feed.created_at.isoformat(),
         )
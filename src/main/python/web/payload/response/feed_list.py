@@ -1,4 +1,5 @@
-from typing import List
+from typing import Any, Dict, List, Optional
+from fastapi.responses import ORJSONResponse
 from pydantic import Field
 
 from src.main.python.web.payload.response.base_response import BaseResponse
@@ -6,5 +7,20 @@ from src.main.python.web.payload.response.feed_list_item import FeedListItemResp
 
 
 class FeedListResponse(BaseResponse):
-    total: int = Field(..., description="전체 피드의 개수")
+    total: Optional[int] = Field(None, description="전체 피드의 개수 (커서 조회 시 생략)")
     feeds: List[FeedListItemResponse] = Field(..., description="피드 목록 (FeedListItemResponse 리스트)")
+    has_more: bool = Field(False, description="다음 페이지 존재 여부")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 조회용 커서 (커서 조회 시에만 반환)")
+
+    @classmethod
+    def render(cls, message: str, feeds: List[Dict[str, Any]], has_more: bool, total: Optional[int] = None,
+               next_cursor: Optional[str] = None) -> ORJSONResponse:
+        # 모델 생성/검증 없이 바로 JSON 응답을 만듭니다. (라우트가 Response 를 반환하면 response_model 재검증도 생략됨)
+        # feeds 는 FeedService 가 만든 dict(FeedListItemResponse 와 같은 키/순서), 키 순서는 모델 필드 순서와 동일하게 유지
+        return ORJSONResponse({
+            "message": message,
+            "total": total,
+            "feeds": feeds,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
+        })
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, status, Query
 
+from src.main.python.core.concurrency.service_call import call_service
 from src.main.python.core.dependencies.feed_like import get_feed_like_service
 from src.main.python.core.exception.error_message import ErrorMessage
 from src.main.python.web.payload.response.base_response import BaseResponse
@@ -17,7 +18,6 @@ feed_like_router = APIRouter(prefix="/feed/like", tags=["FeedLike"])
             "description": "피드 좋아요 성공",
             "content": {
                 "application/json": {
-                    "schema": BaseResponse.schema(),
                     "example": {
                         "message": "좋아요 성공"
                     }
@@ -48,6 +48,16 @@ feed_like_router = APIRouter(prefix="/feed/like", tags=["FeedLike"])
                     }
                 }
             }
+        },
+        503: {
+            "description": "좋아요 등록 결과를 알 수 없음 (좋아요 그룹 커밋 모드에서 처리 지연)",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "error": ErrorMessage.FEED_LIKE_PENDING.value
+                    }
+                }
+            }
         }
     },
     description="""
@@ -61,14 +71,15 @@ feed_like_router = APIRouter(prefix="/feed/like", tags=["FeedLike"])
     - 응답
       - 201: 좋아요 성공
       - 400: 이미 좋아요를 누른 경우, 회원이 존재하지 않는 경우
+      - 503: 그룹 커밋 모드에서 제한 시간 안에 처리되지 않음 (나중에 반영될 수도 있으므로 피드를 다시 조회해 확인)
     """
 )
-def register(
+async def register(
         feed_id: int,
         member_id: int = Query(..., description="좋아요를 누르는 회원 ID"),
         feed_like_service=Depends(get_feed_like_service)
 ) -> BaseResponse:
-    feed_like_service.like(feed_id, member_id)
+    await call_service(feed_like_service.like, feed_id, member_id)
     return BaseResponse(message="좋아요 성공")
 
 
@@ -82,7 +93,6 @@ def register(
             "description": "피드 좋아요 취소 성공",
             "content": {
                 "application/json": {
-                    "schema": BaseResponse.schema(),
                     "example": {
                         "message": "좋아요 취소 성공"
                     }
@@ -108,6 +118,16 @@ def register(
                     }
                 }
             }
+        },
+        503: {
+            "description": "좋아요 취소 결과를 알 수 없음 (좋아요 그룹 커밋 모드에서 처리 지연)",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "error": ErrorMessage.FEED_LIKE_PENDING.value
+                    }
+                }
+            }
         }
     },
     description="""
@@ -121,12 +141,13 @@ def register(
     - 응답
       - 200: 좋아요 취소 성공
       - 400: 좋아요 정보가 없는 경우
+      - 503: 그룹 커밋 모드에서 제한 시간 안에 처리되지 않음 (나중에 반영될 수도 있으므로 피드를 다시 조회해 확인)
     """
 )
-def remove(
+async def remove(
         feed_id: int,
         member_id: int = Query(..., description="좋아요를 취소하는 회원 ID"),
         feed_like_service=Depends(get_feed_like_service)
 ) -> BaseResponse:
-    feed_like_service.unlike(feed_id, member_id)
+    await call_service(feed_like_service.unlike, feed_id, member_id)
     return BaseResponse(message="좋아요 취소 성공")
@@ -3,7 +3,7 @@ from typing import Optional
 from fastapi import APIRouter, Depends, status, Query
 from starlette.responses import JSONResponse
 
-from src.main.python.application.service.feed import FeedService
+from src.main.python.core.concurrency.service_call import call_service
 from src.main.python.core.dependencies.feed import get_feed_service
 from src.main.python.core.exception.error_message import ErrorMessage
 from src.main.python.web.payload.request.feed_register import FeedRegisterRequest
@@ -22,12 +22,7 @@ feed_router = APIRouter(tags=["Feed"])
     status_code=status.HTTP_200_OK,
     responses={
         200: {
-            "description": "피드 목록 조회 성공",
-            "content": {
-                "application/json": {
-                    "schema": FeedListResponse.schema()
-                }
-            }
+            "description": "피드 목록 조회 성공"
         }
     },
     description="""
@@ -37,24 +32,41 @@ feed_router = APIRouter(tags=["Feed"])
     - 쿼리 파라미터
       - offset: 시작 위치 (기본값: 0)
       - limit: 조회 개수 (기본값: 4)
+      - cursor: 커서 기반 조회 시 사용 (첫 페이지는 빈 값 `cursor=`, 이후 응답의 next_cursor 전달)
       - feed_type: 피드 타입 필터 (선택)
       - member_id: 회원 ID로 필터링 (선택)
+      - exact_total: offset 조회 시 정확한 총 개수를 페이지와 함께 한 번에 조회 (기본값: false, 캐시된 개수 사용)
     - 응답
-      - 200: 피드 목록 및 총 개수 반환
+      - 200: 피드 목록 반환
+        - offset 조회: 총 개수(total)와 다음 페이지 존재 여부(has_more)
+        - 커서 조회: 다음 페이지 커서(next_cursor)와 다음 페이지 존재 여부(has_more), total 생략
     """
 )
-def get_feeds(
+async def get_feeds(
         offset: int = Query(0, description="조회 시작 위치"),
         limit: int = Query(4, description="한 번에 조회할 개수"),
+        cursor: Optional[str] = Query(None, description="커서 기반 조회용 커서 (첫 페이지는 빈 값)"),
         feed_type: Optional[str] = Query(None, description="피드 타입 필터"),
         member_id: Optional[int] = Query(None, description="회원 ID로 필터"),
-        feed_service: FeedService = Depends(get_feed_service)
+        exact_total: bool = Query(False, description="정확한 총 개수 조회 여부"),
+        feed_service=Depends(get_feed_service)
 ):
-    result = feed_service.paginate(offset, limit, feed_type, member_id)
-    return FeedListResponse(
+    # response_model 은 OpenAPI 스키마용으로 유지하고, 응답은 검증/재직렬화 없이 바로 JSON 으로 만듦
+    if cursor is not None:
+        result = await call_service(feed_service.paginate_by_cursor, cursor, limit, feed_type, member_id)
+        return FeedListResponse.render(
+            message="성공",
+            feeds=result["feeds"],
+            has_more=result["has_more"],
+            next_cursor=result["next_cursor"]
+        )
+
+    result = await call_service(feed_service.paginate, offset, limit, feed_type, member_id, exact_total)
+    return FeedListResponse.render(
         message="성공",
         total=result["total"],
-        feeds=result["feeds"]
+        feeds=result["feeds"],
+        has_more=result["has_more"]
     )
 
 
@@ -65,12 +77,7 @@ def get_feeds(
     status_code=status.HTTP_200_OK,
     responses={
         200: {
-            "description": "피드 상세 정보 반환",
-            "content": {
-                "application/json": {
-                    "schema": FeedInfoResponse.schema()
-                }
-            }
+            "description": "피드 상세 정보 반환"
         },
         400: {
             "description": "피드를 찾을 수 없음",
@@ -106,18 +113,19 @@ def get_feeds(
       - 400: 피드를 찾을 수 없음
     """
 )
-def retrieve(
+async def retrieve(
         feed_id: int,
         member_id: Optional[int] = Query(None, description="(선택) 피드 좋아요 여부 조회 시 필요"),
         feed_service=Depends(get_feed_service)
 ) -> FeedInfoResponse:
-    result = feed_service.view_feed(feed_id, member_id)
+    result = await call_service(feed_service.view_feed, feed_id, member_id)
     feed = result["feed"]
     has_liked = result["has_liked"]
     return FeedInfoResponse.from_feed(
         feed=feed,
         has_liked=has_liked,
         message="피드 조회 성공",
+        views=result["views"],
     )
 
 
@@ -179,11 +187,13 @@ def retrieve(
       - 400: 회원 정보를 찾을 수 없음
     """
 )
-def register(
+async def register(
         request: FeedRegisterRequest,
         feed_service=Depends(get_feed_service)
 ) -> JSONResponse:
-    feed = feed_service.create(request.member_id, request.subject, request.feed_type, request.images, request.content)
+    feed = await call_service(
+        feed_service.create, request.member_id, request.feed_type, request.images, request.content
+    )
     location = f"/feed/{feed.id}"
     return JSONResponse(
         status_code=status.HTTP_201_CREATED,
@@ -199,12 +209,7 @@ def register(
     status_code=status.HTTP_200_OK,
     responses={
         200: {
-            "description": "피드 수정 성공",
-            "content": {
-                "application/json": {
-                    "schema": BaseResponse.schema()
-                }
-            }
+            "description": "피드 수정 성공"
         },
         400: {
             "description": "피드를 찾을 수 없음",
@@ -239,18 +244,18 @@ def register(
       - 400: 피드를 찾을 수 없음
     """
 )
-def update(
+async def update(
         feed_id: int,
         request: FeedUpdateRequest,
         feed_service=Depends(get_feed_service)
 ) -> BaseResponse:
-    feed_service.update(
+    await call_service(
+        feed_service.update,
         feed_id=feed_id,
         subject=request.subject,
         content=request.content,
         feed_type=request.feed_type,
         images=request.images,
-        contents=request.contents,
     )
     return BaseResponse(message="피드 수정 성공")
 
@@ -262,12 +267,7 @@ def update(
     status_code=status.HTTP_200_OK,
     responses={
         200: {
-            "description": "피드 삭제 완료",
-            "content": {
-                "application/json": {
-                    "schema": BaseResponse.schema()
-                }
-            }
+            "description": "피드 삭제 완료"
         },
         400: {
             "description": "피드를 찾을 수 없음",
@@ -301,9 +301,9 @@ def update(
       - 400: 피드를 찾을 수 없음
     """
 )
-def soft_delete(
+async def soft_delete(
         feed_id: int,
         feed_service=Depends(get_feed_service)
 ) -> BaseResponse:
-    feed_service.soft_delete(feed_id)
+    await call_service(feed_service.soft_delete, feed_id)
     return BaseResponse(message="피드 삭제 완료")
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from fastapi import APIRouter, UploadFile, File, Depends, status, Query
 from starlette.responses import FileResponse
 from urllib.parse import unquote
@@ -39,6 +41,11 @@ file_router = APIRouter(prefix="/file", tags=["File"])
                             "value": {
                                 "error": ErrorMessage.FILE_NOT_FOUND.value
                             }
+                        },
+                        "invalid_size": {
+                            "value": {
+                                "error": ErrorMessage.FILE_INVALID_IMAGE_SIZE.value
+                            }
                         }
                     }
                 }
@@ -51,20 +58,23 @@ file_router = APIRouter(prefix="/file", tags=["File"])
     - 설명: 서버에 저장된 이미지 파일을 반환합니다.
     - 쿼리 파라미터
       - file_path: 조회할 이미지 파일의 전체 경로 (URL 인코딩 필요)
+      - size: 이미지 크기 (thumb, card, full), 생략 시 원본
+        - 파생본이 없는 기존 업로드는 원본을 반환합니다.
     - 응답
       - 200: 이미지 파일 반환 (image/jpeg, image/png 등)
-      - 400: 파일이 존재하지 않거나 잘못된 파일 경로
+      - 400: 파일이 존재하지 않거나 잘못된 파일 경로, 지원하지 않는 이미지 크기
     """
 )
 def get_image(
         file_path: str = Query(..., description="이미지 파일의 전체 경로 (URL 인코딩 필요)"),
+        size: Optional[str] = Query(None, description="이미지 크기 (thumb, card, full), 생략 시 원본"),
         file_service=Depends(get_file_service)
 ) -> FileResponse:
-    logger.info("GET /file/view 호출됨 - file_path: %s", file_path)
-    file_service.file_exists(file_path)
+    logger.info("GET /file/view 호출됨 - file_path: %s, size: %s", file_path, size)
     decoded_path = unquote(file_path).strip('"')
-    logger.info("Serving file from disk: %s", decoded_path)
-    return FileResponse(decoded_path, media_type="image/jpeg")
+    resolved_path = file_service.resolve_image(decoded_path, size)
+    logger.info("Serving file from disk: %s", resolved_path)
+    return FileResponse(resolved_path, media_type="image/jpeg")
 
 
 @file_router.post(
@@ -107,17 +117,53 @@ def get_image(
                     }
                 }
             }
+        },
+        413: {
+            "description": "업로드 크기 제한(FILE_UPLOAD_MAX_BYTES) 초과",
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "object",
+                        "properties": {
+                            "error": {"type": "string"}
+                        }
+                    },
+                    "example": {
+                        "error": ErrorMessage.FILE_TOO_LARGE.value
+                    }
+                }
+            }
+        },
+        503: {
+            "description": "이미지 처리 대기열 초과 (Retry-After 초 뒤 재시도)",
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "object",
+                        "properties": {
+                            "error": {"type": "string"}
+                        }
+                    },
+                    "example": {
+                        "error": ErrorMessage.FILE_IMAGE_PROCESSING_BUSY.value
+                    }
+                }
+            }
         }
     },
     description="""
     파일 업로드 API
 
     - 설명: 파일을 서버에 업로드하고 임시 경로를 반환합니다.
+      - 긴 변이 FILE_IMAGE_MAX_SIDE(기본 2048) 를 넘는 이미지는 그 크기로 줄여 저장합니다.
+      - 헤더의 픽셀 수가 FILE_IMAGE_MAX_PIXELS 를 넘으면 디코딩하지 않고 거절합니다.
     - 요청
       - file: 업로드할 파일 (multipart/form-data)
     - 응답
       - 200: 파일 업로드 성공, 임시 파일 경로 반환
-      - 400: 파일 업로드 실패
+      - 400: 파일 업로드 실패 (이미지가 아니거나 해상도 초과)
+      - 413: 업로드 크기 제한 초과
+      - 503: 이미지 처리 대기열이 가득 참 (Retry-After 헤더의 초만큼 기다린 뒤 재시도)
     """
 )
 def upload_file(
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, status, Request
 from fastapi.responses import JSONResponse
 
+from src.main.python.core.concurrency.service_call import call_service
 from src.main.python.core.dependencies.member import get_member_service
 from src.main.python.core.exception.error_message import ErrorMessage
 from src.main.python.web.payload.request.member_signup import MemberSignUpRequest
@@ -65,14 +66,14 @@ member_router = APIRouter(prefix="/member", tags=["Member"])
       - 401: 로그인 필요
     """
 )
-def retrieve_my_info(
+async def retrieve_my_info(
         request: Request,
         member_service=Depends(get_member_service)
 ) -> MemberInfoResponse:
     member_id = request.cookies.get("member_id")
     if not member_id:
         raise PermissionError(ErrorMessage.AUTH_NOT_LOGGED_IN)
-    member = member_service.find_by_id(int(member_id))
+    member = await call_service(member_service.find_by_id, int(member_id))
     return MemberInfoResponse.from_member(
         member=member,
         message="로그인 상태 조회 성공"
@@ -116,11 +117,11 @@ def retrieve_my_info(
       - 400: 회원 정보를 찾을 수 없음
     """
 )
-def retrieve(
+async def retrieve(
         member_id: int,
         member_service=Depends(get_member_service)
 ) -> MemberInfoResponse:
-    member = member_service.find_by_id(member_id)
+    member = await call_service(member_service.find_by_id, member_id)
     return MemberInfoResponse.from_member(
         member=member,
         message="회원 조회 성공"
@@ -161,11 +162,11 @@ def retrieve(
       - 400: 이메일 중복 또는 잘못된 요청
     """
 )
-def register(
+async def register(
         request: MemberSignUpRequest,
         member_service=Depends(get_member_service)
 ) -> JSONResponse:
-    member = member_service.create(request.email, request.nickname, request.profile_image)
+    member = await call_service(member_service.create, request.email, request.nickname, request.profile_image)
     location = f"/member/{member.id}"
     return JSONResponse(
         status_code=status.HTTP_201_CREATED,
@@ -214,12 +215,12 @@ def register(
       - 400: 회원 정보를 찾을 수 없음 또는 잘못된 닉네임
     """
 )
-def modify(
+async def modify(
         member_id: int,
         request: MemberUpdateRequest,
         member_service=Depends(get_member_service)
 ) -> BaseResponse:
-    member_service.update(member_id, request.nickname, request.profile_image)
+    await call_service(member_service.update, member_id, request.nickname, request.profile_image, request.animal_name)
     return BaseResponse(message="회원 정보 수정 성공")
 
 
@@ -257,9 +258,9 @@ def modify(
       - 400: 회원 정보를 찾을 수 없음
     """
 )
-def remove(
+async def remove(
         member_id: int,
         member_service=Depends(get_member_service)
 ) -> BaseResponse:
-    member_service.soft_delete(member_id)
+    await call_service(member_service.soft_delete, member_id)
     return BaseResponse(message="회원 탈퇴(비활성화) 완료")
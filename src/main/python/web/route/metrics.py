@@ -0,0 +1,46 @@
+from fastapi import APIRouter, Depends, Response, status
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+from src.main.python.core.dependencies.metrics import get_metrics_registry
+
+PROMETHEUS_CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+metrics_router = APIRouter(tags=["Monitoring"])
+
+
+@metrics_router.get(
+    "/metrics",
+    summary="Prometheus 메트릭 조회 API",
+    status_code=status.HTTP_200_OK,
+    response_class=Response,
+    responses={
+        200: {
+            "description": "Prometheus 텍스트 형식 메트릭 반환",
+            "content": {
+                PROMETHEUS_CONTENT_TYPE: {
+                    "example": '# HELP petstagram_http_requests_total HTTP 요청 수 (라우트 템플릿/메서드/상태 클래스별)\n'
+                               '# TYPE petstagram_http_requests_total counter\n'
+                               'petstagram_http_requests_total{route="/feeds",method="GET",status="2xx"} 1520\n'
+                }
+            }
+        }
+    },
+    description="""
+    Prometheus 메트릭 조회 API
+
+    - 설명: Prometheus 스크레이프용 텍스트 형식(0.0.4) 메트릭을 반환합니다.
+      - petstagram_http_requests_total, petstagram_http_request_duration_seconds: 라우트 템플릿/메서드/상태 클래스(2xx, 4xx, 5xx)별
+      - petstagram_http_requests_in_flight: 처리 중인 요청 수
+      - petstagram_threadpool_tokens: 기본 스레드풀 점유 현황
+      - petstagram_file_upload_bytes_total, petstagram_image_processing_duration_seconds: LocalFileStorage 업로드 바이트 / 이미지 처리 시간
+      - petstagram_image_processing_queue, petstagram_image_processing_queue_wait_seconds, petstagram_image_processing_rejected_total: 이미지 처리 대기열 깊이 / 대기 시간 / 거절 수
+      - petstagram_db_pool_connections, petstagram_feed_page_cache: 커넥션 풀 / 피드 목록 캐시 현황
+    - 응답
+      - 200: text/plain 메트릭 본문
+    """
+)
+async def get_metrics(
+        metrics_registry=Depends(get_metrics_registry)
+) -> Response:
+    # 스레드풀 점유 현황은 이벤트 루프 안에서만 읽을 수 있으므로 async 라우트로 둠
+    return Response(content=generate_latest(metrics_registry), media_type=PROMETHEUS_CONTENT_TYPE)
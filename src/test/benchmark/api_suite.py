@@ -0,0 +1,190 @@
+"""
+API 벤치마크 스위트 (임베디드 SQLite + 시드 데이터)
+
+- 회원/피드/좋아요를 시드합니다. 좋아요는 Zipf 분포라 소수의 인기 피드에 몰립니다.
+- 앱을 uvicorn 으로 띄운 뒤 시나리오별로 p50/p95/p99 지연 시간과 처리량을 측정합니다.
+  - feeds: GET /feeds (offset, 피드 타입 필터 섞음)
+  - feed_detail: GET /feed/{id} (Zipf 인기도로 피드 선택)
+  - feed_like: POST /feed/like/{id} (시드에 없는 (피드, 회원) 쌍)
+  - file_upload: POST /file/upload-file (1024x768 JPEG)
+  - file_view: GET /file/view
+- 결과는 JSON 으로 출력(--output 으로 파일 저장)하여 실행 간 비교에 사용합니다.
+- --thresholds 로 기준을 주면 위반 항목을 결과에 기록하고, --fail-on-threshold 이면 종료 코드 1 을 반환합니다.
+
+실행: python -m src.test.benchmark.api_suite --requests 500 --concurrency 32 \\
+        --thresholds src/test/benchmark/api_thresholds.json --fail-on-threshold --output bench.json
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+from src.test.benchmark.server import (
+    PROJECT_ROOT, seed_sqlite, sqlite_env, run_server, run_load, zipf_like_pairs, zipf_cumulative_weights, jpeg_bytes
+)
+
+SCENARIOS = ["feeds", "feed_detail", "feed_like", "file_upload", "file_view"]
+EXPECTED_STATUS = {"feeds": 200, "feed_detail": 200, "feed_like": 201, "file_upload": 200, "file_view": 200}
+_FEED_TYPE_FILTERS = [None, "food", "care"]
+
+
+def _build_requests(args, image_paths: List[str], upload_body: bytes) -> Dict[str, callable]:
+    rng = random.Random(args.seed + 1)
+    feed_ids = list(range(1, args.feeds + 1))
+    cumulative = zipf_cumulative_weights(args.feeds, args.zipf_s)
+
+    def popular_feed() -> int:
+        return rng.choices(feed_ids, cum_weights=cumulative)[0]
+
+    # 시드와 같은 난수로 기존 좋아요 쌍을 재현해, 좋아요 시나리오는 새 쌍만 사용 (중복 400 방지)
+    existing = set(zipf_like_pairs(args.members, args.feeds, args.likes, args.zipf_s, random.Random(args.seed)))
+    new_pairs, seen = [], set(existing)
+    while len(new_pairs) < args.requests * 2 and len(seen) < args.members * args.feeds:
+        pair = (popular_feed(), rng.randint(1, args.members))
+        if pair not in seen:
+            seen.add(pair)
+            new_pairs.append(pair)
+
+    def feeds(index: int):
+        feed_type = _FEED_TYPE_FILTERS[index % len(_FEED_TYPE_FILTERS)]
+        offset = rng.randint(0, 10) * 8
+        query = f"/feeds?offset={offset}&limit=8&member_id={index % args.members + 1}"
+        return "GET", query + (f"&feed_type={feed_type}" if feed_type else "")
+
+    def feed_detail(index: int):
+        return "GET", f"/feed/{popular_feed()}?member_id={index % args.members + 1}"
+
+    # 워밍업과 측정이 같은 쌍을 다시 쓰지 않도록 호출 순서대로 소비
+    pair_iterator = itertools.cycle(new_pairs)
+
+    def feed_like(index: int):
+        feed_id, member_id = next(pair_iterator)
+        return "POST", f"/feed/like/{feed_id}?member_id={member_id}"
+
+    def file_upload(index: int):
+        return "POST", "/file/upload-file", {"files": {"file": ("bench.jpeg", upload_body, "image/jpeg")}}
+
+    def file_view(index: int):
+        return "GET", "/file/view", {"params": {"file_path": image_paths[index % len(image_paths)]}}
+
+    return {"feeds": feeds, "feed_detail": feed_detail, "feed_like": feed_like,
+            "file_upload": file_upload, "file_view": file_view}
+
+
+def check_thresholds(results: Dict[str, dict], thresholds: Dict[str, dict]) -> List[dict]:
+    """
+    thresholds 형식: {"<scenario>": {"p50_ms": 최대, "p95_ms": 최대, "p99_ms": 최대,
+                                     "min_throughput_rps": 최소, "max_error_rate": 최대}}
+    """
+    violations = []
+    for scenario, limits in thresholds.items():
+        result = results.get(scenario)
+        if result is None:
+            continue
+        for key, limit in limits.items():
+            if key == "min_throughput_rps":
+                actual, failed = result["throughput_rps"], result["throughput_rps"] < limit
+            elif key == "max_error_rate":
+                actual, failed = result["error_rate"], result["error_rate"] > limit
+            else:
+                actual, failed = result[key], result[key] > limit
+            if failed:
+                violations.append({"scenario": scenario, "metric": key, "actual": actual, "limit": limit})
+    return violations
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--members", type=int, default=500)
+    parser.add_argument("--feeds", type=int, default=5000)
+    parser.add_argument("--likes", type=int, default=50000)
+    parser.add_argument("--zipf-s", type=float, default=1.1, help="좋아요/조회 인기도 Zipf 지수")
+    parser.add_argument("--seed", type=int, default=42, help="시드 데이터와 요청 순서의 난수 시드")
+    parser.add_argument("--requests", type=int, default=500, help="시나리오별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--async", dest="db_async", action="store_true", help="DB_ASYNC=true 경로로 측정")
+    parser.add_argument("--thresholds", help="시나리오별 기준 JSON 파일")
+    parser.add_argument("--fail-on-threshold", action="store_true", help="기준 위반 시 종료 코드 1")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    results = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        image_dir = os.path.join(work_dir, "feed")
+        os.makedirs(image_dir)
+        image_paths = []
+        for index in range(16):
+            image_path = os.path.join(image_dir, f"bench_{index}.jpeg")
+            with open(image_path, "wb") as image_file:
+                image_file.write(jpeg_bytes(1024, 768, rng_seed=index))
+            image_paths.append(image_path)
+
+        database_path = os.path.join(work_dir, "bench.db")
+        seeding_started = time.perf_counter()
+        seed_sqlite(database_path, args.members, args.feeds, args.likes, args.zipf_s, args.seed, image_paths)
+        seeding_seconds = time.perf_counter() - seeding_started
+
+        requests = _build_requests(args, image_paths, jpeg_bytes(1024, 768, rng_seed=99))
+        env = sqlite_env(database_path, work_dir, DB_ASYNC="true" if args.db_async else "false")
+        with run_server(env) as base_url:
+            for scenario in scenarios:
+                # 워밍업 (커넥션/캐시) 후 측정
+                run_load(base_url, requests[scenario], min(50, args.requests), args.concurrency)
+                result = run_load(base_url, requests[scenario], args.requests, args.concurrency)
+                expected = result["status_counts"].get(str(EXPECTED_STATUS[scenario]), 0)
+                result["error_rate"] = round(1 - expected / result["requests"], 4) if result["requests"] else 0.0
+                results[scenario] = result
+
+    thresholds = {}
+    if args.thresholds:
+        with open(args.thresholds) as thresholds_file:
+            thresholds = json.load(thresholds_file)
+    violations = check_thresholds(results, thresholds)
+
+    report = {
+        "meta": {
+            "revision": _git_revision(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "db_async": args.db_async,
+            "dataset": {"members": args.members, "feeds": args.feeds, "likes": args.likes,
+                        "zipf_s": args.zipf_s, "seed": args.seed, "seeding_seconds": round(seeding_seconds, 2)},
+            "requests_per_scenario": args.requests,
+            "concurrency": args.concurrency,
+        },
+        "results": results,
+        "thresholds": thresholds,
+        "violations": violations,
+    }
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            output_file.write(output + "\n")
+    return 1 if violations and args.fail_on_threshold else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""
+처리량 벤치마크: 동기(def 라우트 + 스레드풀) vs 비동기(DB_ASYNC=true, AsyncSession) 경로
+
+- 같은 SQLite 파일 DB 를 시드한 뒤 uvicorn 을 모드별로 띄우고, 피드 상세/목록/회원 조회를 섞어 동시 호출합니다.
+- 목록 페이지 캐시는 끄고(FEED_PAGE_CACHE_TTL=0) 모든 요청이 DB 를 거치도록 합니다.
+- 모드별 처리량과 p50/p95/p99 지연 시간을 JSON 으로 출력합니다.
+
+실행: python -m src.test.benchmark.async_vs_sync --requests 3000 --concurrency 64
+"""
+import argparse
+import json
+import os
+import tempfile
+
+from src.test.benchmark.server import seed_sqlite, sqlite_env, run_server, run_load
+
+
+def _request_mix(members: int, feeds: int):
+    def next_request(index: int) -> tuple:
+        feed_id = index * 7919 % feeds + 1
+        member_id = index % members + 1
+        kind = index % 3
+        if kind == 0:
+            return "GET", f"/feed/{feed_id}?member_id={member_id}"
+        if kind == 1:
+            return "GET", f"/feeds?offset={index % 50}&limit=8&member_id={member_id}"
+        return "GET", f"/member/{member_id}"
+    return next_request
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--members", type=int, default=100)
+    parser.add_argument("--feeds", type=int, default=2000)
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        database_path = os.path.join(work_dir, "bench.db")
+        seed_sqlite(database_path, args.members, args.feeds)
+        next_request = _request_mix(args.members, args.feeds)
+
+        for mode, db_async in (("sync", "false"), ("async", "true")):
+            env = sqlite_env(database_path, work_dir, DB_ASYNC=db_async, FEED_PAGE_CACHE_TTL="0")
+            with run_server(env) as base_url:
+                # 워밍업 후 측정
+                run_load(base_url, next_request, min(200, args.requests), args.concurrency)
+                results[mode] = run_load(base_url, next_request, args.requests, args.concurrency)
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+좋아요 쓰기 벤치마크: 요청별 커밋 vs 그룹 커밋 파이프라인
+
+- 임베디드 SQLite 파일 DB 에 회원/피드를 만든 뒤, 여러 스레드가 인기 피드 몇 개에 동시에 좋아요를 누릅니다.
+- 모드별 처리량(req/s)과 DB 커밋 횟수를 JSON 으로 출력합니다.
+
+실행: python -m src.test.benchmark.feed_like_group_commit --threads 16 --likes-per-thread 50
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import event
+from sqlmodel import SQLModel, Session, create_engine, select, func
+
+from src.main.python.Infrastructure.persistence.feed_like_repository import FeedLikeRepository
+from src.main.python.Infrastructure.persistence.member_repository import MemberRepository
+from src.main.python.Infrastructure.pipeline.feed_like_pipeline import FeedLikeWritePipeline
+from src.main.python.application.service.feed_like import FeedLikeService
+from src.main.python.application.service.member import MemberService
+from src.main.python.domain.model.feed.feed import Feed
+from src.main.python.domain.model.feed.feed_like import FeedLike
+from src.main.python.domain.model.user.member import Member
+from src.main.python.domain.model.user.user_authority import UserAuthority
+
+
+def _create_engine(path: str):
+    return create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False, "timeout": 60})
+
+
+def _seed(engine, members: int, feeds: int):
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([
+            Member(email=f"bench{i}@example.com", nickname=f"bench{i}", password="", role=UserAuthority.MEMBER)
+            for i in range(members)
+        ])
+        session.commit()
+        session.add_all([Feed.create(1, "food", [f"/bench/{i}.jpeg"], "bench") for i in range(feeds)])
+        session.commit()
+
+
+def _run(engine, pipeline, threads: int, likes_per_thread: int, hot_feeds: int) -> dict:
+    commits = [0]
+    listener = lambda *args: commits.__setitem__(0, commits[0] + 1)
+    event.listen(engine, "commit", listener)
+
+    def worker(thread_index: int):
+        for i in range(likes_per_thread):
+            member_id = thread_index * likes_per_thread + i + 1
+            with Session(engine) as session:
+                service = FeedLikeService(FeedLikeRepository(session),
+                                          MemberService(MemberRepository(session), None, None),
+                                          lambda callback: None, lambda feed_ids: None, pipeline)
+                service.like((member_id % hot_feeds) + 1, member_id)
+                if pipeline is None:
+                    # 요청 단위 커밋 (API 에서는 unit_of_work 가 수행, 그룹 커밋 모드는 파이프라인이 커밋)
+                    session.commit()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(worker, range(threads)))
+    elapsed = time.perf_counter() - started
+    event.remove(engine, "commit", listener)
+
+    total = threads * likes_per_thread
+    with Session(engine) as session:
+        stored = session.exec(select(func.count()).select_from(FeedLike)).one()
+    return {
+        "requests": total,
+        "stored_likes": stored,
+        "elapsed_seconds": round(elapsed, 4),
+        "throughput_rps": round(total / elapsed, 1),
+        "commits": commits[0],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--likes-per-thread", type=int, default=50)
+    parser.add_argument("--hot-feeds", type=int, default=3)
+    parser.add_argument("--window-ms", type=float, default=5)
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for mode in ("per_request_commit", "group_commit"):
+            engine = _create_engine(os.path.join(directory, f"{mode}.db"))
+            _seed(engine, args.threads * args.likes_per_thread, args.hot_feeds)
+            pipeline = None
+            if mode == "group_commit":
+                pipeline = FeedLikeWritePipeline(lambda: Session(engine), window_seconds=args.window_ms / 1000)
+            results[mode] = _run(engine, pipeline, args.threads, args.likes_per_thread, args.hot_feeds)
+            if pipeline is not None:
+                pipeline.stop()
+            engine.dispose()
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+피드 목록 조회 벤치마크: 엔티티 로딩(Feed + selectinload(Member)) vs 컬럼 프로젝션(FeedSummary)
+
+- 피드마다 이미지 여러 장(JSON 배열)과 긴 본문을 가진 SQLite DB 를 시드합니다.
+- 페이지 하나를 조회해 목록 항목 dict 를 만들 때까지의 지연 시간(중앙값)과 메모리를 비교합니다.
+  - peak_kib: 페이지 조회 중 tracemalloc 최대 할당량
+  - retained_kib: 조회 결과(엔티티 또는 FeedSummary)를 들고 있는 동안 남아 있는 할당량
+- 매 반복마다 새 세션을 사용해 identity map 캐시 효과를 제외합니다.
+
+실행: python -m src.test.benchmark.feed_list_projection --feeds 5000 --images 10 --limit 20
+"""
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+os.environ.setdefault("FILE_STORAGE_BASE_DIR", tempfile.mkdtemp())
+
+from sqlalchemy.orm import selectinload
+from sqlmodel import Session, create_engine, select, update
+
+import main  # noqa: F401 (모델 등록)
+from src.main.python.Infrastructure.persistence.feed_repository import FeedRepository
+from src.main.python.Infrastructure.persistence.feed_statements import filter_statement
+from src.main.python.application.service.feed import FeedService
+from src.main.python.domain.model.feed.feed import Feed
+from src.test.benchmark.server import seed_sqlite
+
+
+def _entity_page(session: Session, offset: int, limit: int):
+    # 변경 전 방식: Feed 전체 컬럼 + 작성자 Member 엔티티 로딩 후 images[0] 사용
+    statement = filter_statement(select(Feed).options(selectinload(Feed.member)), None, None)
+    feeds = list(session.exec(statement.order_by(Feed.created_at.desc(), Feed.id.desc()).offset(offset).limit(limit)))
+    items = [{
+        "author_nickname": feed.member.nickname,
+        "author_profile_image": feed.member.profile_image,
+        "feed_id": feed.id,
+        "feed_type": feed.feed_type.value.lower(),
+        "image": feed.images[0],
+        "content": feed.content,
+        "likes": feed.likes,
+        "views": feed.views,
+        "created_at": feed.created_at.isoformat(),
+    } for feed in feeds]
+    return feeds, items
+
+
+def _projection_page(session: Session, offset: int, limit: int):
+    summaries = FeedRepository(session).paginate(offset, limit)
+    return summaries, [FeedService.to_list_item(summary) for summary in summaries]
+
+
+def _measure(engine, load_page, pages: int, limit: int, iterations: int) -> dict:
+    latencies = []
+    for index in range(iterations):
+        with Session(engine) as session:
+            started = time.perf_counter()
+            load_page(session, index % pages * limit, limit)
+            latencies.append(time.perf_counter() - started)
+
+    with Session(engine) as session:
+        tracemalloc.start()
+        loaded = load_page(session, 0, limit)
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del loaded
+
+    return {
+        "latency_ms_p50": round(statistics.median(latencies) * 1000, 3),
+        "peak_kib": round(peak / 1024, 1),
+        "retained_kib": round(retained / 1024, 1),
+    }
+
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, default=200)
+    parser.add_argument("--feeds", type=int, default=5000)
+    parser.add_argument("--images", type=int, default=10, help="피드당 이미지 수")
+    parser.add_argument("--content-length", type=int, default=500)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=300)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        path = os.path.join(work_dir, "projection.db")
+        seed_sqlite(path, members=args.members, feeds=args.feeds)
+        engine = create_engine(f"sqlite:///{path}")
+        with engine.begin() as connection:
+            connection.execute(update(Feed).values(
+                images=[f"/bench/feed/{index:032x}.jpeg" for index in range(args.images)],
+                content="가" * args.content_length,
+            ))
+
+        pages = max(1, min(50, args.feeds // args.limit))
+        results = {
+            "entity": _measure(engine, _entity_page, pages, args.limit, args.iterations),
+            "projection": _measure(engine, _projection_page, pages, args.limit, args.iterations),
+        }
+        engine.dispose()
+
+    print(json.dumps({
+        "feeds": args.feeds, "images_per_feed": args.images, "limit": args.limit, "results": results,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main_benchmark()
@@ -0,0 +1,93 @@
+"""
+피드 목록 응답 직렬화 마이크로벤치마크: 피드 항목 하나당 직렬화 비용 (이전 경로 vs 빠른 경로)
+
+- before: FeedListResponse(...) 생성(항목별 FeedListItemResponse 검증) → FastAPI response_model 재검증/직렬화 → JSONResponse
+- after: FeedListResponse.render(...) (모델 생성/검증 없이 orjson 으로 바로 직렬화)
+- 두 경로의 JSON 결과가 같은지도 확인합니다.
+
+실행: python -m src.test.benchmark.feed_list_serialization --iterations 2000
+"""
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+os.environ.setdefault("FILE_STORAGE_BASE_DIR", tempfile.mkdtemp())
+
+from fastapi.routing import APIRoute, serialize_response
+from starlette.responses import JSONResponse
+
+import main
+from src.main.python.web.payload.response.feed_list import FeedListResponse
+
+
+def _items(count: int) -> list:
+    created_at = datetime(2025, 5, 1, 12, 0, 0)
+    return [
+        {
+            "has_liked": index % 3 == 0,
+            "author_nickname": f"member-{index % 50}",
+            "author_profile_image": f"/storage/profile/{index % 50:032x}.jpeg",
+            "feed_id": 100000 - index,
+            "feed_type": "dog",
+            "image": f"/storage/feed/{index:032x}.jpeg",
+            "content": "산책 다녀왔어요 🐶 " * 4,
+            "likes": index * 7 % 500,
+            "views": index * 13 % 5000,
+            "created_at": (created_at - timedelta(minutes=index)).isoformat(),
+        }
+        for index in range(count)
+    ]
+
+
+def _feeds_route() -> APIRoute:
+    return next(route for route in main.app.routes if isinstance(route, APIRoute) and route.path == "/feeds")
+
+
+async def _before(route: APIRoute, feeds: list) -> bytes:
+    model = FeedListResponse(message="성공", total=12345, feeds=feeds, has_more=True)
+    content = await serialize_response(field=route.response_field, response_content=model, is_coroutine=True)
+    return JSONResponse(content).body
+
+
+def _after(feeds: list) -> bytes:
+    return FeedListResponse.render(message="성공", total=12345, feeds=feeds, has_more=True).body
+
+
+def _measure(run, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        run()
+    return time.perf_counter() - started
+
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    route = _feeds_route()
+    loop = asyncio.new_event_loop()
+    results = []
+    for page_size in (4, 20, 100):
+        feeds = _items(page_size)
+        if json.loads(loop.run_until_complete(_before(route, feeds))) != json.loads(_after(feeds)):
+            raise SystemExit(f"JSON mismatch at page size {page_size}")
+
+        before = _measure(lambda: loop.run_until_complete(_before(route, feeds)), args.iterations)
+        after = _measure(lambda: _after(feeds), args.iterations)
+        results.append({
+            "page_size": page_size,
+            "before_us_per_item": round(before / args.iterations / page_size * 1e6, 3),
+            "after_us_per_item": round(after / args.iterations / page_size * 1e6, 3),
+            "speedup": round(before / after, 2),
+        })
+    loop.close()
+    print(json.dumps({"iterations": args.iterations, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main_benchmark()
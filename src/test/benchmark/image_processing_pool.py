@@ -0,0 +1,72 @@
+"""
+이미지 처리 프로세스 풀 벤치마크: 업로드가 몰릴 때 같은 워커의 다른 요청(GET /feeds) 지연 시간
+
+- inline: IMAGE_PROCESS_WORKERS=0 (요청 스레드에서 Pillow 처리, 기존 방식과 같음)
+- pool: IMAGE_PROCESS_WORKERS=코어 수, IMAGE_PROCESS_QUEUE_SIZE=--queue-size (가득 차면 503 + Retry-After)
+- 업로드 부하(--uploads 개, 동시 --upload-concurrency)를 흘리는 동안 GET /feeds 를 --reads 번 호출합니다.
+- 모드별 GET /feeds, 업로드 지연 시간과 상태 코드 분포를 JSON 으로 출력합니다.
+
+실행: python -m src.test.benchmark.image_processing_pool --uploads 40 --reads 400
+"""
+import argparse
+import json
+import os
+import tempfile
+import threading
+
+from src.test.benchmark.server import jpeg_bytes, run_load, run_server, seed_sqlite, sqlite_env
+
+
+def _run_mode(work_dir: str, name: str, overrides: dict, args, image: bytes) -> dict:
+    db_path = os.path.join(work_dir, f"{name}.db")
+    seed_sqlite(db_path, members=50, feeds=500)
+    env = sqlite_env(db_path, os.path.join(work_dir, f"storage-{name}"), **overrides)
+
+    with run_server(env) as base_url:
+        # 워커 프로세스 기동 비용이 측정에 섞이지 않도록 한 번 업로드해 둠
+        run_load(base_url, lambda _: ("POST", "/file/upload-file", {"files": {"file": ("w.jpg", image, "image/jpeg")}}), 1, 1)
+
+        upload_result = {}
+
+        def upload_load():
+            upload_result.update(run_load(
+                base_url,
+                lambda _: ("POST", "/file/upload-file", {"files": {"file": ("a.jpg", image, "image/jpeg")}}),
+                args.uploads, args.upload_concurrency,
+            ))
+
+        uploader = threading.Thread(target=upload_load)
+        uploader.start()
+        reads = run_load(base_url, lambda _: ("GET", "/feeds?limit=10"), args.reads, args.read_concurrency)
+        uploader.join()
+    return {"feeds": reads, "uploads": upload_result}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--uploads", type=int, default=40)
+    parser.add_argument("--upload-concurrency", type=int, default=8)
+    parser.add_argument("--reads", type=int, default=400)
+    parser.add_argument("--read-concurrency", type=int, default=4)
+    parser.add_argument("--queue-size", type=int, default=8)
+    parser.add_argument("--width", type=int, default=2400)
+    parser.add_argument("--height", type=int, default=1800)
+    args = parser.parse_args()
+
+    image = jpeg_bytes(args.width, args.height)
+    modes = {
+        "inline": {"IMAGE_PROCESS_WORKERS": "0", "IMAGE_PROCESS_QUEUE_SIZE": "1000"},
+        "pool": {"IMAGE_PROCESS_WORKERS": str(os.cpu_count() or 1), "IMAGE_PROCESS_QUEUE_SIZE": str(args.queue_size)},
+    }
+    with tempfile.TemporaryDirectory() as work_dir:
+        results = {name: _run_mode(work_dir, name, overrides, args, image) for name, overrides in modes.items()}
+
+    print(json.dumps({
+        "image": f"{args.width}x{args.height}",
+        "cpu_count": os.cpu_count(),
+        "modes": results,
+    }, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
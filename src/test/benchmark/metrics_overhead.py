@@ -0,0 +1,92 @@
+"""
+메트릭 기록 오버헤드 측정: MetricsMiddleware 유무에 따른 요청당 추가 시간과 /metrics 렌더링 시간
+
+- 아무 일도 하지 않는 ASGI 앱을 직접 호출해 미들웨어가 더하는 시간만 분리합니다. (네트워크/라우팅 제외)
+- 여러 스레드에서 동시에 observe() 할 때의 호출당 시간도 함께 측정합니다. (스레드풀 경로의 이미지 처리 기록)
+
+실행: python -m src.test.benchmark.metrics_overhead --requests 200000
+"""
+import argparse
+import asyncio
+import json
+import threading
+import time
+
+from prometheus_client import CollectorRegistry, Histogram, generate_latest
+
+from src.main.python.Infrastructure.monitoring.metrics import image_processing_duration
+from src.main.python.web.middleware.metrics import MetricsMiddleware
+
+
+class _Route:
+    path = "/feeds"
+
+
+async def _noop_app(scope, receive, send):
+    scope["route"] = _Route
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def _drive(app, requests: int) -> float:
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        pass
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app({"type": "http", "method": "GET", "path": "/feeds"}, receive, send)
+    return time.perf_counter() - started
+
+
+def _threaded_observe(threads: int, per_thread: int) -> float:
+    series = image_processing_duration.labels("bench")
+
+    def work():
+        for index in range(per_thread):
+            series.observe(index % 100 / 1000)
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - started
+
+
+def _render_seconds(routes: int) -> float:
+    bench_registry = CollectorRegistry()
+    histogram = Histogram("bench_duration_seconds", "bench", ("route", "method", "status"), registry=bench_registry)
+    for index in range(routes):
+        for status in ("2xx", "4xx", "5xx"):
+            histogram.labels(f"/route/{index}", "GET", status).observe(0.01)
+    started = time.perf_counter()
+    generate_latest(bench_registry)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    baseline = asyncio.run(_drive(_noop_app, args.requests))
+    instrumented = asyncio.run(_drive(MetricsMiddleware(_noop_app), args.requests))
+    threaded = _threaded_observe(args.threads, args.requests // args.threads)
+
+    print(json.dumps({
+        "requests": args.requests,
+        "baseline_us_per_request": round(baseline / args.requests * 1e6, 3),
+        "instrumented_us_per_request": round(instrumented / args.requests * 1e6, 3),
+        "overhead_us_per_request": round((instrumented - baseline) / args.requests * 1e6, 3),
+        "threaded_observe_us_per_call": round(threaded / (args.requests // args.threads * args.threads) * 1e6, 3),
+        "render_ms_100_routes": round(_render_seconds(100) * 1000, 3),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
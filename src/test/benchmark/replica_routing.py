@@ -0,0 +1,82 @@
+"""
+읽기 복제본 라우팅 검사 (primary / replica 두 개의 SQLite 파일)
+
+- primary 를 시드한 뒤 replica 로 복사하고, 이후 primary 만 수정해 복제 지연을 흉내 냅니다.
+- 확인 항목
+  1. 일반 조회는 replica(지연된 값)에서 읽음
+  2. 회원이 쓰기를 커밋하면 DB_READ_YOUR_WRITES_SECONDS 동안 그 회원의 조회는 primary 에서 읽음
+  3. 다른 회원의 조회는 계속 replica 에서 읽음
+  4. replica 에 접속할 수 없으면 요청은 primary 로 재시도되고 replica 는 제외(eject)됨
+  5. replica 가 복구되면 헬스 체크 후 다시 사용됨
+- 하나라도 실패하면 종료 코드 1 을 반환합니다.
+
+실행: python -m src.test.benchmark.replica_routing
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+_work_dir = tempfile.mkdtemp()
+_primary_path = os.path.join(_work_dir, "primary.db")
+_replica_path = os.path.join(_work_dir, "replica.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{_primary_path}"
+os.environ["DB_REPLICA_URLS"] = f"sqlite:///{_replica_path}"
+os.environ.setdefault("FILE_STORAGE_BASE_DIR", _work_dir)
+os.environ.setdefault("DB_PROFILE", "bench")
+os.environ.setdefault("DB_READ_YOUR_WRITES_SECONDS", "5")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+import main
+from src.main.python.Infrastructure.config import database
+from src.test.benchmark.server import seed_sqlite
+
+_UPDATE_BODY = {"subject": "s", "content": "written by member 1", "feed_type": "food", "images": ["/bench/feed/0.jpeg"]}
+
+
+def _content(client: TestClient, member_id: str) -> str:
+    response = client.get("/feed/1", headers={"Cookie": f"member_id={member_id}"})
+    return response.json().get("content") if response.status_code == 200 else f"HTTP {response.status_code}"
+
+
+def main_check() -> int:
+    checks = []
+
+    def check(name: str, actual, expected):
+        checks.append({"check": name, "actual": actual, "expected": expected, "ok": actual == expected})
+
+    with TestClient(main.app, raise_server_exceptions=False) as client:
+        seed_sqlite(_primary_path, members=3, feeds=5)
+        shutil.copyfile(_primary_path, _replica_path)
+        with database.get_engines().engine.begin() as connection:
+            connection.execute(text("UPDATE feeds SET content = 'primary only' WHERE id = 1"))
+
+        check("read goes to replica", _content(client, "2"), "bench 0")
+
+        response = client.put("/feed/1", json=_UPDATE_BODY, headers={"Cookie": "member_id=1"})
+        check("write goes to primary", response.status_code, 200)
+        check("writer reads own write from primary", _content(client, "1"), "written by member 1")
+        check("other member still reads replica", _content(client, "2"), "bench 0")
+
+        replica_engine = database.get_engines().replica_set.engines[0]
+        replica_engine.dispose()
+        os.replace(_replica_path, _replica_path + ".down")
+        os.mkdir(_replica_path)
+        check("replica down falls back to primary", _content(client, "3"), "written by member 1")
+        check("replica ejected", database.get_engines().replica_set.stats()[0]["healthy"], False)
+
+        os.rmdir(_replica_path)
+        os.replace(_replica_path + ".down", _replica_path)
+        database.get_engines().replica_set.check_health()
+        check("replica readmitted after health check", database.get_engines().replica_set.stats()[0]["healthy"], True)
+        check("read goes to replica again", _content(client, "3"), "bench 0")
+
+    print(json.dumps(checks, indent=2, ensure_ascii=False))
+    return 0 if all(item["ok"] for item in checks) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main_check())
@@ -0,0 +1,206 @@
+"""
+벤치마크 공용 도구: SQLite 시드, uvicorn 서버 실행, 동시 부하 발생, 지연 시간 통계
+"""
+import asyncio
+import io
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from itertools import accumulate
+from typing import Dict, List, Callable, Optional, Sequence, Tuple
+
+import httpx
+from PIL import Image
+from sqlmodel import SQLModel, Session, create_engine, insert, update, case
+
+from src.main.python.domain.model.feed.feed import Feed
+from src.main.python.domain.model.feed.feed_like import FeedLike
+from src.main.python.domain.model.feed.feed_type import FeedType
+from src.main.python.domain.model.user.member import Member
+from src.main.python.domain.model.user.user_authority import UserAuthority
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+_SEED_CHUNK = 2000
+
+
+def seed_sqlite(path: str, members: int, feeds: int, likes: int = 0, zipf_s: float = 1.1, rng_seed: int = 42,
+                image_paths: Optional[Sequence[str]] = None):
+    """
+    회원/피드/좋아요를 시드합니다.
+
+    - 좋아요는 피드 인기도가 Zipf(s=zipf_s) 분포를 따르도록 (feed, member) 쌍을 중복 없이 뽑고,
+      feeds.likes 도 같은 값으로 맞춥니다.
+    - image_paths 가 있으면 피드 이미지로 돌려 가며 사용합니다. (/file/view 벤치마크용 실제 파일)
+    """
+    engine = create_engine(f"sqlite:///{path}")
+    SQLModel.metadata.create_all(engine)
+    feed_types = list(FeedType)
+    base = datetime(2025, 1, 1)
+    with Session(engine) as session:
+        session.add_all([
+            Member(email=f"bench{i}@example.com", nickname=f"bench{i}", profile_image=f"/bench/member/{i}.jpeg",
+                   password="", role=UserAuthority.MEMBER)
+            for i in range(members)
+        ])
+        session.commit()
+        session.add_all([
+            Feed(member_id=i % members + 1, feed_type=feed_types[i % len(feed_types)],
+                 images=[image], cover_image=image, content=f"bench {i}", created_at=base + timedelta(minutes=i))
+            for i, image in enumerate(
+                image_paths[i % len(image_paths)] if image_paths else f"/bench/feed/{i}.jpeg" for i in range(feeds)
+            )
+        ])
+        session.commit()
+
+        pairs = zipf_like_pairs(members, feeds, likes, zipf_s, random.Random(rng_seed))
+        # SQLite 바인드 변수 개수 제한을 넘지 않도록 나눠서 INSERT / UPDATE
+        for start in range(0, len(pairs), _SEED_CHUNK):
+            session.exec(insert(FeedLike).values([
+                {"feed_id": feed_id, "member_id": member_id, "created_at": base}
+                for feed_id, member_id in pairs[start:start + _SEED_CHUNK]
+            ]))
+        per_feed: Dict[int, int] = {}
+        for feed_id, _ in pairs:
+            per_feed[feed_id] = per_feed.get(feed_id, 0) + 1
+        feed_counts = list(per_feed.items())
+        for start in range(0, len(feed_counts), _SEED_CHUNK):
+            chunk = dict(feed_counts[start:start + _SEED_CHUNK])
+            session.exec(update(Feed).where(Feed.id.in_(list(chunk))).values(
+                likes=case(chunk, value=Feed.id, else_=0)
+            ))
+        session.commit()
+    engine.dispose()
+
+
+def zipf_cumulative_weights(size: int, s: float) -> List[float]:
+    # 순위 k(1..size) 의 가중치 1/k^s 누적합 (random.choices 의 cum_weights 로 사용)
+    return list(accumulate(1.0 / (rank ** s) for rank in range(1, size + 1)))
+
+
+def zipf_like_pairs(members: int, feeds: int, likes: int, s: float, rng: random.Random) -> List[Tuple[int, int]]:
+    likes = min(likes, members * feeds)
+    cumulative = zipf_cumulative_weights(feeds, s)
+    feed_ids = list(range(1, feeds + 1))
+    pairs, seen = [], set()
+    while len(pairs) < likes:
+        feed_id = rng.choices(feed_ids, cum_weights=cumulative)[0]
+        member_id = rng.randint(1, members)
+        if (feed_id, member_id) not in seen:
+            seen.add((feed_id, member_id))
+            pairs.append((feed_id, member_id))
+    return pairs
+
+
+def jpeg_bytes(width: int = 1024, height: int = 768, rng_seed: int = 0) -> bytes:
+    # 압축이 너무 잘 되지 않도록 노이즈가 섞인 이미지를 생성
+    rng = random.Random(rng_seed)
+    image = Image.effect_noise((width, height), 64).convert("RGB")
+    image.paste((rng.randint(0, 255), rng.randint(0, 255), rng.randint(0, 255)), (0, 0, width // 2, height // 2))
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=90)
+    return buffer.getvalue()
+
+
+def sqlite_env(path: str, storage_dir: str, **overrides: str) -> Dict[str, str]:
+    env = dict(os.environ)
+    env.update({
+        "DATABASE_URL": f"sqlite:///{path}",
+        "ASYNC_DATABASE_URL": f"sqlite+aiosqlite:///{path}",
+        "FILE_STORAGE_BASE_DIR": storage_dir,
+        "DB_PROFILE": "bench",
+    })
+    env.update(overrides)
+    return env
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def run_server(env: Dict[str, str], port: Optional[int] = None, ready_path: str = "/feeds?limit=1",
+               timeout_seconds: float = 30):
+    port = port or free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=PROJECT_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + timeout_seconds
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError(f"server exited: {process.stderr.read().decode()[-2000:]}")
+            try:
+                if httpx.get(base_url + ready_path, timeout=1).status_code < 500:
+                    break
+            except httpx.HTTPError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError("server did not become ready")
+            time.sleep(0.1)
+        yield base_url
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+async def _load(base_url: str, next_request: Callable[[int], tuple], requests: int, concurrency: int) -> dict:
+    latencies: List[float] = []
+    errors = [0]
+    status_counts: Dict[int, int] = {}
+    counter = iter(range(requests))
+
+    async def worker(client: httpx.AsyncClient):
+        for index in counter:
+            method, path, *options = next_request(index)
+            started = time.perf_counter()
+            response = await client.request(method, path, **(options[0] if options else {}))
+            latencies.append(time.perf_counter() - started)
+            status_counts[response.status_code] = status_counts.get(response.status_code, 0) + 1
+            if response.status_code >= 500:
+                errors[0] += 1
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*[worker(client) for _ in range(concurrency)])
+        elapsed = time.perf_counter() - started
+    summary = summarize(latencies, elapsed, errors[0])
+    summary["status_counts"] = {str(code): count for code, count in sorted(status_counts.items())}
+    return summary
+
+
+def run_load(base_url: str, next_request: Callable[[int], tuple], requests: int, concurrency: int) -> dict:
+    """
+    next_request(index) 가 돌려주는 (method, path) 또는 (method, path, httpx 요청 옵션) 을
+    concurrency 개의 연결로 requests 번 호출합니다.
+    """
+    return asyncio.run(_load(base_url, next_request, requests, concurrency))
+
+
+def summarize(latencies: List[float], elapsed_seconds: float, errors: int = 0) -> dict:
+    ordered = sorted(latencies)
+
+    def percentile(p: float) -> float:
+        if not ordered:
+            return 0.0
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * p))] * 1000, 2)
+
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "elapsed_seconds": round(elapsed_seconds, 3),
+        "throughput_rps": round(len(ordered) / elapsed_seconds, 1) if elapsed_seconds else 0.0,
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+    }
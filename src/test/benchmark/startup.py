@@ -0,0 +1,90 @@
+"""
+기동 시간 벤치마크: main 임포트 시간과 프로세스 시작부터 첫 요청 응답까지의 시간
+
+- import_seconds: 새 인터프리터에서 `import main` 에 걸린 시간 (인터프리터 자체 기동 시간 제외)
+- first_request_seconds: uvicorn 프로세스 시작부터 첫 GET /feeds 응답까지의 시간
+  - empty_db: 빈 DB (create_all + 마이그레이션 수행)
+  - migrated_db: 최신 스키마 DB (스키마 확인 조회 한 번만 수행)
+- 각 항목을 --runs 번 반복해 중앙값과 최솟값을 JSON 으로 출력합니다.
+
+실행: python -m src.test.benchmark.startup --runs 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+from src.test.benchmark.server import PROJECT_ROOT, free_port, sqlite_env
+
+_IMPORT_SNIPPET = "import time; started = time.perf_counter(); import main; print(time.perf_counter() - started)"
+
+
+def _import_seconds(env: dict) -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", _IMPORT_SNIPPET], cwd=PROJECT_ROOT, env=env, check=True,
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+    ).stdout
+    return float(output.decode().strip().splitlines()[-1])
+
+
+def _first_request_seconds(env: dict, timeout_seconds: float = 60) -> float:
+    port = free_port()
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=PROJECT_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+    )
+    try:
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError(f"server exited: {process.stderr.read().decode()[-2000:]}")
+            try:
+                if httpx.get(f"http://127.0.0.1:{port}/feeds?limit=1", timeout=1).status_code < 500:
+                    return time.perf_counter() - started
+            except httpx.HTTPError:
+                pass
+            if time.perf_counter() - started > timeout_seconds:
+                raise RuntimeError("server did not become ready")
+            time.sleep(0.005)
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def _summary(samples: list) -> dict:
+    return {"median": round(statistics.median(samples), 4), "min": round(min(samples), 4)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        storage_dir = os.path.join(work_dir, "storage")
+        import_samples, empty_samples, migrated_samples = [], [], []
+        for run in range(args.runs):
+            db_path = os.path.join(work_dir, f"startup-{run}.db")
+            env = sqlite_env(db_path, storage_dir)
+            import_samples.append(_import_seconds(env))
+            empty_samples.append(_first_request_seconds(env))
+            migrated_samples.append(_first_request_seconds(env))
+
+    print(json.dumps({
+        "runs": args.runs,
+        "import_seconds": _summary(import_samples),
+        "first_request_seconds": {
+            "empty_db": _summary(empty_samples),
+            "migrated_db": _summary(migrated_samples),
+        },
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
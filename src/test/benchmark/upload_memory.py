@@ -0,0 +1,100 @@
+"""
+업로드 이미지 처리의 최대 메모리(RSS) 벤치마크: 원본 해상도 디코딩 vs 축소 디코딩(draft/reduce)
+
+- full_decode: 원본 해상도로 디코딩 → RGB 변환 → 원본 저장 → 파생본 생성 (축소 디코딩 도입 전 방식)
+- scaled_decode: process_upload (JPEG 은 draft 로 DCT 단계에서 축소 디코딩, 그 외는 reduce 후 LANCZOS)
+- 각 경우를 새 프로세스에서 한 번씩 실행해 최대 RSS 증가분(임포트 이후, Linux VmHWM)과 처리 시간을 측정합니다.
+- 이미지 크기(메가픽셀)별 결과를 JSON 으로 출력합니다.
+
+실행: python -m src.test.benchmark.upload_memory --megapixels 12 24 48
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+from PIL import Image
+
+from src.main.python.Infrastructure.storage.image_processing import (
+    ORIGINAL_IMAGE_QUALITY, _save_variants, process_upload
+)
+from src.test.benchmark.server import PROJECT_ROOT
+
+_MODES = ("full_decode", "scaled_decode")
+
+
+def _full_decode(source_path: str, file_path: str):
+    image = Image.open(source_path).convert("RGB")
+    image.save(file_path, format="JPEG", quality=ORIGINAL_IMAGE_QUALITY)
+    _save_variants(image, file_path)
+
+
+def _rss_kib(field: str) -> int:
+    # Linux /proc/self/status 의 VmHWM(최대 RSS) / VmRSS, 단위 KiB
+    with open("/proc/self/status") as status:
+        return int(re.search(field + r":\s+(\d+)", status.read()).group(1))
+
+
+def _child(mode: str, source_path: str, output_dir: str):
+    # 임포트 중 최대치가 섞이지 않도록 최대 RSS 기록을 현재 값으로 초기화
+    with open("/proc/self/clear_refs", "w") as clear_refs:
+        clear_refs.write("5")
+    baseline = _rss_kib("VmRSS")
+    started = time.perf_counter()
+    target = os.path.join(output_dir, f"{mode}.jpeg")
+    (process_upload if mode == "scaled_decode" else _full_decode)(source_path, target)
+    elapsed = time.perf_counter() - started
+    print(json.dumps({
+        "peak_rss_delta_mib": round((_rss_kib("VmHWM") - baseline) / 1024, 1),
+        "seconds": round(elapsed, 3),
+        "stored_size": list(Image.open(target).size),
+    }))
+
+
+def _measure(mode: str, source_path: str, output_dir: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-m", "src.test.benchmark.upload_memory", "--child", mode, source_path, output_dir],
+        cwd=PROJECT_ROOT, check=True, stdout=subprocess.PIPE,
+    ).stdout
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+
+def _photo_like_jpeg(path: str, megapixels: int):
+    # 4:3 비율, 그라디언트 + 노이즈로 실제 사진과 비슷한 압축률
+    width = int((megapixels * 1_000_000 * 4 / 3) ** 0.5)
+    height = width * 3 // 4
+    gradient = Image.linear_gradient("L").resize((width, height))
+    noise = Image.effect_noise((width, height), 24)
+    Image.merge("RGB", (gradient, noise, gradient.transpose(Image.Transpose.FLIP_LEFT_RIGHT))).save(
+        path, format="JPEG", quality=90)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--megapixels", type=int, nargs="+", default=[12, 24, 48])
+    parser.add_argument("--child", nargs=3, metavar=("MODE", "SOURCE", "OUTPUT_DIR"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(*args.child)
+        return
+
+    results = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        for megapixels in args.megapixels:
+            source_path = os.path.join(work_dir, f"{megapixels}mp.jpg")
+            _photo_like_jpeg(source_path, megapixels)
+            results[f"{megapixels}mp"] = {
+                "source_bytes": os.path.getsize(source_path),
+                **{mode: _measure(mode, source_path, work_dir) for mode in _MODES},
+            }
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+pytest 공용 fixture
+
+- 앱 임포트 전에 임시 SQLite 파일 DB 와 파일 저장소를 환경 변수로 지정합니다. (.env 의 운영 DB 를 쓰지 않음)
+- client: 시드된 DB 와 비워진 캐시로 시작하는 TestClient (테스트마다 데이터 초기화)
+- reset_caches: 테스트 중간에 피드 캐시를 다시 비우는 함수 (캐시 hit 없이 쿼리 개수를 비교할 때)
+- query_budget: 블록 안에서 실행된 SQL 개수(와 DB 시간)가 예산을 넘으면 실패시킵니다.
+
+    def test_feed_list_has_no_n_plus_one(client, query_budget):
+        with query_budget(3):
+            client.get("/feeds?limit=20&member_id=1")
+
+실행: python -m pytest -q (프로젝트 루트에서)
+"""
+import os
+import tempfile
+
+_work_dir = tempfile.mkdtemp(prefix="petstagram-test-")
+_database_path = os.path.join(_work_dir, "test.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{_database_path}"
+os.environ["ASYNC_DATABASE_URL"] = f"sqlite+aiosqlite:///{_database_path}"
+os.environ["FILE_STORAGE_BASE_DIR"] = _work_dir
+os.environ["DB_PROFILE"] = "bench"
+os.environ["IMAGE_PROCESS_WORKERS"] = "0"
+# 백그라운드 작업의 SQL 이 쿼리 개수 측정에 섞이지 않도록 테스트 중에는 돌지 않게 함
+os.environ["FEED_COUNT_RECONCILE_INTERVAL"] = "3600"
+os.environ["FEED_VIEW_FLUSH_INTERVAL"] = "3600"
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import delete
+
+import main
+from src.main.python.Infrastructure.config.database import get_engines
+from src.main.python.Infrastructure.monitoring.query_stats import query_budget as _query_budget
+from src.main.python.core.dependencies.feed_cache import get_feed_count_cache, get_feed_page_cache, get_feed_view_buffer
+from src.main.python.domain.model.feed.feed import Feed
+from src.main.python.domain.model.feed.feed_like import FeedLike
+from src.main.python.domain.model.user.member import Member
+from src.test.benchmark.server import seed_sqlite
+
+SEED_MEMBERS = 5
+SEED_FEEDS = 40
+SEED_LIKES = 60
+
+
+def reset_feed_caches():
+    # 프로세스 싱글톤 캐시/버퍼 초기화 (이전 테스트나 요청의 캐시 hit 가 측정에 섞이지 않게 함)
+    get_feed_count_cache().clear()
+    get_feed_page_cache().clear()
+    get_feed_view_buffer().drain()
+
+
+@pytest.fixture(scope="session")
+def app_client():
+    with TestClient(main.app) as client:
+        yield client
+
+
+@pytest.fixture
+def client(app_client):
+    with get_engines().engine.begin() as connection:
+        for model in (FeedLike, Feed, Member):
+            connection.execute(delete(model))
+    seed_sqlite(_database_path, members=SEED_MEMBERS, feeds=SEED_FEEDS, likes=SEED_LIKES)
+    reset_feed_caches()
+    yield app_client
+    reset_feed_caches()
+
+
+@pytest.fixture
+def reset_caches():
+    return reset_feed_caches
+
+
+@pytest.fixture
+def query_budget():
+    return _query_budget
@@ -0,0 +1,151 @@
+"""
+좋아요 그룹 커밋 파이프라인 검사
+
+- 결과는 커밋된 행(id 포함) 또는 None 이어야 합니다.
+- 다른 프로세스의 INSERT 와 충돌해도 배치 전체가 실패하지 않아야 합니다.
+- 제한 시간 안에 결과가 없으면 503 (결과 알 수 없음) 으로 응답해야 합니다.
+- 요청 풀 크기보다 많은 좋아요가 동시에 와도 워커가 연결을 얻어 모두 커밋해야 합니다.
+- 커밋 후 좋아요 수가 바뀐 피드만 알려야 합니다. (목록 캐시 갱신)
+"""
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pytest
+from sqlmodel import Session, create_engine, func, insert, select
+
+import main
+from src.main.python.Infrastructure.config import database
+from src.main.python.Infrastructure.config.database_profile import DatabaseProfile
+from src.main.python.Infrastructure.persistence.feed_like_repository import FeedLikeRepository
+from src.main.python.Infrastructure.pipeline.feed_like_pipeline import FeedLikeWritePipeline, LIKE, UNLIKE
+from src.main.python.application.service.async_feed_like import AsyncFeedLikeService
+from src.main.python.application.service.feed_like import FeedLikeService
+from src.main.python.core.dependencies.feed_like import get_feed_like_pipeline, pipeline_session
+from src.main.python.core.exception.error_message import ErrorMessage
+from src.main.python.domain.model.feed.feed import Feed
+from src.main.python.domain.model.feed.feed_like import FeedLike
+from src.test.benchmark.server import seed_sqlite
+
+
+@pytest.fixture
+def engine(tmp_path):
+    path = os.path.join(tmp_path, "likes.db")
+    seed_sqlite(path, members=3, feeds=3)
+    engine = create_engine(f"sqlite:///{path}")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def changed_feed_ids():
+    return []
+
+
+@pytest.fixture
+def pipeline(engine, changed_feed_ids):
+    pipeline = FeedLikeWritePipeline(lambda: Session(engine), window_seconds=0.05,
+                                     likes_changed=changed_feed_ids.append)
+    yield pipeline
+    pipeline.stop()
+
+
+def _likes(engine, feed_id: int) -> tuple:
+    with Session(engine) as session:
+        stored = session.exec(select(Feed.likes).where(Feed.id == feed_id)).one()
+        actual = session.exec(select(func.count()).select_from(FeedLike).where(FeedLike.feed_id == feed_id)).one()
+    return stored, actual
+
+
+def test_results_are_persisted_rows(engine, pipeline):
+    liked = pipeline.submit(LIKE, 1, 1).result(5)
+    assert liked.id is not None and (liked.feed_id, liked.member_id) == (1, 1)
+
+    # 같은 배치에서 좋아요 후 취소된 좋아요는 저장된 행이 없으므로 None
+    futures = [pipeline.submit(LIKE, 2, 1), pipeline.submit(UNLIKE, 2, 1), pipeline.submit(UNLIKE, 1, 1)]
+    assert [future.result(5) for future in futures] == [None, None, None]
+    assert _likes(engine, 1) == (0, 0) and _likes(engine, 2) == (0, 0)
+
+
+def test_concurrent_insert_does_not_fail_the_batch(engine, pipeline, monkeypatch):
+    find_existing_pairs = FeedLikeRepository.find_existing_pairs
+    conflicted = []
+
+    def find_then_conflict(self, pairs):
+        existing = find_existing_pairs(self, pairs)
+        if not conflicted:
+            # 조회 직후 다른 워커 프로세스가 (1, 2) 를 먼저 저장한 상황
+            conflicted.append(True)
+            with engine.begin() as connection:
+                connection.execute(insert(FeedLike).values(feed_id=1, member_id=2))
+        return existing
+
+    monkeypatch.setattr(FeedLikeRepository, "find_existing_pairs", find_then_conflict)
+    conflicting, other = pipeline.submit(LIKE, 1, 2), pipeline.submit(LIKE, 3, 2)
+
+    with pytest.raises(ValueError, match=ErrorMessage.FEED_LIKE_ALREADY_EXISTS.value):
+        conflicting.result(5)
+    assert other.result(5).id is not None
+    assert _likes(engine, 3) == (1, 1)
+
+
+def test_likes_changed_reports_committed_feeds(pipeline, changed_feed_ids):
+    futures = [pipeline.submit(LIKE, 1, 1), pipeline.submit(UNLIKE, 2, 1), pipeline.submit(LIKE, 99, 1)]
+    for future in futures:
+        future.exception(5)
+
+    # 좋아요 없음(2) / 피드 없음(99) 으로 실패한 이벤트의 피드는 제외
+    assert changed_feed_ids == [{1}]
+
+
+class _StalledPipeline:
+    def submit(self, action: str, feed_id: int, member_id: int) -> Future:
+        return Future()
+
+
+def test_pipeline_timeout_responds_503(client, monkeypatch):
+    monkeypatch.setattr(FeedLikeService, "_PIPELINE_TIMEOUT_SECONDS", 0.01)
+    monkeypatch.setattr(AsyncFeedLikeService, "_PIPELINE_TIMEOUT_SECONDS", 0.01)
+    main.app.dependency_overrides[get_feed_like_pipeline] = _StalledPipeline
+    try:
+        response = client.post("/feed/like/1?member_id=1")
+    finally:
+        main.app.dependency_overrides.pop(get_feed_like_pipeline)
+
+    assert response.status_code == 503
+    assert response.json() == {"error": ErrorMessage.FEED_LIKE_PENDING.value}
+
+
+REQUEST_POOL_SIZE = 4
+
+
+@pytest.fixture
+def small_pool_group_commit(client, monkeypatch):
+    # 요청 풀을 작게 (4, overflow 없음) 만든 엔진 묶음과 실제 의존성 경로의 파이프라인으로 교체
+    monkeypatch.setattr(database, "DB_PROFILE", DatabaseProfile("test", pool_size=REQUEST_POOL_SIZE, max_overflow=0,
+                                                                pool_timeout=10, pool_recycle=3600, echo=False))
+    monkeypatch.setattr(database, "FEED_LIKE_GROUP_COMMIT", True)
+    engines = database.DatabaseEngines()
+    monkeypatch.setattr(database, "_engines", engines)
+    pipeline = FeedLikeWritePipeline(pipeline_session, window_seconds=0.05)
+    main.app.dependency_overrides[get_feed_like_pipeline] = lambda: pipeline
+    yield client
+    main.app.dependency_overrides.pop(get_feed_like_pipeline)
+    pipeline.stop()
+    for engine in engines.sync_engines():
+        engine.dispose()
+
+
+def test_like_burst_larger_than_request_pool(small_pool_group_commit, monkeypatch):
+    monkeypatch.setattr(FeedLikeService, "_PIPELINE_TIMEOUT_SECONDS", 5)
+    monkeypatch.setattr(AsyncFeedLikeService, "_PIPELINE_TIMEOUT_SECONDS", 5)
+    feed_ids = range(11, 11 + REQUEST_POOL_SIZE * 2)
+    with Session(database.get_engines().engine) as session:
+        existing = set(session.exec(select(FeedLike.feed_id).where(FeedLike.feed_id.in_(feed_ids),
+                                                                  FeedLike.member_id == 1)).all())
+
+    with ThreadPoolExecutor(max_workers=len(feed_ids)) as executor:
+        statuses = list(executor.map(
+            lambda feed_id: small_pool_group_commit.post(f"/feed/like/{feed_id}?member_id=1").status_code, feed_ids
+        ))
+
+    assert statuses == [400 if feed_id in existing else 201 for feed_id in feed_ids]
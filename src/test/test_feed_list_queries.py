@@ -0,0 +1,62 @@
+"""
+피드 목록의 SQL 개수가 페이지 크기와 무관한지(N+1 없음) 확인합니다.
+
+페이지 크기를 바꿔 가며 캐시가 빈 상태에서 요청하고, 요청마다 실행된 SQL 개수가 모두 같아야 합니다.
+"""
+from typing import List
+
+from sqlmodel import Session, select
+
+from src.main.python.Infrastructure.config.database import get_engines
+from src.main.python.domain.model.feed.feed_like import FeedLike
+
+PAGE_SIZES = (1, 3, 8)
+
+
+def _query_counts(client, query_budget, reset_caches, path: str) -> List[int]:
+    counts = []
+    for limit in PAGE_SIZES:
+        reset_caches()
+        with query_budget(100) as stats:
+            response = client.get(f"{path}&limit={limit}")
+        assert response.status_code == 200
+        assert len(response.json()["feeds"]) == limit
+        counts.append(stats.count)
+    return counts
+
+
+def test_has_liked_query_count_is_constant(client, query_budget, reset_caches):
+    # 회원 1 의 피드(1, 6, 11, ...) 중 일부에 회원 1 이 좋아요 (시드에 이미 있는 좋아요는 그대로 둠)
+    for feed_id in (1, 11, 26):
+        client.post(f"/feed/like/{feed_id}?member_id=1")
+    with Session(get_engines().engine) as session:
+        liked_feed_ids = set(session.exec(select(FeedLike.feed_id).where(FeedLike.member_id == 1)).all())
+
+    for path in ("/feeds?member_id=1", "/feeds?member_id=1&cursor="):
+        counts = _query_counts(client, query_budget, reset_caches, path)
+        assert len(set(counts)) == 1, f"{path}: {dict(zip(PAGE_SIZES, counts))}"
+
+    reset_caches()
+    feeds = client.get(f"/feeds?member_id=1&limit={PAGE_SIZES[-1]}").json()["feeds"]
+    assert {feed["feed_id"] for feed in feeds if feed["has_liked"]} == {
+        feed["feed_id"] for feed in feeds if feed["feed_id"] in liked_feed_ids
+    }
+    assert any(feed["has_liked"] for feed in feeds)
+
+
+def test_author_query_count_is_constant(client, query_budget, reset_caches):
+    # 작성자(회원 5명)가 섞인 전체 목록에서도 작성자 조회가 피드 수만큼 늘지 않아야 함
+    for path in ("/feeds?offset=0", "/feeds?cursor=", "/feeds?feed_type=food&offset=0"):
+        counts = _query_counts(client, query_budget, reset_caches, path)
+        assert len(set(counts)) == 1, f"{path}: {dict(zip(PAGE_SIZES, counts))}"
+
+    reset_caches()
+    feeds = client.get(f"/feeds?limit={PAGE_SIZES[-1]}").json()["feeds"]
+    assert len({feed["author_nickname"] for feed in feeds}) > 1
+
+
+def test_feed_detail_loads_author_in_one_query(client, query_budget):
+    with query_budget(1):
+        response = client.get("/feed/7")
+    assert response.status_code == 200
+    assert response.json()["author_nickname"] == "bench1"
@@ -0,0 +1,47 @@
+"""
+피드 목록 페이지 캐시 갱신 검사
+
+- 좋아요/취소가 커밋되면 그 피드가 포함된 페이지만 비워 다음 조회에 바뀐 좋아요 수가 보여야 합니다.
+- 조회수 버퍼가 반영되면 그 피드가 포함된 페이지만 비워야 합니다.
+"""
+from sqlmodel import Session, select
+
+from src.main.python.Infrastructure.config.database import get_engines
+from src.main.python.core.background.jobs import flush_feed_views
+from src.main.python.core.dependencies.feed_cache import get_feed_page_cache
+from src.main.python.domain.model.feed.feed_like import FeedLike
+
+
+def _item(client, path: str, feed_id: int) -> dict:
+    return next(item for item in client.get(path).json()["feeds"] if item["feed_id"] == feed_id)
+
+
+def _liker_and_non_liker(feed_id: int) -> tuple:
+    with Session(get_engines().engine) as session:
+        liked = set(session.exec(select(FeedLike.member_id).where(FeedLike.feed_id == feed_id)).all())
+    return next(iter(liked)), next(member_id for member_id in range(1, 6) if member_id not in liked)
+
+
+def test_like_and_unlike_discard_only_pages_with_the_feed(client):
+    page = client.get("/feeds?limit=4").json()["feeds"]
+    other_page = client.get("/feeds?offset=4&limit=4").json()["feeds"]
+    feed_id = next(item["feed_id"] for item in page
+                   if 0 < item["likes"] < 5 and item["feed_id"] not in {other["feed_id"] for other in other_page})
+    likes = next(item["likes"] for item in page if item["feed_id"] == feed_id)
+    liker, non_liker = _liker_and_non_liker(feed_id)
+    assert get_feed_page_cache().stats()["size"] == 2
+
+    assert client.post(f"/feed/like/{feed_id}?member_id={non_liker}").status_code == 201
+    assert get_feed_page_cache().stats()["size"] == 1
+    assert _item(client, "/feeds?limit=4", feed_id)["likes"] == likes + 1
+
+    assert client.delete(f"/feed/like/{feed_id}?member_id={liker}").status_code == 200
+    assert _item(client, "/feeds?limit=4", feed_id)["likes"] == likes
+
+
+def test_flushed_views_discard_pages_with_the_feed(client):
+    feed_id = client.get("/feeds?limit=4").json()["feeds"][0]["feed_id"]
+    views = client.get(f"/feed/{feed_id}").json()["views"]
+
+    flush_feed_views()
+    assert _item(client, "/feeds?limit=4", feed_id)["views"] == views
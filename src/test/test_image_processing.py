@@ -0,0 +1,60 @@
+"""
+이미지 처리 풀 제한 시간 초과 검사
+
+- 대기열에 있던 작업은 취소되어 실행되지 않고, 입력 정리(cleanup)는 바로 실행되어야 합니다.
+- 이미 실행 중인 작업은 끝날 때까지 입력을 지우지 않고, 끝난 뒤 입력 정리와 결과 삭제(discard)를 실행해야 합니다.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.main.python.Infrastructure.storage.image_processing import ImageProcessingPool
+from src.main.python.domain.storage.exceptions import ImageProcessingBusyError
+
+
+@pytest.fixture
+def pool():
+    pool = ImageProcessingPool(workers=1, max_pending=4, timeout=0.05, retry_after=1)
+    # 워커 프로세스 대신 스레드 하나로 실행 순서를 제어
+    pool._executor = ThreadPoolExecutor(max_workers=1)
+    yield pool
+    pool.shutdown()
+
+
+def test_queued_job_is_cancelled_on_timeout(pool):
+    blocker = threading.Event()
+    pool._executor.submit(blocker.wait)
+    ran, events = [], []
+    try:
+        with pytest.raises(ImageProcessingBusyError):
+            pool.run("test", ran.append, "job", cleanup=lambda: events.append("cleanup"),
+                     discard=lambda: events.append("discard"))
+        assert events == ["cleanup"]
+    finally:
+        blocker.set()
+
+    pool._executor.submit(lambda: None).result(5)
+    assert ran == [] and events == ["cleanup"]
+    assert pool.stats()["pending"] == 0
+
+
+def test_running_job_is_cleaned_up_after_it_finishes(pool):
+    started, finish = threading.Event(), threading.Event()
+    events = []
+    done = threading.Event()
+
+    def job():
+        started.set()
+        finish.wait()
+        events.append("finished")
+
+    with pytest.raises(ImageProcessingBusyError):
+        pool.run("test", job, cleanup=lambda: events.append("cleanup"),
+                 discard=lambda: (events.append("discard"), done.set()))
+    assert started.is_set() and events == []
+
+    finish.set()
+    assert done.wait(5)
+    assert events == ["finished", "cleanup", "discard"]
+    assert pool.stats()["pending"] == 0
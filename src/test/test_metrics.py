@@ -0,0 +1,31 @@
+"""
+/metrics 노출 검사
+
+- Prometheus 파서로 읽을 수 있는 형식이어야 합니다.
+- 요청 카운터/히스토그램은 라우트 템플릿 라벨로, 풀/캐시 현황은 수집 시점 gauge 로 노출해야 합니다.
+"""
+from prometheus_client.parser import text_string_to_metric_families
+
+
+def _samples(client) -> dict:
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    return {
+        family.name: family.samples for family in text_string_to_metric_families(response.text)
+    }
+
+
+def test_metrics_expose_requests_and_scrape_time_gauges(client):
+    assert client.get("/feed/3").status_code == 200
+    families = _samples(client)
+
+    requests = [sample for sample in families["petstagram_http_requests"]
+                if sample.name == "petstagram_http_requests_total"
+                and sample.labels == {"route": "/feed/{feed_id}", "method": "GET", "status": "2xx"}]
+    assert requests and requests[0].value >= 1
+    assert any(sample.labels.get("le") == "+Inf" for sample in families["petstagram_http_request_duration_seconds"])
+    assert {sample.labels["state"] for sample in families["petstagram_db_pool_connections"]} == {"checked_out", "capacity"}
+    assert {sample.labels["stat"] for sample in families["petstagram_feed_page_cache"]} >= {"hits", "misses", "size"}
+    assert {sample.labels["state"] for sample in families["petstagram_image_processing_queue"]} == {
+        "pending", "capacity", "workers"}
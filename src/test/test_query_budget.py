@@ -0,0 +1,54 @@
+"""
+피드 조회 엔드포인트의 요청당 SQL 개수 예산
+
+캐시가 비어 있는 첫 요청 기준입니다. (목록 페이지 + 개수 + 좋아요 여부)
+"""
+import pytest
+
+from src.main.python.Infrastructure.monitoring.query_stats import QueryBudgetExceeded
+
+
+def test_feed_list_budget(client, query_budget):
+    with query_budget(2):
+        response = client.get("/feeds?limit=10")
+    assert response.status_code == 200
+    assert len(response.json()["feeds"]) == 10
+
+
+def test_feed_list_cached_page_runs_no_query(client, query_budget):
+    client.get("/feeds?limit=10")
+    with query_budget(0):
+        response = client.get("/feeds?limit=10")
+    assert response.status_code == 200
+
+
+def test_feed_list_cursor_budget(client, query_budget):
+    with query_budget(1):
+        response = client.get("/feeds?limit=10&cursor=")
+    assert response.status_code == 200
+    assert response.json()["next_cursor"] is not None
+
+
+def test_feed_detail_budget(client, query_budget):
+    with query_budget(1):
+        assert client.get("/feed/3").status_code == 200
+    with query_budget(2):
+        assert client.get("/feed/3?member_id=1").status_code == 200
+
+
+def test_member_feed_list_budget(client, query_budget):
+    with query_budget(3):
+        response = client.get("/feeds?limit=10&member_id=2")
+    assert response.status_code == 200
+    assert {feed["author_nickname"] for feed in response.json()["feeds"]} == {"bench1"}
+
+    with query_budget(3):
+        assert client.get("/feeds?limit=10&member_id=2&feed_type=food").status_code == 200
+    with query_budget(2):
+        assert client.get("/feeds?limit=10&member_id=2&cursor=").status_code == 200
+
+
+def test_query_budget_fails_when_exceeded(client, query_budget):
+    with pytest.raises(QueryBudgetExceeded):
+        with query_budget(1):
+            client.get("/feeds?limit=10&member_id=3")
@@ -0,0 +1,128 @@
+"""
+핫 쿼리 실행 계획(EXPLAIN) 점검
+
+- 인덱스가 없는 기존 스키마를 만든 뒤 마이그레이션을 적용하고, 각 리포지토리 메서드가 실제로 실행하는
+  SQL 을 가로채 EXPLAIN 으로 실행 계획을 확인합니다.
+- 핫 쿼리가 테이블 전체 스캔(full table scan)을 하면 실패합니다.
+- 기본값은 임베디드 SQLite(in-memory) 이며, QUERY_PLAN_DB_URL 로 MySQL 등 실제 DB 를 지정할 수 있습니다.
+  (지정한 DB 에는 마이그레이션만 적용하고 데이터는 만들지 않음)
+"""
+import os
+import re
+from datetime import datetime
+from typing import Callable, List, Tuple
+
+import pytest
+from sqlalchemy import event, inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine
+
+from src.main.python.Infrastructure.migration.runner import migrate
+from src.main.python.Infrastructure.persistence.feed_like_repository import FeedLikeRepository
+from src.main.python.Infrastructure.persistence.feed_repository import FeedRepository
+from src.main.python.Infrastructure.persistence.member_repository import MemberRepository
+from src.main.python.domain.model.feed.feed import Feed
+from src.main.python.domain.model.feed.feed_like import FeedLike
+from src.main.python.domain.model.user.member import Member
+
+HOT_TABLES = ("feeds", "members", "feed_likes")
+
+HOT_QUERIES: List[Tuple[str, Callable[[Session], object]]] = [
+    ("FeedRepository.find_by_id", lambda db: FeedRepository(db).find_by_id(1)),
+    ("FeedRepository.paginate", lambda db: FeedRepository(db).paginate(0, 4)),
+    ("FeedRepository.paginate(feed_type)", lambda db: FeedRepository(db).paginate(0, 4, "food")),
+    ("FeedRepository.paginate(member_id)", lambda db: FeedRepository(db).paginate(0, 4, None, 1)),
+    ("FeedRepository.paginate_by_cursor", lambda db: FeedRepository(db).paginate_by_cursor(datetime(2025, 1, 1), 10, 5)),
+    ("FeedRepository.paginate_by_cursor(feed_type)",
+     lambda db: FeedRepository(db).paginate_by_cursor(datetime(2025, 1, 1), 10, 5, "care")),
+    ("FeedRepository.count", lambda db: FeedRepository(db).count(None, None)),
+    ("FeedRepository.count(feed_type)", lambda db: FeedRepository(db).count("food", None)),
+    ("FeedRepository.count(member_id)", lambda db: FeedRepository(db).count(None, 1)),
+    ("MemberRepository.find_by_id", lambda db: MemberRepository(db).find_by_id(1)),
+    ("MemberRepository.find_by_email", lambda db: MemberRepository(db).find_by_email("member1@example.com")),
+    ("MemberRepository.find_by_nickname", lambda db: MemberRepository(db).find_by_nickname("member1")),
+    ("FeedLikeRepository.exists_by_feed_id_and_member_id",
+     lambda db: FeedLikeRepository(db).exists_by_feed_id_and_member_id(1, 1)),
+    ("FeedLikeRepository.find_liked_feed_ids", lambda db: FeedLikeRepository(db).find_liked_feed_ids([1, 2, 3], 1)),
+    ("FeedLikeRepository.count_by_feed_ids", lambda db: FeedLikeRepository(db).count_by_feed_ids([1, 2, 3])),
+    ("FeedLikeRepository.find_existing_pairs", lambda db: FeedLikeRepository(db).find_existing_pairs([(1, 1), (2, 1)])),
+]
+
+_SQLITE_FULL_SCAN = re.compile(r"\bSCAN (%s)\b(?! USING (COVERING )?INDEX)" % "|".join(HOT_TABLES))
+
+
+def _create_legacy_schema(engine: Engine):
+    # 마이그레이션 이전 상태를 재현하기 위해 선언된 보조 인덱스를 지운 스키마를 만든다
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        for table in HOT_TABLES:
+            for index in inspect(connection).get_indexes(table):
+                if not index.get("unique") and index["name"].startswith("ix_"):
+                    connection.execute(text(f"DROP INDEX {index['name']}"))
+
+
+def _seed(engine: Engine):
+    with Session(engine) as session:
+        session.add_all([
+            Member(email=f"member{i}@example.com", nickname=f"member{i}", password="", role="MEMBER")
+            for i in range(1, 21)
+        ])
+        session.commit()
+        session.add_all([
+            Feed(member_id=i % 20 + 1, feed_type="FOOD" if i % 2 else "CARE", images=[f"/{i}.jpeg"], content="c")
+            for i in range(200)
+        ])
+        session.commit()
+        session.add_all([FeedLike(feed_id=i % 200 + 1, member_id=i // 200 + 1) for i in range(400)])
+        session.commit()
+    with engine.begin() as connection:
+        connection.execute(text("ANALYZE"))
+
+
+def _full_scans(engine: Engine, statement: str, parameters) -> List[str]:
+    with engine.connect() as connection:
+        if engine.dialect.name == "sqlite":
+            rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+            return [row[-1] for row in rows if _SQLITE_FULL_SCAN.search(row[-1])]
+        rows = connection.exec_driver_sql(f"EXPLAIN {statement}", parameters).mappings().all()
+        return [f"{row['table']}: type=ALL" for row in rows if row["table"] in HOT_TABLES and row["type"] == "ALL"]
+
+
+@pytest.fixture(scope="module")
+def plan_engine():
+    url = os.getenv("QUERY_PLAN_DB_URL")
+    if url:
+        engine = create_engine(url)
+        migrate(engine)
+    else:
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        _create_legacy_schema(engine)
+        migrate(engine)
+        _seed(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.parametrize("query", [query for _, query in HOT_QUERIES], ids=[name for name, _ in HOT_QUERIES])
+def test_hot_query_uses_index(plan_engine, query):
+    captured: List[Tuple[str, object]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(plan_engine, "before_cursor_execute", capture)
+    try:
+        with Session(plan_engine) as session:
+            query(session)
+    finally:
+        event.remove(plan_engine, "before_cursor_execute", capture)
+
+    assert captured, "no SELECT statement was captured"
+    full_scans = [
+        f"{detail}\n    {' '.join(statement.split())}"
+        for statement, parameters in captured
+        for detail in _full_scans(plan_engine, statement, parameters)
+    ]
+    assert not full_scans, "full table scan:\n" + "\n".join(full_scans)
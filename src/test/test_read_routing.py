@@ -0,0 +1,83 @@
+"""
+읽기 라우팅 검사
+
+- read-your-writes: 요청 경로/쿼리가 아닌 실제로 쓴 행의 회원으로 구간이 시작되어야 합니다.
+- 복제본 제외: 복제본 연결에서 난 오류만 복제본을 제외하고 primary 로 재시도해야 합니다.
+"""
+import io
+import os
+
+import pytest
+from PIL import Image
+from sqlalchemy import Column, Integer, MetaData, Table, exc, select, text
+from sqlmodel import create_engine
+
+from src.main.python.Infrastructure.config import database
+from src.main.python.Infrastructure.config.replica import ReadYourWrites, ReplicaSet, RoutingSession
+
+
+@pytest.fixture
+def read_your_writes(monkeypatch):
+    tracker = ReadYourWrites(window_seconds=60)
+    monkeypatch.setattr(database, "read_your_writes", tracker)
+    return tracker
+
+
+def _upload(client) -> str:
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 64), "red").save(buffer, "PNG")
+    return client.post("/file/upload-file", files={"file": ("a.png", buffer.getvalue(), "image/png")}).json()["temp_path"]
+
+
+def test_feed_writes_mark_the_written_member(client, read_your_writes):
+    # member_id 가 본문에만 있는 등록, member_id 가 요청에 없는 수정/삭제 (피드 3 → 회원 3, 피드 5 → 회원 5)
+    response = client.post("/feed", json={"member_id": 2, "subject": "s", "feed_type": "food",
+                                           "images": [_upload(client)], "content": "c"})
+    assert response.status_code == 201
+    assert client.put("/feed/3", json={"subject": "s", "feed_type": "food", "images": ["/bench/feed/2.jpeg"],
+                                       "content": "updated"}).status_code == 200
+    assert client.delete("/feed/5").status_code == 200
+
+    assert [read_your_writes.is_recent(member_id) for member_id in ("2", "3", "5", "1")] == [True, True, True, False]
+
+
+def test_failed_write_does_not_mark(client, read_your_writes):
+    assert client.patch("/member/2", json={"nickname": "bench0"}).status_code == 400
+    assert not read_your_writes.is_recent("2")
+
+
+_metadata = MetaData()
+_items = Table("items", _metadata, Column("id", Integer, primary_key=True))
+
+
+@pytest.fixture
+def engines(tmp_path):
+    primary = create_engine(f"sqlite:///{os.path.join(tmp_path, 'primary.db')}")
+    replica = create_engine(f"sqlite:///{os.path.join(tmp_path, 'replica.db')}")
+    _metadata.create_all(primary)
+    with primary.begin() as connection:
+        connection.execute(_items.insert().values(id=1))
+    yield primary, replica
+    primary.dispose()
+    replica.dispose()
+
+
+def test_primary_error_does_not_eject_replica(engines):
+    primary, replica = engines
+    _metadata.create_all(replica)
+    replica_set = ReplicaSet([replica])
+    with RoutingSession(primary, replica_set) as session:
+        session.execute(select(_items.c.id)).all()
+        # 텍스트 SQL 은 primary 로 감 (SQLite 의 "no such table" 은 OperationalError)
+        with pytest.raises(exc.OperationalError):
+            session.execute(text("SELECT * FROM missing"))
+    assert replica_set.stats()[0]["healthy"]
+
+
+def test_replica_error_ejects_and_retries_on_primary(engines):
+    primary, replica = engines
+    replica_set = ReplicaSet([replica])
+    with RoutingSession(primary, replica_set) as session:
+        # 복제본에는 테이블이 없어 실패 → 복제본 제외 후 primary 에서 재시도
+        assert session.execute(select(_items.c.id)).scalars().all() == [1]
+    assert not replica_set.stats()[0]["healthy"]
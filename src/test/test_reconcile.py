@@ -0,0 +1,77 @@
+"""
+카운터 재계산 검사
+
+- 재계산 도중(개수를 센 뒤 쓰기 전)에 들어온 좋아요를 덮어쓰지 않아야 합니다.
+- 피드 개수 캐시도 COUNT 하는 동안 반영된 등록/삭제(adjust)를 덮어쓰지 않아야 합니다.
+"""
+from sqlmodel import Session, delete, func, insert, select, update
+
+from src.main.python.Infrastructure.cache.feed_count import FeedCountCache
+from src.main.python.Infrastructure.config.database import get_engines
+from src.main.python.Infrastructure.persistence.feed_like_repository import FeedLikeRepository
+from src.main.python.core.background.reconcile_feed_likes import reconcile_feed_likes
+from src.main.python.domain.model.feed.feed import Feed
+from src.main.python.domain.model.feed.feed_like import FeedLike
+
+
+def _likes(feed_id: int) -> tuple:
+    with Session(get_engines().engine) as session:
+        stored = session.exec(select(Feed.likes).where(Feed.id == feed_id)).one()
+        actual = session.exec(select(func.count()).select_from(FeedLike).where(FeedLike.feed_id == feed_id)).one()
+    return stored, actual
+
+
+def test_reconcile_feed_likes_keeps_concurrent_likes(client, monkeypatch):
+    engine = get_engines().engine
+    with engine.begin() as connection:
+        connection.execute(delete(FeedLike).where(FeedLike.feed_id == 1, FeedLike.member_id == 1))
+        connection.execute(update(Feed).where(Feed.id == 1).values(likes=99))
+    expected = _likes(1)[1] + 1
+
+    count_by_feed_ids = FeedLikeRepository.count_by_feed_ids
+    liked_during_count = []
+
+    def count_then_like(self, feed_ids):
+        counts = count_by_feed_ids(self, feed_ids)
+        if not liked_during_count:
+            # 개수를 센 직후 다른 요청의 좋아요가 커밋된 상황
+            liked_during_count.append(True)
+            with engine.begin() as connection:
+                connection.execute(insert(FeedLike).values(feed_id=1, member_id=1))
+                connection.execute(update(Feed).where(Feed.id == 1).values(likes=Feed.likes + 1))
+        return counts
+
+    monkeypatch.setattr(FeedLikeRepository, "count_by_feed_ids", count_then_like)
+    report = reconcile_feed_likes(batch_size=10)
+
+    assert report["drifted"] >= 1
+    stored, actual = _likes(1)
+    assert stored == actual == expected
+
+
+def test_reconcile_feed_likes_dry_run_does_not_write(client):
+    with get_engines().engine.begin() as connection:
+        connection.execute(update(Feed).where(Feed.id == 2).values(likes=99))
+
+    assert reconcile_feed_likes(batch_size=10, dry_run=True)["drifted"] == 1
+    assert _likes(2)[0] == 99
+
+
+def test_feed_count_reconcile_skips_keys_adjusted_during_count():
+    cache = FeedCountCache()
+    cache.put(None, None, 10)
+    cache.put("food", None, 3)
+
+    def counter(feed_type, member_id):
+        if feed_type is None:
+            # COUNT 는 등록 커밋 전 값(10)을 읽었고, 그 사이 등록이 커밋되어 adjust 됨
+            cache.adjust("food", 1, 1)
+            return 10
+        return 6
+
+    cache.reconcile(counter)
+    assert cache.get(None, None) == 11
+
+    # 다음 reconcile 에서는 동시 변경이 없으므로 실제 값으로 맞춤
+    assert cache.reconcile(lambda feed_type, member_id: 12 if feed_type is None else 4) == 2
+    assert (cache.get(None, None), cache.get("food", None)) == (12, 4)
@@ -0,0 +1,98 @@
+"""
+요청 단위 작업 단위(unit of work) 검사
+
+- 조회 요청은 커밋 0회, 쓰기 요청은 정확히 1회, 실패한 요청은 0회(롤백)여야 합니다.
+- 캐시 갱신과 이미지 참조 반납은 커밋에 성공한 뒤에만 실행되어야 합니다.
+"""
+import pytest
+from sqlalchemy import event
+from sqlmodel import Session
+
+from src.main.python.Infrastructure.config.database import get_engines
+from src.main.python.core.dependencies.feed_cache import get_feed_count_cache, get_feed_page_cache
+from src.main.python.core.dependencies.file import get_file_service
+
+# (이름, method, path, body, 기대 status, 기대 커밋 횟수), 순서대로 실행
+CASES = [
+    ("feed list", "GET", "/feeds?limit=4", None, 200, 0),
+    ("feed list (cursor)", "GET", "/feeds?limit=4&cursor=", None, 200, 0),
+    ("feed detail", "GET", "/feed/2?member_id=1", None, 200, 0),
+    ("member detail", "GET", "/member/1", None, 200, 0),
+    ("like", "POST", "/feed/like/40?member_id=5", None, 201, 1),
+    ("like (duplicate)", "POST", "/feed/like/40?member_id=5", None, 400, 0),
+    ("unlike", "DELETE", "/feed/like/40?member_id=5", None, 200, 1),
+    ("unlike (missing)", "DELETE", "/feed/like/40?member_id=5", None, 400, 0),
+    ("member update", "PATCH", "/member/1", {"nickname": "renamed"}, 200, 1),
+    ("member update (duplicate)", "PATCH", "/member/2", {"nickname": "renamed"}, 400, 0),
+    ("feed update", "PUT", "/feed/3",
+     {"subject": "s", "content": "updated", "feed_type": "food", "images": ["/bench/feed/2.jpeg"]}, 200, 1),
+    ("feed delete", "DELETE", "/feed/4", None, 200, 1),
+    ("feed delete (missing)", "DELETE", "/feed/4", None, 400, 0),
+]
+
+
+@pytest.fixture
+def commits():
+    counter = [0]
+
+    def count_commit(connection):
+        counter[0] += 1
+
+    # DB_ASYNC=true 이면 비동기 엔진(sync_engine)에서 커밋됨
+    engines = [engine.sync_engine if hasattr(engine, "sync_engine") else engine
+               for engine in (get_engines().engine, get_engines().async_engine) if engine is not None]
+    for engine in engines:
+        event.listen(engine, "commit", count_commit)
+    yield counter
+    for engine in engines:
+        event.remove(engine, "commit", count_commit)
+
+
+def test_commits_per_request(client, commits):
+    mismatches = []
+    for name, method, path, body, expected_status, expected_commits in CASES:
+        commits[0] = 0
+        response = client.request(method, path, json=body)
+        if (response.status_code, commits[0]) != (expected_status, expected_commits):
+            mismatches.append(f"{name}: status {response.status_code}, commits {commits[0]}")
+    assert not mismatches
+
+
+@pytest.fixture
+def released_images(monkeypatch):
+    released = []
+    monkeypatch.setattr(get_file_service(), "release", lambda paths: released.extend(paths))
+    return released
+
+
+@pytest.fixture
+def failing_commit():
+    def fail(session):
+        raise RuntimeError("commit failed")
+
+    event.listen(Session, "before_commit", fail)
+    yield
+    event.remove(Session, "before_commit", fail)
+
+
+def test_side_effects_are_skipped_when_commit_fails(client, released_images, failing_commit):
+    total = client.get("/feeds?limit=4").json()["total"]
+    cached_pages = get_feed_page_cache().stats()["size"]
+
+    with pytest.raises(RuntimeError):
+        client.delete("/feed/4")
+
+    assert get_feed_count_cache().get(None, None) == total
+    assert get_feed_page_cache().stats()["size"] == cached_pages
+    assert released_images == []
+
+
+def test_side_effects_run_after_commit(client, released_images):
+    total = client.get("/feeds?limit=4").json()["total"]
+
+    assert client.delete("/feed/4").status_code == 200
+
+    assert get_feed_count_cache().get(None, None) == total - 1
+    assert get_feed_page_cache().stats()["size"] == 0
+    assert released_images == ["/bench/feed/3.jpeg"]
+    assert client.get("/feeds?limit=4").json()["total"] == total - 1